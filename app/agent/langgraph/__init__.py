@@ -1,3 +1,4 @@
 from .graph import Graph
+from .registry import GraphRegistry, UnknownAgentError
 
-__all__ = ["Graph"]
+__all__ = ["Graph", "GraphRegistry", "UnknownAgentError"]
@@ -0,0 +1,8 @@
+from app.agent.langgraph.demo import DemoGraph
+from app.agent.langgraph.graph import Graph
+
+# Agent id -> graph class served under that id. ``Run.agent_id`` and
+# ``FeedbackRequest.agent_id`` are resolved against this mapping.
+AGENTS: dict[str, type[Graph]] = {
+    "demo": DemoGraph,
+}
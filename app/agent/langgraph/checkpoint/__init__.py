@@ -1,11 +1,36 @@
-from .base import BaseCheckpointer
+from .base import BaseCheckpointer, BufferedCheckpointSaver
+from .bounded_memory import BoundedInMemorySaver
 from .factory import CheckpointerFactory
+from .fork import CheckpointForker, afork
 from .memory import MemoryCheckpointer
-from .postgres import PostgresCheckpointer
+from .postgres import PostgresCheckpointer, ProjectingPostgresSaver
+from .projection import CheckpointProjection, ProjectionReader, aget_projection
+from .retention import PostgresCheckpointCompactor, RetentionPolicy
+from .serde import CompressedSerializer
+from .sqlite import SQLiteCheckpointer, SQLiteSaver
+from .tiered import TieredCheckpointer, TieredSaver
+from .write_behind import WriteBehindCheckpointer, WriteBehindSaver
 
 __all__ = [
     "BaseCheckpointer",
+    "BoundedInMemorySaver",
+    "BufferedCheckpointSaver",
+    "CheckpointForker",
+    "CheckpointProjection",
     "CheckpointerFactory",
+    "CompressedSerializer",
     "MemoryCheckpointer",
+    "PostgresCheckpointCompactor",
     "PostgresCheckpointer",
+    "ProjectingPostgresSaver",
+    "ProjectionReader",
+    "RetentionPolicy",
+    "SQLiteCheckpointer",
+    "SQLiteSaver",
+    "TieredCheckpointer",
+    "TieredSaver",
+    "WriteBehindCheckpointer",
+    "WriteBehindSaver",
+    "afork",
+    "aget_projection",
 ]
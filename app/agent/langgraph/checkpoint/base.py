@@ -2,6 +2,8 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any
 
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,3 +24,16 @@ class BaseCheckpointer(ABC):
     async def get_checkpointer(self) -> Any:
         """Get the actual checkpointer instance."""
         pass
+
+
+class BufferedCheckpointSaver(BaseCheckpointSaver[str]):
+    """Checkpoint saver that may hold writes in memory until they are flushed.
+
+    Callers that need a thread's checkpoints to be durable, such as the end
+    of a run, call ``aflush``.
+    """
+
+    @abstractmethod
+    async def aflush(self, thread_id: str | None = None) -> None:
+        """Persist the buffered writes of *thread_id*, or of every thread."""
+        pass
@@ -0,0 +1,383 @@
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from prometheus_client import Counter, Gauge
+
+from app.agent.langgraph.checkpoint.fork import CheckpointForker, fork_metadata
+from app.agent.langgraph.checkpoint.projection import (
+    MESSAGES_CHANNEL,
+    CheckpointProjection,
+    ProjectionReader,
+    load_messages_page,
+)
+
+logger = logging.getLogger(__name__)
+
+MEMORY_CHECKPOINT_THREADS = Gauge(
+    "memory_checkpoint_threads", "Threads held by the memory checkpointer."
+)
+MEMORY_CHECKPOINT_BYTES = Gauge(
+    "memory_checkpoint_bytes",
+    "Approximate serialized size of everything held by the memory checkpointer.",
+)
+MEMORY_CHECKPOINT_EVICTIONS_TOTAL = Counter(
+    "memory_checkpoint_evictions_total",
+    "Threads evicted from the memory checkpointer.",
+    ["reason"],
+)
+
+
+def _size(typed: tuple[str, bytes]) -> int:
+    return len(typed[1])
+
+
+class _ThreadUsage:
+    __slots__ = ("bytes", "touched", "blobs", "versions")
+
+    def __init__(self) -> None:
+        self.bytes = 0
+        self.touched = time.monotonic()
+        self.blobs: set[tuple[Any, ...]] = set()
+        self.versions: dict[tuple[str, str], ChannelVersions] = {}
+
+
+class BoundedInMemorySaver(InMemorySaver, ProjectionReader, CheckpointForker):
+    """:class:`InMemorySaver` that forgets old checkpoints and idle threads.
+
+    Every limit is optional (``None`` or ``0`` disables it):
+
+    * *max_checkpoints_per_thread* keeps the newest checkpoints of each
+      namespace and drops older ones with their writes and unreferenced blobs;
+    * *max_threads* and *max_bytes* evict least recently used threads, the
+      size being the sum of the serialized checkpoints, blobs and writes;
+    * *idle_ttl* evicts threads not read or written for that many seconds.
+
+    Limits are enforced on every write, so a thread is never evicted in the
+    middle of its own step, and by ``prune``, which
+    :class:`MemoryCheckpointer` calls periodically so idle threads expire
+    without writes too.
+
+    A forked thread points at the same serialized blobs as its source. They
+    are counted against *max_bytes* for every thread that holds them, so
+    shared blobs make eviction start early rather than late.
+    """
+
+    def __init__(
+        self,
+        max_threads: int | None = None,
+        max_checkpoints_per_thread: int | None = None,
+        idle_ttl: float | None = None,
+        max_bytes: int | None = None,
+        serde: SerializerProtocol | None = None,
+    ):
+        super().__init__(serde=serde)
+        self.max_threads = max_threads or None
+        self.max_checkpoints_per_thread = max_checkpoints_per_thread or None
+        self.idle_ttl = idle_ttl or None
+        self.max_bytes = max_bytes or None
+        self._usage: OrderedDict[str, _ThreadUsage] = OrderedDict()
+        self._bytes = 0
+
+    @property
+    def thread_count(self) -> int:
+        return len(self._usage)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        thread_id = config["configurable"]["thread_id"]
+        # ``storage`` is a defaultdict; looking up unknown threads would
+        # leave empty entries behind that no limit accounts for.
+        if thread_id not in self.storage:
+            return None
+        self._touch(thread_id)
+        return super().get_tuple(config)
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        if config is not None:
+            thread_id = config["configurable"]["thread_id"]
+            if thread_id not in self.storage:
+                return iter(())
+            self._touch(thread_id)
+        return super().list(config, filter=filter, before=before, limit=limit)
+
+    async def aget_projection(
+        self,
+        config: RunnableConfig,
+        channels: Iterable[str],
+        limit: int | None = None,
+        skip: int = 0,
+    ) -> CheckpointProjection | None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        if thread_id not in self.storage:
+            return None
+        checkpoints = self.storage[thread_id].get(checkpoint_ns)
+        if not checkpoints:
+            return None
+        checkpoint_id = get_checkpoint_id(config) or max(checkpoints)
+        if (saved := checkpoints.get(checkpoint_id)) is None:
+            return None
+        self._touch(thread_id)
+
+        # Channel values live in ``blobs``; the checkpoint itself is small.
+        versions = self.serde.loads_typed(saved[0])["channel_versions"]
+        values: dict[str, Any] = {}
+        message_count = 0
+        for channel in channels:
+            if channel not in versions:
+                continue
+            blob = self.blobs.get(
+                (thread_id, checkpoint_ns, channel, versions[channel])
+            )
+            if blob is None or blob[0] == "empty":
+                continue
+            if channel == MESSAGES_CHANNEL:
+                values[channel], message_count = load_messages_page(
+                    self.serde, blob, limit, skip
+                )
+            else:
+                values[channel] = self.serde.loads_typed(blob)
+
+        return CheckpointProjection(
+            {
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            values,
+            message_count,
+        )
+
+    def fork(self, config: RunnableConfig, thread_id: str) -> RunnableConfig | None:
+        source = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        if source not in self.storage:
+            return None
+        checkpoints = self.storage[source].get(checkpoint_ns)
+        if not checkpoints:
+            return None
+        checkpoint_id = get_checkpoint_id(config) or max(checkpoints)
+        if (saved := checkpoints.get(checkpoint_id)) is None:
+            return None
+        self._touch(source)
+
+        checkpoint, metadata, _ = saved
+        metadata = self.serde.dumps_typed(
+            fork_metadata(
+                self.serde.loads_typed(metadata),
+                {
+                    "configurable": {
+                        "thread_id": source,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": checkpoint_id,
+                    }
+                },
+            )
+        )
+        versions = self.serde.loads_typed(checkpoint)["channel_versions"]
+
+        usage = self._touch(thread_id)
+        self.storage[thread_id][checkpoint_ns][checkpoint_id] = (
+            checkpoint,
+            metadata,
+            None,
+        )
+        added = _size(checkpoint) + _size(metadata)
+        for channel, version in versions.items():
+            blob = self.blobs.get((source, checkpoint_ns, channel, version))
+            if blob is None:
+                continue
+            # The serialized value is shared with the source, not copied.
+            key = (thread_id, checkpoint_ns, channel, version)
+            self.blobs[key] = blob
+            if key not in usage.blobs:
+                usage.blobs.add(key)
+                added += _size(blob)
+        usage.versions[(checkpoint_ns, checkpoint_id)] = dict(versions)
+        self._grow(usage, added)
+
+        self._trim(thread_id, checkpoint_ns, usage)
+        self._enforce_limits(keep=thread_id)
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id,
+            }
+        }
+
+    async def afork(
+        self, config: RunnableConfig, thread_id: str
+    ) -> RunnableConfig | None:
+        return self.fork(config, thread_id)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        next_config = super().put(config, checkpoint, metadata, new_versions)
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+
+        usage = self._touch(thread_id)
+        saved = self.storage[thread_id][checkpoint_ns][checkpoint["id"]]
+        added = _size(saved[0]) + _size(saved[1])
+        for channel, version in new_versions.items():
+            key = (thread_id, checkpoint_ns, channel, version)
+            if key not in usage.blobs:
+                usage.blobs.add(key)
+                added += _size(self.blobs[key])
+        usage.versions[(checkpoint_ns, checkpoint["id"])] = dict(
+            checkpoint["channel_versions"]
+        )
+        self._grow(usage, added)
+
+        self._trim(thread_id, checkpoint_ns, usage)
+        self._enforce_limits(keep=thread_id)
+        return next_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        key = (
+            thread_id,
+            configurable.get("checkpoint_ns", ""),
+            configurable["checkpoint_id"],
+        )
+        before = self._writes_size(key)
+        super().put_writes(config, writes, task_id, task_path)
+        self._grow(self._touch(thread_id), self._writes_size(key) - before)
+
+    def delete_thread(self, thread_id: str) -> None:
+        self._drop(thread_id)
+
+    def prune(self) -> None:
+        """Evict idle threads and enforce every limit without a write."""
+        self._enforce_limits()
+
+    def _touch(self, thread_id: str) -> _ThreadUsage:
+        usage = self._usage.get(thread_id)
+        if usage is None:
+            usage = self._usage[thread_id] = _ThreadUsage()
+            MEMORY_CHECKPOINT_THREADS.set(len(self._usage))
+        else:
+            usage.touched = time.monotonic()
+            self._usage.move_to_end(thread_id)
+        return usage
+
+    def _grow(self, usage: _ThreadUsage, delta: int) -> None:
+        usage.bytes += delta
+        self._bytes += delta
+        MEMORY_CHECKPOINT_BYTES.set(self._bytes)
+
+    def _writes_size(self, key: tuple[str, str, str]) -> int:
+        writes = self.writes.get(key)
+        if not writes:
+            return 0
+        return sum(_size(write[2]) for write in writes.values())
+
+    def _trim(self, thread_id: str, checkpoint_ns: str, usage: _ThreadUsage) -> None:
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        if self.max_checkpoints_per_thread is None:
+            return
+        excess = len(checkpoints) - self.max_checkpoints_per_thread
+        if excess <= 0:
+            return
+
+        freed = 0
+        for checkpoint_id in sorted(checkpoints)[:excess]:
+            checkpoint, metadata, _ = checkpoints.pop(checkpoint_id)
+            freed += _size(checkpoint) + _size(metadata)
+            freed += self._writes_size((thread_id, checkpoint_ns, checkpoint_id))
+            self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+            usage.versions.pop((checkpoint_ns, checkpoint_id), None)
+
+        # Blobs are shared by every checkpoint that did not bump the channel,
+        # so only those no surviving checkpoint points at can go.
+        live = {
+            (thread_id, ns, channel, version)
+            for (ns, _), versions in usage.versions.items()
+            if ns == checkpoint_ns
+            for channel, version in versions.items()
+        }
+        for key in [k for k in usage.blobs if k[1] == checkpoint_ns and k not in live]:
+            usage.blobs.discard(key)
+            if (blob := self.blobs.pop(key, None)) is not None:
+                freed += _size(blob)
+
+        self._grow(usage, -freed)
+
+    def _enforce_limits(self, keep: str | None = None) -> None:
+        if self.idle_ttl is not None:
+            expires = time.monotonic() - self.idle_ttl
+            while self._usage:
+                thread_id, usage = next(iter(self._usage.items()))
+                if usage.touched > expires or thread_id == keep:
+                    break
+                self._evict(thread_id, "idle")
+
+        while self.max_threads is not None and len(self._usage) > self.max_threads:
+            self._evict(self._lru(keep), "threads")
+
+        while self.max_bytes is not None and self._bytes > self.max_bytes:
+            thread_id = self._lru(keep)
+            if thread_id == keep:
+                break
+            self._evict(thread_id, "bytes")
+
+    def _lru(self, keep: str | None) -> str:
+        for thread_id in self._usage:
+            if thread_id != keep:
+                return thread_id
+        return next(iter(self._usage))
+
+    def _evict(self, thread_id: str, reason: str) -> None:
+        logger.debug(f"Evicting checkpoints of thread {thread_id} ({reason})")
+        MEMORY_CHECKPOINT_EVICTIONS_TOTAL.labels(reason).inc()
+        self._drop(thread_id)
+
+    def _drop(self, thread_id: str) -> None:
+        usage = self._usage.pop(thread_id, None)
+        for checkpoint_ns, checkpoints in self.storage.pop(thread_id, {}).items():
+            for checkpoint_id in checkpoints:
+                self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+
+        if usage is not None:
+            for key in usage.blobs:
+                self.blobs.pop(key, None)
+            self._grow(usage, -usage.bytes)
+        MEMORY_CHECKPOINT_THREADS.set(len(self._usage))
@@ -3,23 +3,76 @@ import logging
 from app.agent.langgraph.checkpoint.base import BaseCheckpointer
 from app.agent.langgraph.checkpoint.memory import MemoryCheckpointer
 from app.agent.langgraph.checkpoint.postgres import PostgresCheckpointer
+from app.agent.langgraph.checkpoint.retention import RetentionPolicy
+from app.agent.langgraph.checkpoint.serde import CompressedSerializer
+from app.agent.langgraph.checkpoint.sqlite import SQLiteCheckpointer
+from app.agent.langgraph.checkpoint.tiered import TieredCheckpointer
+from app.agent.langgraph.checkpoint.write_behind import WriteBehindCheckpointer
 from app.bootstrap.config import AppConfig
-from app.infrastructure.database.connection import DatabaseConnectionFactory
+from app.infrastructure.database.connection import (
+    DatabaseConnection,
+    DatabaseConnectionFactory,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class CheckpointerFactory:
     @classmethod
-    async def create(cls, config: AppConfig) -> BaseCheckpointer:
+    async def create(
+        cls,
+        config: AppConfig,
+        database_connection: DatabaseConnection | None = None,
+    ) -> BaseCheckpointer:
         checkpoint_type = config.checkpoint_type.lower()
         instance: BaseCheckpointer
+        serde = CompressedSerializer(
+            codec=config.checkpoint_compression,
+            threshold=config.checkpoint_compression_threshold,
+        )
 
         if checkpoint_type == "memory":
-            instance = MemoryCheckpointer()
-        elif checkpoint_type == "postgres":
-            database_connection = DatabaseConnectionFactory.create_connection(config)
-            instance = PostgresCheckpointer(database_connection)
+            instance = MemoryCheckpointer(
+                max_threads=config.checkpoint_memory_max_threads,
+                max_checkpoints_per_thread=config.checkpoint_memory_max_checkpoints,
+                idle_ttl=config.checkpoint_memory_idle_ttl,
+                max_bytes=config.checkpoint_memory_max_bytes,
+                serde=serde,
+            )
+        elif checkpoint_type == "sqlite":
+            instance = SQLiteCheckpointer(
+                config.checkpoint_sqlite_path,
+                flush_interval=config.checkpoint_flush_interval,
+                max_pending=config.checkpoint_flush_max_pending,
+                compaction_interval=config.checkpoint_compaction_interval,
+                keep_checkpoints=config.checkpoint_retention_keep_last,
+                serde=serde,
+            )
+        elif checkpoint_type in ("postgres", "tiered"):
+            if database_connection is None:
+                database_connection = DatabaseConnectionFactory.create_connection(
+                    config
+                )
+            instance = PostgresCheckpointer(
+                database_connection,
+                retention=RetentionPolicy(
+                    keep_last=config.checkpoint_retention_keep_last,
+                    max_age=config.checkpoint_retention_max_age,
+                ),
+                compaction_interval=config.checkpoint_compaction_interval,
+                compaction_batch_size=config.checkpoint_compaction_batch_size,
+                serde=serde,
+            )
+            if checkpoint_type == "tiered":
+                instance = TieredCheckpointer(
+                    instance, max_threads=config.checkpoint_cache_threads
+                )
+            elif config.checkpoint_write_behind:
+                instance = WriteBehindCheckpointer(
+                    instance,
+                    flush_interval=config.checkpoint_flush_interval,
+                    max_pending=config.checkpoint_flush_max_pending,
+                )
         else:
             raise ValueError(f"Unsupported checkpointer type: {checkpoint_type}")
 
@@ -28,4 +81,4 @@ class CheckpointerFactory:
 
     @classmethod
     def get_supported_types(cls) -> list[str]:
-        return ["memory", "postgres"]
+        return ["memory", "postgres", "sqlite", "tiered"]
@@ -0,0 +1,76 @@
+import logging
+from abc import ABC, abstractmethod
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    CheckpointMetadata,
+    copy_checkpoint,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointForker(ABC):
+    """Checkpoint saver that can start a thread from another thread's checkpoint.
+
+    ``afork`` makes the checkpoint *config* points at (the latest one when it
+    has no ``checkpoint_id``) the first checkpoint of *thread_id*, keeping its
+    id and channel versions. The forked checkpoint and the channel values it
+    references are stored again under the new thread, without the source's
+    earlier checkpoints and without deserializing anything. Pending writes
+    are not carried over: tasks that had not finished at that checkpoint run
+    again on the new thread.
+    """
+
+    @abstractmethod
+    async def afork(
+        self, config: RunnableConfig, thread_id: str
+    ) -> RunnableConfig | None:
+        pass
+
+
+def fork_metadata(
+    metadata: CheckpointMetadata | dict[str, Any], config: RunnableConfig
+) -> dict[str, Any]:
+    """Metadata of a forked checkpoint, pointing back at where it came from."""
+    configurable = config["configurable"]
+    return {
+        **metadata,
+        "source": "fork",
+        "parents": {},
+        "forked_from": {
+            "thread_id": str(configurable["thread_id"]),
+            "checkpoint_id": configurable["checkpoint_id"],
+        },
+    }
+
+
+async def afork(
+    saver: BaseCheckpointSaver[Any], config: RunnableConfig, thread_id: str
+) -> RunnableConfig | None:
+    """Fork the checkpoint *config* points at into *thread_id* on any saver.
+
+    Savers implementing :class:`CheckpointForker` copy the stored checkpoint
+    as it is; any other saver loads the checkpoint and serializes it again
+    for the new thread. ``None`` means there is no such checkpoint.
+    """
+    if isinstance(saver, CheckpointForker):
+        return await saver.afork(config, thread_id)
+
+    item = await saver.aget_tuple(config)
+    if item is None:
+        return None
+    checkpoint = copy_checkpoint(item.checkpoint)
+    return await saver.aput(
+        {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": item.config["configurable"].get("checkpoint_ns", ""),
+            }
+        },
+        checkpoint,
+        fork_metadata(item.metadata, item.config),  # type: ignore[arg-type]
+        checkpoint["channel_versions"],
+    )
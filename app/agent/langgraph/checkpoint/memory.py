@@ -1,33 +1,72 @@
+import asyncio
 import logging
-from functools import lru_cache
 
-from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.serde.base import SerializerProtocol
 
 from app.agent.langgraph.checkpoint.base import BaseCheckpointer
+from app.agent.langgraph.checkpoint.bounded_memory import BoundedInMemorySaver
 
 logger = logging.getLogger(__name__)
 
 
-@lru_cache()
 class MemoryCheckpointer(BaseCheckpointer):
-    """Memory implementation of the checkpointer."""
+    """Memory implementation of the checkpointer.
 
-    def __init__(self) -> None:
-        self._checkpointer: InMemorySaver | None = None
+    With *idle_ttl* set, idle threads are also evicted every *prune_interval*
+    seconds (at most *idle_ttl*), so memory is given back while no run
+    writes.
+    """
+
+    def __init__(
+        self,
+        max_threads: int | None = None,
+        max_checkpoints_per_thread: int | None = None,
+        idle_ttl: float | None = None,
+        max_bytes: int | None = None,
+        serde: SerializerProtocol | None = None,
+        prune_interval: float = 60.0,
+    ) -> None:
+        self.max_threads = max_threads
+        self.max_checkpoints_per_thread = max_checkpoints_per_thread
+        self.idle_ttl = idle_ttl
+        self.max_bytes = max_bytes
+        self.serde = serde
+        self.prune_interval = min(prune_interval, idle_ttl or prune_interval)
+        self._checkpointer: BoundedInMemorySaver | None = None
+        self._task: asyncio.Task[None] | None = None
 
     async def initialize(self) -> None:
         """Initialize the memory checkpointer."""
         if self._checkpointer is None:
-            self._checkpointer = InMemorySaver()
+            self._checkpointer = BoundedInMemorySaver(
+                max_threads=self.max_threads,
+                max_checkpoints_per_thread=self.max_checkpoints_per_thread,
+                idle_ttl=self.idle_ttl,
+                max_bytes=self.max_bytes,
+                serde=self.serde,
+            )
             logger.debug("Memory checkpoint provider initialized")
+        if self._task is None and self._checkpointer.idle_ttl is not None:
+            self._task = asyncio.create_task(self._prune_loop(self._checkpointer))
 
     async def cleanup(self) -> None:
-        """Clean up memory resources."""
-        pass
+        """Stop pruning idle threads."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
 
-    async def get_checkpointer(self) -> InMemorySaver:
+    async def get_checkpointer(self) -> BoundedInMemorySaver:
         """Get the memory checkpointer instance."""
         if self._checkpointer is None:
             raise ValueError("Checkpointer has not been initialized.")
 
         return self._checkpointer
+
+    async def _prune_loop(self, saver: BoundedInMemorySaver) -> None:
+        while True:
+            await asyncio.sleep(self.prune_interval)
+            try:
+                saver.prune()
+            except Exception as e:
+                logger.error(f"Memory checkpoint pruning failed: {e}")
@@ -1,40 +1,224 @@
 import logging
-from functools import lru_cache
+from collections.abc import Iterable
+from typing import Any
 
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import get_checkpoint_id
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from langgraph.checkpoint.serde.base import SerializerProtocol
 
 from app.agent.langgraph.checkpoint.base import BaseCheckpointer
+from app.agent.langgraph.checkpoint.fork import CheckpointForker
+from app.agent.langgraph.checkpoint.projection import (
+    MESSAGES_CHANNEL,
+    CheckpointProjection,
+    ProjectionReader,
+    load_messages_page,
+)
+from app.agent.langgraph.checkpoint.retention import (
+    PostgresCheckpointCompactor,
+    RetentionPolicy,
+)
 from app.infrastructure.database.connection import DatabaseConnection
 
 logger = logging.getLogger(__name__)
 
+# One row per requested blob channel of the checkpoint, or a single row with
+# NULL blob columns when none of them is stored as a blob.
+SELECT_PROJECTION_SQL = """
+WITH target AS (
+    SELECT thread_id, checkpoint_ns, checkpoint_id, checkpoint
+    FROM checkpoints
+    WHERE thread_id = %(thread_id)s
+      AND checkpoint_ns = %(checkpoint_ns)s
+      AND (%(checkpoint_id)s::text IS NULL OR checkpoint_id = %(checkpoint_id)s)
+    ORDER BY checkpoint_id DESC
+    LIMIT 1
+)
+SELECT t.checkpoint_id, t.checkpoint -> 'channel_values' AS inline_values,
+       b.channel, b.type, b.blob
+FROM target t
+LEFT JOIN checkpoint_blobs b
+    ON b.thread_id = t.thread_id
+   AND b.checkpoint_ns = t.checkpoint_ns
+   AND b.channel = ANY(%(channels)s)
+   AND b.version = t.checkpoint -> 'channel_versions' ->> b.channel
+"""
+
+# Copies the checkpoint row and the blobs it references in one statement, so
+# the values never leave the database. Older checkpoints stay behind.
+FORK_SQL = """
+WITH source AS (
+    SELECT checkpoint_ns, checkpoint_id, checkpoint, metadata
+    FROM checkpoints
+    WHERE thread_id = %(thread_id)s
+      AND checkpoint_ns = %(checkpoint_ns)s
+      AND (%(checkpoint_id)s::text IS NULL OR checkpoint_id = %(checkpoint_id)s)
+    ORDER BY checkpoint_id DESC
+    LIMIT 1
+),
+blobs AS (
+    INSERT INTO checkpoint_blobs
+        (thread_id, checkpoint_ns, channel, version, type, blob)
+    SELECT %(fork_thread_id)s, b.checkpoint_ns, b.channel, b.version, b.type, b.blob
+    FROM source s
+    CROSS JOIN jsonb_each_text(s.checkpoint -> 'channel_versions') v
+    JOIN checkpoint_blobs b
+        ON b.thread_id = %(thread_id)s
+       AND b.checkpoint_ns = s.checkpoint_ns
+       AND b.channel = v.key
+       AND b.version = v.value
+    ON CONFLICT (thread_id, checkpoint_ns, channel, version) DO NOTHING
+)
+INSERT INTO checkpoints
+    (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, checkpoint, metadata)
+SELECT %(fork_thread_id)s, checkpoint_ns, checkpoint_id, NULL, checkpoint,
+       metadata || jsonb_build_object(
+           'source', 'fork',
+           'parents', '{}'::jsonb,
+           'forked_from', jsonb_build_object(
+               'thread_id', %(thread_id)s::text, 'checkpoint_id', checkpoint_id
+           )
+       )
+FROM source
+ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id) DO NOTHING
+RETURNING checkpoint_ns, checkpoint_id
+"""
+
+
+class ProjectingPostgresSaver(AsyncPostgresSaver, ProjectionReader, CheckpointForker):
+    """:class:`AsyncPostgresSaver` that can load a few channels of a checkpoint.
+
+    Only the blobs of the requested channels are fetched and deserialized.
+    Forks are copied inside the database: only the blobs the forked
+    checkpoint references are duplicated, never the source's history.
+    """
+
+    async def afork(
+        self, config: RunnableConfig, thread_id: str
+    ) -> RunnableConfig | None:
+        params = {
+            "thread_id": str(config["configurable"]["thread_id"]),
+            "checkpoint_ns": config["configurable"].get("checkpoint_ns", ""),
+            "checkpoint_id": get_checkpoint_id(config),
+            "fork_thread_id": thread_id,
+        }
+        async with self._cursor() as cur:
+            await cur.execute(FORK_SQL, params)
+            row = await cur.fetchone()
+        if row is None:
+            return None
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": row["checkpoint_ns"],
+                "checkpoint_id": row["checkpoint_id"],
+            }
+        }
+
+    async def aget_projection(
+        self,
+        config: RunnableConfig,
+        channels: Iterable[str],
+        limit: int | None = None,
+        skip: int = 0,
+    ) -> CheckpointProjection | None:
+        channels = list(channels)
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        params = {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": get_checkpoint_id(config),
+            "channels": channels,
+        }
+        async with self._cursor() as cur:
+            await cur.execute(SELECT_PROJECTION_SQL, params)
+            rows = await cur.fetchall()
+        if not rows:
+            return None
+
+        inline = rows[0]["inline_values"] or {}
+        values: dict[str, Any] = {c: inline[c] for c in channels if c in inline}
+        message_count = 0
+        for row in rows:
+            channel = row["channel"]
+            if channel is None or row["type"] == "empty":
+                continue
+            typed = (row["type"], row["blob"])
+            if channel == MESSAGES_CHANNEL:
+                values[channel], message_count = load_messages_page(
+                    self.serde, typed, limit, skip
+                )
+            else:
+                values[channel] = self.serde.loads_typed(typed)
+
+        return CheckpointProjection(
+            {
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": rows[0]["checkpoint_id"],
+                }
+            },
+            values,
+            message_count,
+        )
+
 
-@lru_cache()
 class PostgresCheckpointer(BaseCheckpointer):
     """PostgreSQL implementation of the checkpointer."""
 
-    def __init__(self, database_connection: DatabaseConnection):
+    def __init__(
+        self,
+        database_connection: DatabaseConnection,
+        retention: RetentionPolicy | None = None,
+        compaction_interval: float = 300.0,
+        compaction_batch_size: int = 200,
+        serde: SerializerProtocol | None = None,
+    ):
         self.database_connection = database_connection
-        self._checkpointer: AsyncPostgresSaver | None = None
+        self.retention = retention or RetentionPolicy()
+        self._compaction_interval = compaction_interval
+        self._compaction_batch_size = compaction_batch_size
+        self.serde = serde
+        self._checkpointer: ProjectingPostgresSaver | None = None
+        self._compactor: PostgresCheckpointCompactor | None = None
 
     async def initialize(self) -> None:
-        """Initialize the PostgreSQL checkpointer."""
+        """Initialize the PostgreSQL checkpointer and start compaction."""
         if self._checkpointer is None:
             pool = await self.database_connection.get_pool()
-            self._checkpointer = AsyncPostgresSaver(pool)
+            self._checkpointer = ProjectingPostgresSaver(pool, serde=self.serde)
             await self._checkpointer.setup()
+            self._compactor = PostgresCheckpointCompactor(
+                pool,
+                self.retention,
+                interval=self._compaction_interval,
+                batch_size=self._compaction_batch_size,
+            )
+            await self._compactor.start()
             logger.debug(
                 "PostgreSQL checkpoint provider initialized with connection pool"
             )
 
     async def cleanup(self) -> None:
         """Clean up PostgreSQL resources."""
+        if self._compactor is not None:
+            await self._compactor.stop()
         if self.database_connection:
-            self.database_connection.close()
+            await self.database_connection.close()
 
-    async def get_checkpointer(self) -> AsyncPostgresSaver:
+    async def get_checkpointer(self) -> ProjectingPostgresSaver:
         """Get the PostgreSQL checkpointer instance."""
         if self._checkpointer is None:
             raise ValueError("Checkpointer has not been initialized.")
 
         return self._checkpointer
+
+    async def get_compactor(self) -> PostgresCheckpointCompactor:
+        """Get the compactor that applies the retention policy."""
+        if self._compactor is None:
+            raise ValueError("Checkpointer has not been initialized.")
+
+        return self._compactor
@@ -0,0 +1,127 @@
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from typing import Any, NamedTuple
+
+import ormsgpack
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from app.agent.langgraph.checkpoint.serde import CompressedSerializer
+
+logger = logging.getLogger(__name__)
+
+MESSAGES_CHANNEL = "messages"
+
+
+class CheckpointProjection(NamedTuple):
+    """Some channels of a checkpoint and a page of its messages."""
+
+    config: RunnableConfig
+    values: dict[str, Any]
+    message_count: int
+
+
+class _RawExt(NamedTuple):
+    code: int
+    data: bytes
+
+
+class ProjectionReader(ABC):
+    """Checkpoint saver that can load a few channels without the rest.
+
+    ``aget_projection`` deserializes only *channels* of the checkpoint that
+    ``aget_tuple`` would return. When ``messages`` is one of them, only the
+    page of *limit* messages that ends *skip* messages before the newest one
+    is turned into message objects, so reading a page of a long thread costs
+    the page, not the thread.
+    """
+
+    @abstractmethod
+    async def aget_projection(
+        self,
+        config: RunnableConfig,
+        channels: Iterable[str],
+        limit: int | None = None,
+        skip: int = 0,
+    ) -> CheckpointProjection | None:
+        pass
+
+
+def page_bounds(total: int, limit: int | None, skip: int) -> slice:
+    end = max(total - skip, 0)
+    start = 0 if limit is None else max(end - limit, 0)
+    return slice(start, end)
+
+
+def load_messages_page(
+    serde: SerializerProtocol,
+    typed: tuple[str, bytes],
+    limit: int | None,
+    skip: int,
+) -> tuple[list[Any], int]:
+    """Deserialize one page of a serialized message list.
+
+    Messages are msgpack extensions, so the list is first decoded with each
+    message kept as raw bytes; the page is then packed back into a short list
+    and handed to the serializer's own ``loads_typed``. Anything that does not
+    have that shape is decoded in full.
+    """
+    inner = serde
+    if isinstance(serde, CompressedSerializer):
+        typed = serde.decompress_typed(typed)
+        inner = serde.serde
+
+    type_, data = typed
+    if type_ == "msgpack" and isinstance(inner, JsonPlusSerializer):
+        raw = ormsgpack.unpackb(
+            data, ext_hook=_RawExt, option=ormsgpack.OPT_NON_STR_KEYS
+        )
+        if isinstance(raw, list):
+            page = raw[page_bounds(len(raw), limit, skip)]
+            if all(isinstance(item, _RawExt) for item in page):
+                packed = ormsgpack.packb([ormsgpack.Ext(i.code, i.data) for i in page])
+                return list(inner.loads_typed((type_, packed))), len(raw)
+
+    messages = list(inner.loads_typed(typed) or [])
+    return messages[page_bounds(len(messages), limit, skip)], len(messages)
+
+
+def project_values(
+    config: RunnableConfig,
+    channel_values: Mapping[str, Any],
+    channels: Iterable[str],
+    limit: int | None = None,
+    skip: int = 0,
+) -> CheckpointProjection:
+    """Build a projection from channel values that are already loaded."""
+    values = {c: channel_values[c] for c in channels if c in channel_values}
+    messages = list(values.get(MESSAGES_CHANNEL) or [])
+    if MESSAGES_CHANNEL in values:
+        values[MESSAGES_CHANNEL] = messages[page_bounds(len(messages), limit, skip)]
+    return CheckpointProjection(config, values, len(messages))
+
+
+async def aget_projection(
+    saver: BaseCheckpointSaver[Any],
+    config: RunnableConfig,
+    channels: Iterable[str],
+    limit: int | None = None,
+    skip: int = 0,
+) -> CheckpointProjection | None:
+    """Load *channels* of a checkpoint from any saver.
+
+    Savers implementing :class:`ProjectionReader` skip everything that was not
+    asked for; any other saver loads the whole checkpoint.
+    """
+    if isinstance(saver, ProjectionReader):
+        return await saver.aget_projection(config, channels, limit, skip)
+
+    item = await saver.aget_tuple(config)
+    if item is None:
+        return None
+    return project_values(
+        item.config, item.checkpoint["channel_values"], channels, limit, skip
+    )
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import time
+from typing import Any
+
+from prometheus_client import Counter, Gauge, Histogram
+from psycopg_pool import AsyncConnectionPool
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_COMPACTED_ROWS_TOTAL = Counter(
+    "checkpoint_compacted_rows_total",
+    "Rows removed from the checkpoint tables by compaction.",
+    ["table"],
+)
+CHECKPOINT_COMPACTION_SECONDS = Histogram(
+    "checkpoint_compaction_seconds", "Duration of a full checkpoint compaction pass."
+)
+CHECKPOINT_COMPACTION_THREADS = Gauge(
+    "checkpoint_compaction_threads",
+    "Threads visited by the current checkpoint compaction pass.",
+)
+CHECKPOINT_RELATION_BYTES = Gauge(
+    "checkpoint_relation_bytes",
+    "On-disk size of the checkpoint tables and their indexes.",
+    ["table", "kind"],
+)
+
+CHECKPOINT_TABLES = ("checkpoints", "checkpoint_writes", "checkpoint_blobs")
+
+# Only one worker compacts at a time; the others skip the pass.
+COMPACTION_LOCK_KEY = 0x6368_6B70_7463
+
+NEXT_THREADS_SQL = """
+SELECT DISTINCT thread_id FROM checkpoints
+WHERE thread_id > %s
+ORDER BY thread_id
+LIMIT %s
+"""
+
+# Checkpoints of the given threads that fall outside the policy, with their
+# pending writes. The latest checkpoint of a namespace is never selected.
+DELETE_CHECKPOINTS_SQL = """
+WITH ranked AS (
+    SELECT thread_id, checkpoint_ns, checkpoint_id, checkpoint ->> 'ts' AS ts,
+        row_number() OVER (
+            PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC
+        ) AS position
+    FROM checkpoints
+    WHERE thread_id = ANY(%(threads)s)
+), doomed AS (
+    SELECT thread_id, checkpoint_ns, checkpoint_id FROM ranked
+    WHERE position > 1 AND (
+        (%(keep_last)s::int IS NOT NULL AND position > %(keep_last)s::int)
+        OR (
+            %(max_age)s::float IS NOT NULL
+            AND ts::timestamptz < now() - make_interval(secs => %(max_age)s::float)
+        )
+    )
+), deleted_writes AS (
+    DELETE FROM checkpoint_writes w USING doomed d
+    WHERE w.thread_id = d.thread_id
+      AND w.checkpoint_ns = d.checkpoint_ns
+      AND w.checkpoint_id = d.checkpoint_id
+    RETURNING 1
+), deleted AS (
+    DELETE FROM checkpoints c USING doomed d
+    WHERE c.thread_id = d.thread_id
+      AND c.checkpoint_ns = d.checkpoint_ns
+      AND c.checkpoint_id = d.checkpoint_id
+    RETURNING 1
+)
+SELECT (SELECT count(*) FROM deleted) AS checkpoints,
+       (SELECT count(*) FROM deleted_writes) AS writes
+"""
+
+# Blob versions no remaining checkpoint points at. Blobs are committed before
+# the checkpoint that references them, so a version is only dropped once a
+# newer version of the same channel is checkpointed; in-flight blobs are
+# always the newest.
+DELETE_BLOBS_SQL = """
+DELETE FROM checkpoint_blobs b
+WHERE b.thread_id = ANY(%(threads)s)
+  AND NOT EXISTS (
+    SELECT 1 FROM checkpoints c
+    WHERE c.thread_id = b.thread_id
+      AND c.checkpoint_ns = b.checkpoint_ns
+      AND c.checkpoint -> 'channel_versions' ->> b.channel = b.version
+  )
+  AND EXISTS (
+    SELECT 1 FROM checkpoints c
+    WHERE c.thread_id = b.thread_id
+      AND c.checkpoint_ns = b.checkpoint_ns
+      AND c.checkpoint -> 'channel_versions' ->> b.channel > b.version
+  )
+"""
+
+RELATION_SIZES_SQL = """
+SELECT relname AS table, pg_table_size(oid) AS table_bytes,
+       pg_indexes_size(oid) AS index_bytes
+FROM pg_class
+WHERE relname = ANY(%s) AND relkind = 'r' AND pg_table_is_visible(oid)
+"""
+
+
+class RetentionPolicy:
+    """How many checkpoints of a thread are worth keeping.
+
+    *keep_last* keeps the newest checkpoints of every thread namespace and
+    *max_age* (seconds) drops checkpoints older than that. Either can be
+    ``None`` (or ``0``) to disable it. The latest checkpoint of a thread is
+    always kept, so a thread can be resumed whatever its age.
+    """
+
+    def __init__(self, keep_last: int | None = None, max_age: float | None = None):
+        if keep_last is not None and keep_last < 0:
+            raise ValueError("keep_last must not be negative")
+        self.keep_last = max(keep_last, 1) if keep_last else None
+        self.max_age = max_age or None
+
+    @property
+    def enabled(self) -> bool:
+        return self.keep_last is not None or self.max_age is not None
+
+
+class PostgresCheckpointCompactor:
+    """Applies a :class:`RetentionPolicy` to the Postgres checkpoint tables.
+
+    Every *interval* seconds, threads are visited in primary key order,
+    *batch_size* at a time, and each batch is compacted with two short
+    statements. Those statements only read the primary key indexes of that
+    batch, so compaction never holds locks across the whole table and can
+    be interrupted at any point. Progress and table sizes are exported as
+    Prometheus metrics.
+    """
+
+    def __init__(
+        self,
+        pool: AsyncConnectionPool[Any],
+        policy: RetentionPolicy,
+        interval: float = 300.0,
+        batch_size: int = 200,
+    ):
+        self._pool = pool
+        self.policy = policy
+        self._interval = interval
+        self._batch_size = batch_size
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        if self._task is None and self.policy.enabled:
+            self._task = asyncio.create_task(self._compaction_loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def run_once(self) -> dict[str, int]:
+        """Compact every thread once and return the rows removed per table.
+
+        Returns an empty dict when another worker holds the compaction lock.
+        """
+        removed = dict.fromkeys(CHECKPOINT_TABLES, 0)
+        started = time.monotonic()
+        async with self._pool.connection() as conn:
+            cursor = await conn.execute(
+                "SELECT pg_try_advisory_lock(%s) AS locked", (COMPACTION_LOCK_KEY,)
+            )
+            row = await cursor.fetchone()
+            if not row or not row["locked"]:
+                logger.debug("Checkpoint compaction already running elsewhere")
+                return {}
+
+            try:
+                visited = 0
+                last_thread = ""
+                while True:
+                    cursor = await conn.execute(
+                        NEXT_THREADS_SQL, (last_thread, self._batch_size)
+                    )
+                    threads = [r["thread_id"] for r in await cursor.fetchall()]
+                    if not threads:
+                        break
+
+                    for table, count in (await self._compact(conn, threads)).items():
+                        removed[table] += count
+                        CHECKPOINT_COMPACTED_ROWS_TOTAL.labels(table).inc(count)
+                    visited += len(threads)
+                    CHECKPOINT_COMPACTION_THREADS.set(visited)
+                    last_thread = threads[-1]
+            finally:
+                await conn.execute(
+                    "SELECT pg_advisory_unlock(%s)", (COMPACTION_LOCK_KEY,)
+                )
+
+            await self._record_sizes(conn)
+
+        CHECKPOINT_COMPACTION_SECONDS.observe(time.monotonic() - started)
+        logger.info(
+            f"Checkpoint compaction removed {removed['checkpoints']} checkpoints, "
+            f"{removed['checkpoint_writes']} writes and "
+            f"{removed['checkpoint_blobs']} blobs"
+        )
+        return removed
+
+    async def _compact(self, conn: Any, threads: list[str]) -> dict[str, int]:
+        params = {
+            "threads": threads,
+            "keep_last": self.policy.keep_last,
+            "max_age": self.policy.max_age,
+        }
+        cursor = await conn.execute(DELETE_CHECKPOINTS_SQL, params)
+        row = await cursor.fetchone()
+        cursor = await conn.execute(DELETE_BLOBS_SQL, params)
+        return {
+            "checkpoints": row["checkpoints"],
+            "checkpoint_writes": row["writes"],
+            "checkpoint_blobs": cursor.rowcount,
+        }
+
+    async def _record_sizes(self, conn: Any) -> None:
+        cursor = await conn.execute(RELATION_SIZES_SQL, (list(CHECKPOINT_TABLES),))
+        for row in await cursor.fetchall():
+            CHECKPOINT_RELATION_BYTES.labels(row["table"], "table").set(
+                row["table_bytes"]
+            )
+            CHECKPOINT_RELATION_BYTES.labels(row["table"], "indexes").set(
+                row["index_bytes"]
+            )
+
+    async def _compaction_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Checkpoint compaction failed: {e}")
@@ -0,0 +1,104 @@
+import logging
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_SERIALIZED_BYTES_TOTAL = Counter(
+    "checkpoint_serialized_bytes_total",
+    "Bytes produced by the checkpoint serializer, before and after compression.",
+    ["stage"],
+)
+
+Codec = tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]
+
+
+def _load_codec(name: str) -> Codec:
+    if name == "zlib":
+        return (lambda data: zlib.compress(data, 6)), zlib.decompress
+    if name == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "zstd checkpoint compression requires the zstandard package; "
+                "install it or set CHECKPOINT_COMPRESSION=zlib"
+            ) from e
+        return (lambda data: zstandard.compress(data, 3)), zstandard.decompress
+    if name == "lz4":
+        try:
+            import lz4.frame  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise ImportError(
+                "lz4 checkpoint compression requires the lz4 package; "
+                "install it or set CHECKPOINT_COMPRESSION=zlib"
+            ) from e
+        return lz4.frame.compress, lz4.frame.decompress
+    raise ValueError(f"Unsupported checkpoint compression: {name}")
+
+
+class CompressedSerializer(SerializerProtocol):
+    """Compresses what another serializer produces once it is large enough.
+
+    Values of at least *threshold* bytes are compressed with *codec* (``zlib``,
+    or ``zstd`` and ``lz4`` when the ``zstandard`` or ``lz4`` package is
+    installed) and tagged by appending the codec to the type, e.g.
+    ``msgpack+zstd``, the way langgraph's ``EncryptedSerializer`` tags
+    ciphers. Compression is kept only when it actually saves space. The
+    wrapped serializer is langgraph's msgpack-based ``JsonPlusSerializer``
+    unless another one is given.
+
+    Reads dispatch on the tag, so checkpoints written without compression,
+    or with another codec, stay readable whatever *codec* is configured;
+    ``None`` or ``"none"`` turns compression off for new writes only.
+    """
+
+    def __init__(
+        self,
+        serde: SerializerProtocol | None = None,
+        codec: str | None = "zlib",
+        threshold: int = 1024,
+    ):
+        self.serde = serde or JsonPlusSerializer()
+        self.codec = None if codec in (None, "", "none") else codec
+        self.threshold = threshold
+        self._codecs: dict[str, Codec] = {}
+        if self.codec is not None:
+            self._codecs[self.codec] = _load_codec(self.codec)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self.serde.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self.serde.loads(data)
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = self.serde.dumps_typed(obj)
+        CHECKPOINT_SERIALIZED_BYTES_TOTAL.labels("raw").inc(len(data))
+        if self.codec is not None and len(data) >= self.threshold:
+            compress, _ = self._codecs[self.codec]
+            compressed = compress(data)
+            if len(compressed) < len(data):
+                type_, data = f"{type_}+{self.codec}", compressed
+        CHECKPOINT_SERIALIZED_BYTES_TOTAL.labels("stored").inc(len(data))
+        return type_, data
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        return self.serde.loads_typed(self.decompress_typed(data))
+
+    def decompress_typed(self, data: tuple[str, bytes]) -> tuple[str, bytes]:
+        """Undo the compression of *data*, leaving it for the wrapped serializer."""
+        type_, payload = data
+        base, _, codec = type_.rpartition("+")
+        if not base or codec not in ("zstd", "lz4", "zlib"):
+            return data
+
+        if codec not in self._codecs:
+            self._codecs[codec] = _load_codec(codec)
+        _, decompress = self._codecs[codec]
+        return base, decompress(payload)
@@ -0,0 +1,552 @@
+import asyncio
+import contextlib
+import logging
+import random
+import sqlite3
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from prometheus_client import Counter, Histogram
+
+from app.agent.langgraph.checkpoint.base import (
+    BaseCheckpointer,
+    BufferedCheckpointSaver,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SQLITE_CHECKPOINT_FLUSH_ROWS = Histogram(
+    "sqlite_checkpoint_flush_rows",
+    "Rows written per SQLite checkpoint transaction.",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+SQLITE_CHECKPOINT_COMPACTED_TOTAL = Counter(
+    "sqlite_checkpoint_compacted_total", "Checkpoints removed by SQLite compaction."
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT NOT NULL,
+    value BLOB NOT NULL,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+"""
+
+INSERT_CHECKPOINT_SQL = (
+    "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+# Special channels (errors, interrupts, ...) replace earlier writes of the
+# same task; regular writes keep the first value, as in the other savers.
+UPSERT_WRITE_SQL = "INSERT OR REPLACE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+INSERT_WRITE_SQL = "INSERT OR IGNORE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+SELECT_CHECKPOINTS_SQL = """
+SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id,
+       type, checkpoint, metadata_type, metadata
+FROM checkpoints
+"""
+SELECT_WRITES_SQL = """
+SELECT task_id, channel, type, value FROM writes
+WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?
+ORDER BY task_id, idx
+"""
+
+# Everything but the newest ``keep`` checkpoints of each thread namespace.
+COMPACT_SQL = """
+DELETE FROM checkpoints WHERE rowid IN (
+    SELECT rowid FROM (
+        SELECT rowid, row_number() OVER (
+            PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC
+        ) AS position
+        FROM checkpoints
+    ) WHERE position > ?
+)
+"""
+DELETE_ORPHAN_WRITES_SQL = """
+DELETE FROM writes WHERE NOT EXISTS (
+    SELECT 1 FROM checkpoints c
+    WHERE c.thread_id = writes.thread_id
+      AND c.checkpoint_ns = writes.checkpoint_ns
+      AND c.checkpoint_id = writes.checkpoint_id
+)
+"""
+
+_Statement = tuple[str, tuple[Any, ...]]
+
+# Primary result codes that mean the file itself is damaged. Anything else
+# (locked, I/O errors, a full disk, permissions) says nothing about the data.
+_CORRUPT_ERROR_CODES = (sqlite3.SQLITE_CORRUPT, sqlite3.SQLITE_NOTADB)
+
+
+class _QuickCheckError(sqlite3.DatabaseError):
+    pass
+
+
+def _is_corrupt(error: sqlite3.DatabaseError) -> bool:
+    if isinstance(error, _QuickCheckError):
+        return True
+    code = getattr(error, "sqlite_errorcode", None)
+    return code is not None and code & 0xFF in _CORRUPT_ERROR_CODES
+
+
+class SQLiteSaver(BufferedCheckpointSaver):
+    """Checkpoints stored in a local SQLite database in WAL mode.
+
+    All database work runs on one dedicated thread, so the event loop never
+    blocks on disk I/O and the connection is never shared. Serialized rows
+    are queued and committed together, in one transaction per flush: at the
+    end of every run, when *max_pending* rows are queued, or every
+    *flush_interval* seconds. Reads flush first.
+
+    The background task also compacts the database every
+    *compaction_interval* seconds. It keeps the newest *keep_checkpoints*
+    checkpoints of every thread, drops orphaned writes, checkpoints the WAL
+    and returns free pages to the file system.
+
+    On open, SQLite replays or discards any half-written WAL frames. The file
+    then gets a ``quick_check``. A database that fails it, or that SQLite
+    reports as corrupt or not a database at all, is moved aside and replaced
+    with an empty one, so a corrupt file cannot keep the service down. Any
+    other error, such as a lock held for longer than *busy_timeout* seconds,
+    fails the setup and leaves the file alone.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        flush_interval: float = 1.0,
+        max_pending: int = 500,
+        compaction_interval: float = 300.0,
+        keep_checkpoints: int | None = None,
+        busy_timeout: float = 5.0,
+        serde: SerializerProtocol | None = None,
+    ):
+        super().__init__(serde=serde)
+        self.path = Path(path)
+        self._busy_timeout = busy_timeout
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._compaction_interval = compaction_interval
+        self._keep_checkpoints = keep_checkpoints or None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sqlite-checkpoint"
+        )
+        self._conn: sqlite3.Connection | None = None
+        self._pending: list[_Statement] = []
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def setup(self) -> None:
+        await self._run(self._open)
+        if self._task is None:
+            self._task = asyncio.create_task(self._maintenance_loop())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.aflush()
+        await self._run(self._close)
+        self._executor.shutdown(wait=True)
+
+    def get_next_version(self, current: str | None, channel: None) -> str:
+        current_v = 0 if current is None else int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        configurable = config["configurable"]
+        thread_id = str(configurable["thread_id"])
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+
+        type_, payload = await asyncio.to_thread(self.serde.dumps_typed, checkpoint)
+        metadata_type, metadata_payload = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+        self._pending.append(
+            (
+                INSERT_CHECKPOINT_SQL,
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    configurable.get("checkpoint_id"),
+                    type_,
+                    payload,
+                    metadata_type,
+                    metadata_payload,
+                ),
+            )
+        )
+        await self._flush_if_full()
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        configurable = config["configurable"]
+        key = (
+            str(configurable["thread_id"]),
+            configurable.get("checkpoint_ns", ""),
+            configurable["checkpoint_id"],
+        )
+        sql = (
+            UPSERT_WRITE_SQL
+            if all(channel in WRITES_IDX_MAP for channel, _ in writes)
+            else INSERT_WRITE_SQL
+        )
+        for idx, (channel, value) in enumerate(writes):
+            type_, payload = self.serde.dumps_typed(value)
+            self._pending.append(
+                (
+                    sql,
+                    (
+                        *key,
+                        task_id,
+                        WRITES_IDX_MAP.get(channel, idx),
+                        channel,
+                        type_,
+                        payload,
+                        task_path,
+                    ),
+                )
+            )
+        await self._flush_if_full()
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        configurable = config["configurable"]
+        thread_id = str(configurable["thread_id"])
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        if checkpoint_id := get_checkpoint_id(config):
+            where = "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?"
+            args: tuple[Any, ...] = (thread_id, checkpoint_ns, checkpoint_id)
+        else:
+            where = "WHERE thread_id = ? AND checkpoint_ns = ?"
+            args = (thread_id, checkpoint_ns)
+        query = f"{SELECT_CHECKPOINTS_SQL} {where} ORDER BY checkpoint_id DESC LIMIT 1"
+
+        await self.aflush()
+        rows = await self._run(self._read, query, args)
+        return rows[0] if rows else None
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        clauses: list[str] = []
+        args: list[Any] = []
+        if config is not None:
+            configurable = config["configurable"]
+            clauses.append("thread_id = ?")
+            args.append(str(configurable["thread_id"]))
+            if (checkpoint_ns := configurable.get("checkpoint_ns")) is not None:
+                clauses.append("checkpoint_ns = ?")
+                args.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                args.append(checkpoint_id)
+        if before is not None and (before_id := get_checkpoint_id(before)):
+            clauses.append("checkpoint_id < ?")
+            args.append(before_id)
+
+        query = SELECT_CHECKPOINTS_SQL
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY checkpoint_id DESC"
+        # Metadata filters are applied after decoding, so LIMIT only goes
+        # to SQLite when there are none.
+        if limit is not None and not filter:
+            query += f" LIMIT {int(limit)}"
+
+        await self.aflush()
+        rows = await self._run(self._read, query, tuple(args))
+        for item in rows:
+            if filter and not all(item.metadata.get(k) == v for k, v in filter.items()):
+                continue
+            if limit is not None:
+                if limit <= 0:
+                    return
+                limit -= 1
+            yield item
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await self.aflush()
+        await self._run(self._delete_thread, str(thread_id))
+
+    async def aflush(self, thread_id: str | None = None) -> None:
+        # Rows of every thread share one ordered queue and one transaction,
+        # so flushing one thread flushes them all.
+        if not self._pending:
+            return
+        statements, self._pending = self._pending, []
+        try:
+            await self._run(self._write, statements)
+        except BaseException:
+            self._pending[:0] = statements
+            raise
+
+    async def acompact(self) -> int:
+        """Run one compaction pass and return how many checkpoints were removed."""
+        await self.aflush()
+        return await self._run(self._compact)
+
+    async def _flush_if_full(self) -> None:
+        if len(self._pending) >= self._max_pending:
+            await self.aflush()
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def _maintenance_loop(self) -> None:
+        last_compaction = time.monotonic()
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.aflush()
+                if time.monotonic() - last_compaction >= self._compaction_interval:
+                    last_compaction = time.monotonic()
+                    await self.acompact()
+            except Exception as e:
+                logger.error(f"SQLite checkpoint maintenance failed: {e}")
+
+    # Everything below runs on the executor thread.
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            raise ValueError("SQLite checkpointer has not been set up.")
+        return self._conn
+
+    def _open(self) -> None:
+        if self._conn is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            conn = self._connect()
+        except sqlite3.DatabaseError as e:
+            if not _is_corrupt(e):
+                raise
+            logger.error(f"SQLite checkpoint store {self.path} is corrupt: {e}")
+            self._move_aside()
+            conn = self._connect()
+
+        conn.executescript(SCHEMA)
+        self._conn = conn
+        logger.debug(f"SQLite checkpoint store opened at {self.path}")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self._busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        try:
+            # auto_vacuum only takes effect before the first table exists.
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout * 1000)}")
+            row = conn.execute("PRAGMA quick_check").fetchone()
+            if row is None or row[0] != "ok":
+                raise _QuickCheckError(row[0] if row else "quick_check failed")
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def _move_aside(self) -> None:
+        corrupt = f"{self.path}.corrupt-{int(time.time())}"
+        for suffix in ("", "-wal", "-shm"):
+            source = Path(f"{self.path}{suffix}")
+            if source.exists():
+                source.rename(f"{corrupt}{suffix}")
+        logger.error(f"Moved the damaged checkpoint store to {corrupt}")
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            with contextlib.suppress(sqlite3.Error):
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.close()
+            self._conn = None
+
+    def _write(self, statements: list[_Statement]) -> None:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for sql, params in statements:
+                conn.execute(sql, params)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        SQLITE_CHECKPOINT_FLUSH_ROWS.observe(len(statements))
+
+    def _read(self, query: str, args: tuple[Any, ...]) -> list[CheckpointTuple]:
+        conn = self._connection()
+        items = []
+        for (
+            thread_id,
+            checkpoint_ns,
+            checkpoint_id,
+            parent_checkpoint_id,
+            type_,
+            payload,
+            metadata_type,
+            metadata_payload,
+        ) in conn.execute(query, args).fetchall():
+            writes = conn.execute(
+                SELECT_WRITES_SQL, (thread_id, checkpoint_ns, checkpoint_id)
+            ).fetchall()
+            items.append(
+                CheckpointTuple(
+                    config={
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": checkpoint_id,
+                        }
+                    },
+                    checkpoint=self.serde.loads_typed((type_, payload)),
+                    metadata=self.serde.loads_typed((metadata_type, metadata_payload)),
+                    parent_config=(
+                        {
+                            "configurable": {
+                                "thread_id": thread_id,
+                                "checkpoint_ns": checkpoint_ns,
+                                "checkpoint_id": parent_checkpoint_id,
+                            }
+                        }
+                        if parent_checkpoint_id
+                        else None
+                    ),
+                    pending_writes=[
+                        (task_id, channel, self.serde.loads_typed((t, value)))
+                        for task_id, channel, t, value in writes
+                    ],
+                )
+            )
+        return items
+
+    def _delete_thread(self, thread_id: str) -> None:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
+        conn.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
+        conn.execute("COMMIT")
+
+    def _compact(self) -> int:
+        conn = self._connection()
+        removed = 0
+        if self._keep_checkpoints is not None:
+            conn.execute("BEGIN IMMEDIATE")
+            removed = conn.execute(COMPACT_SQL, (self._keep_checkpoints,)).rowcount
+            conn.execute(DELETE_ORPHAN_WRITES_SQL)
+            conn.execute("COMMIT")
+            SQLITE_CHECKPOINT_COMPACTED_TOTAL.inc(removed)
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("PRAGMA incremental_vacuum")
+        conn.execute("PRAGMA optimize")
+        return removed
+
+
+class SQLiteCheckpointer(BaseCheckpointer):
+    """SQLite implementation of the checkpointer for single-node deployments."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        flush_interval: float = 1.0,
+        max_pending: int = 500,
+        compaction_interval: float = 300.0,
+        keep_checkpoints: int | None = None,
+        serde: SerializerProtocol | None = None,
+    ):
+        self.path = path
+        self._options: dict[str, Any] = {
+            "flush_interval": flush_interval,
+            "max_pending": max_pending,
+            "compaction_interval": compaction_interval,
+            "keep_checkpoints": keep_checkpoints,
+            "serde": serde,
+        }
+        self._checkpointer: SQLiteSaver | None = None
+
+    async def initialize(self) -> None:
+        """Open the SQLite checkpoint store."""
+        if self._checkpointer is None:
+            self._checkpointer = SQLiteSaver(self.path, **self._options)
+            await self._checkpointer.setup()
+            logger.debug("SQLite checkpoint provider initialized")
+
+    async def cleanup(self) -> None:
+        """Flush pending checkpoints and close the store."""
+        if self._checkpointer is not None:
+            await self._checkpointer.close()
+            self._checkpointer = None
+
+    async def get_checkpointer(self) -> SQLiteSaver:
+        """Get the SQLite checkpointer instance."""
+        if self._checkpointer is None:
+            raise ValueError("Checkpointer has not been initialized.")
+
+        return self._checkpointer
@@ -0,0 +1,243 @@
+import logging
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable, Sequence
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    copy_checkpoint,
+    get_checkpoint_id,
+    get_serializable_checkpoint_metadata,
+)
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from prometheus_client import Counter, Gauge
+from psycopg_pool import AsyncConnectionPool
+
+from app.agent.langgraph.checkpoint.base import BaseCheckpointer
+from app.agent.langgraph.checkpoint.fork import CheckpointForker, afork
+from app.agent.langgraph.checkpoint.postgres import PostgresCheckpointer
+from app.agent.langgraph.checkpoint.projection import (
+    CheckpointProjection,
+    ProjectionReader,
+    aget_projection,
+)
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_CACHE_LOOKUPS_TOTAL = Counter(
+    "checkpoint_cache_lookups_total",
+    "Latest-checkpoint lookups served by the tiered checkpointer.",
+    ["result"],
+)
+CHECKPOINT_CACHE_THREADS = Gauge(
+    "checkpoint_cache_threads", "Threads whose latest checkpoint is cached."
+)
+
+# The latest checkpoint of a namespace and how many pending writes it has.
+# Both are answered from the primary keys, without touching any blob.
+VERSION_SQL = """
+SELECT c.checkpoint_id,
+    (SELECT count(*) FROM checkpoint_writes w
+     WHERE w.thread_id = c.thread_id
+       AND w.checkpoint_ns = c.checkpoint_ns
+       AND w.checkpoint_id = c.checkpoint_id) AS writes
+FROM checkpoints c
+WHERE c.thread_id = %s AND c.checkpoint_ns = %s
+ORDER BY c.checkpoint_id DESC
+LIMIT 1
+"""
+
+
+def _copy_tuple(item: CheckpointTuple) -> CheckpointTuple:
+    return item._replace(
+        checkpoint=copy_checkpoint(item.checkpoint),
+        pending_writes=list(item.pending_writes or []),
+    )
+
+
+class TieredSaver(BaseCheckpointSaver[str], ProjectionReader, CheckpointForker):
+    """Keeps the latest checkpoint of recently used threads in front of Postgres.
+
+    Writes go straight through to the wrapped :class:`AsyncPostgresSaver` and
+    refresh the cache. A cached entry is only returned after a version check
+    confirms that its checkpoint is still the newest one in the database with
+    the same number of pending writes, so runs on other workers invalidate it.
+    That check reads two primary-key indexes instead of loading and
+    deserializing the checkpoint with its blobs and writes.
+
+    At most *max_threads* (thread, namespace) pairs are cached, least
+    recently used first out.
+    """
+
+    def __init__(self, saver: AsyncPostgresSaver, max_threads: int = 1024):
+        if not isinstance(saver.conn, AsyncConnectionPool):
+            raise ValueError("TieredSaver requires a saver backed by a pool")
+
+        super().__init__(serde=saver.serde)
+        self.saver = saver
+        self._pool: AsyncConnectionPool[Any] = saver.conn
+        self._max_threads = max_threads
+        self._cache: OrderedDict[tuple[str, str], CheckpointTuple] = OrderedDict()
+
+    def get_next_version(self, current: str | None, channel: None) -> str:
+        return self.saver.get_next_version(current, channel)
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        key = self._key(config)
+        cached = self._cache.get(key)
+        checkpoint_id = get_checkpoint_id(config)
+
+        if cached is not None and checkpoint_id in (None, cached.checkpoint["id"]):
+            if await self._is_current(key, cached):
+                self._cache.move_to_end(key)
+                CHECKPOINT_CACHE_LOOKUPS_TOTAL.labels("hit").inc()
+                return _copy_tuple(cached)
+            self._evict(key)
+            CHECKPOINT_CACHE_LOOKUPS_TOTAL.labels("stale").inc()
+        elif checkpoint_id is None:
+            CHECKPOINT_CACHE_LOOKUPS_TOTAL.labels("miss").inc()
+
+        item = await self.saver.aget_tuple(config)
+        if item is not None and checkpoint_id is None:
+            self._store(key, item)
+        return item
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        async for item in self.saver.alist(
+            config, filter=filter, before=before, limit=limit
+        ):
+            yield item
+
+    async def aget_projection(
+        self,
+        config: RunnableConfig,
+        channels: Iterable[str],
+        limit: int | None = None,
+        skip: int = 0,
+    ) -> CheckpointProjection | None:
+        return await aget_projection(self.saver, config, channels, limit, skip)
+
+    async def afork(
+        self, config: RunnableConfig, thread_id: str
+    ) -> RunnableConfig | None:
+        return await afork(self.saver, config, thread_id)
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        next_config = await self.saver.aput(config, checkpoint, metadata, new_versions)
+
+        # Shaped like the tuple AsyncPostgresSaver would load back.
+        thread_id, checkpoint_ns = key = self._key(config)
+        parent_id = get_checkpoint_id(config)
+        self._store(
+            key,
+            CheckpointTuple(
+                config=next_config,
+                checkpoint=copy_checkpoint(checkpoint),
+                metadata=get_serializable_checkpoint_metadata(config, metadata),
+                parent_config=(
+                    {
+                        "configurable": {
+                            "thread_id": thread_id,
+                            "checkpoint_ns": checkpoint_ns,
+                            "checkpoint_id": parent_id,
+                        }
+                    }
+                    if parent_id
+                    else None
+                ),
+                pending_writes=[],
+            ),
+        )
+        return next_config
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        # Pending writes are merged by the database (upserts for special
+        # channels), so the entry is dropped rather than patched.
+        self._evict(self._key(config))
+        await self.saver.aput_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        for key in [k for k in self._cache if k[0] == str(thread_id)]:
+            self._evict(key)
+        await self.saver.adelete_thread(thread_id)
+
+    @staticmethod
+    def _key(config: RunnableConfig) -> tuple[str, str]:
+        configurable = config["configurable"]
+        return str(configurable["thread_id"]), configurable.get("checkpoint_ns", "")
+
+    async def _is_current(self, key: tuple[str, str], cached: CheckpointTuple) -> bool:
+        async with self._pool.connection() as conn:
+            cursor = await conn.execute(VERSION_SQL, key)
+            row = await cursor.fetchone()
+        if row is None:
+            return False
+        checkpoint_id, writes = row["checkpoint_id"], row["writes"]
+        return bool(
+            checkpoint_id == cached.checkpoint["id"]
+            and writes == len(cached.pending_writes or [])
+        )
+
+    def _store(self, key: tuple[str, str], item: CheckpointTuple) -> None:
+        self._cache[key] = item
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_threads:
+            self._cache.popitem(last=False)
+        CHECKPOINT_CACHE_THREADS.set(len(self._cache))
+
+    def _evict(self, key: tuple[str, str]) -> None:
+        if self._cache.pop(key, None) is not None:
+            CHECKPOINT_CACHE_THREADS.set(len(self._cache))
+
+
+class TieredCheckpointer(BaseCheckpointer):
+    """PostgreSQL checkpointer with an in-process cache of latest checkpoints."""
+
+    def __init__(self, postgres: PostgresCheckpointer, max_threads: int = 1024):
+        self.postgres = postgres
+        self._max_threads = max_threads
+        self._checkpointer: TieredSaver | None = None
+
+    async def initialize(self) -> None:
+        """Initialize the wrapped PostgreSQL checkpointer."""
+        if self._checkpointer is None:
+            await self.postgres.initialize()
+            self._checkpointer = TieredSaver(
+                await self.postgres.get_checkpointer(), max_threads=self._max_threads
+            )
+            logger.debug("Tiered checkpoint provider initialized")
+
+    async def cleanup(self) -> None:
+        """Clean up PostgreSQL resources."""
+        await self.postgres.cleanup()
+
+    async def get_checkpointer(self) -> TieredSaver:
+        """Get the tiered checkpointer instance."""
+        if self._checkpointer is None:
+            raise ValueError("Checkpointer has not been initialized.")
+
+        return self._checkpointer
@@ -0,0 +1,353 @@
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import AsyncIterator, Iterable, Sequence
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_serializable_checkpoint_metadata,
+)
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from prometheus_client import Counter, Histogram
+from psycopg import Capabilities
+from psycopg.types.json import Jsonb
+from psycopg_pool import AsyncConnectionPool
+
+from app.agent.langgraph.checkpoint.base import (
+    BaseCheckpointer,
+    BufferedCheckpointSaver,
+)
+from app.agent.langgraph.checkpoint.fork import CheckpointForker, afork
+from app.agent.langgraph.checkpoint.postgres import PostgresCheckpointer
+from app.agent.langgraph.checkpoint.projection import (
+    CheckpointProjection,
+    ProjectionReader,
+    aget_projection,
+)
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FLUSH_ROWS = Histogram(
+    "checkpoint_flush_rows",
+    "Rows written per write-behind checkpoint flush.",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+CHECKPOINT_FLUSH_FAILURES_TOTAL = Counter(
+    "checkpoint_flush_failures_total", "Write-behind checkpoint flushes that failed."
+)
+
+
+class _PendingRows:
+    """Rows buffered for one thread, already serialized for the Postgres saver."""
+
+    def __init__(self) -> None:
+        self.blobs: list[tuple[Any, ...]] = []
+        self.checkpoints: list[tuple[Any, ...]] = []
+        self.upsert_writes: list[tuple[Any, ...]] = []
+        self.insert_writes: list[tuple[Any, ...]] = []
+        self.since = time.monotonic()
+
+    def __len__(self) -> int:
+        return (
+            len(self.blobs)
+            + len(self.checkpoints)
+            + len(self.upsert_writes)
+            + len(self.insert_writes)
+        )
+
+    def extend(self, other: "_PendingRows") -> None:
+        self.blobs.extend(other.blobs)
+        self.checkpoints.extend(other.checkpoints)
+        self.upsert_writes.extend(other.upsert_writes)
+        self.insert_writes.extend(other.insert_writes)
+        self.since = min(self.since, other.since)
+
+
+class WriteBehindSaver(BufferedCheckpointSaver, ProjectionReader, CheckpointForker):
+    """Buffers checkpoint writes of an :class:`AsyncPostgresSaver` in memory.
+
+    ``aput`` and ``aput_writes`` serialize exactly like the wrapped saver but
+    only queue the resulting rows. A thread's rows are written in one
+    pipelined transaction when ``aflush`` is called (at the end of every
+    run), when *max_pending* rows have piled up, or by the background flusher
+    once the oldest row is *flush_interval* seconds old. Reads flush the
+    thread first and are then served by the wrapped saver.
+
+    Rows that fail to flush stay buffered and are retried; anything still
+    pending at ``stop`` is flushed one last time.
+    """
+
+    def __init__(
+        self,
+        saver: AsyncPostgresSaver,
+        flush_interval: float = 1.0,
+        max_pending: int = 500,
+    ):
+        if not isinstance(saver.conn, AsyncConnectionPool):
+            raise ValueError("WriteBehindSaver requires a saver backed by a pool")
+
+        super().__init__(serde=saver.serde)
+        self.saver = saver
+        self._pool: AsyncConnectionPool[Any] = saver.conn
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._pending: dict[str, _PendingRows] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flusher: asyncio.Task[None] | None = None
+
+    @property
+    def pending(self) -> int:
+        return sum(len(rows) for rows in self._pending.values())
+
+    async def start(self) -> None:
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        await self.aflush()
+
+    def get_next_version(self, current: str | None, channel: None) -> str:
+        return self.saver.get_next_version(current, channel)
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        await self.aflush(str(config["configurable"]["thread_id"]))
+        return await self.saver.aget_tuple(config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        await self.aflush(str(config["configurable"]["thread_id"]) if config else None)
+        async for item in self.saver.alist(
+            config, filter=filter, before=before, limit=limit
+        ):
+            yield item
+
+    async def aget_projection(
+        self,
+        config: RunnableConfig,
+        channels: Iterable[str],
+        limit: int | None = None,
+        skip: int = 0,
+    ) -> CheckpointProjection | None:
+        await self.aflush(str(config["configurable"]["thread_id"]))
+        return await aget_projection(self.saver, config, channels, limit, skip)
+
+    async def afork(
+        self, config: RunnableConfig, thread_id: str
+    ) -> RunnableConfig | None:
+        await self.aflush(str(config["configurable"]["thread_id"]))
+        return await afork(self.saver, config, thread_id)
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        configurable = config["configurable"]
+        thread_id = str(configurable["thread_id"])
+        checkpoint_ns = configurable["checkpoint_ns"]
+
+        # Same split as AsyncPostgresSaver.aput: primitives stay inline in the
+        # checkpoint row, everything else goes to checkpoint_blobs.
+        copy = checkpoint.copy()
+        copy["channel_values"] = copy["channel_values"].copy()
+        blob_values = {}
+        for k, v in checkpoint["channel_values"].items():
+            if not (v is None or isinstance(v, str | int | float | bool)):
+                blob_values[k] = copy["channel_values"].pop(k)
+
+        blobs = []
+        if blob_versions := {k: v for k, v in new_versions.items() if k in blob_values}:
+            blobs = await asyncio.to_thread(
+                self.saver._dump_blobs,
+                thread_id,
+                checkpoint_ns,
+                blob_values,
+                blob_versions,
+            )
+
+        # No awaits between picking the buffer and appending to it, so a
+        # concurrent flush cannot detach it halfway.
+        rows = self._pending.setdefault(thread_id, _PendingRows())
+        rows.blobs.extend(blobs)
+        rows.checkpoints.append(
+            (
+                thread_id,
+                checkpoint_ns,
+                checkpoint["id"],
+                configurable.get("checkpoint_id"),
+                Jsonb(copy),
+                Jsonb(get_serializable_checkpoint_metadata(config, metadata)),
+            )
+        )
+        await self._flush_if_full(thread_id, rows)
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        configurable = config["configurable"]
+        thread_id = str(configurable["thread_id"])
+        params = await asyncio.to_thread(
+            self.saver._dump_writes,
+            thread_id,
+            configurable["checkpoint_ns"],
+            configurable["checkpoint_id"],
+            task_id,
+            task_path,
+            writes,
+        )
+
+        rows = self._pending.setdefault(thread_id, _PendingRows())
+        if all(w[0] in WRITES_IDX_MAP for w in writes):
+            rows.upsert_writes.extend(params)
+        else:
+            rows.insert_writes.extend(params)
+        await self._flush_if_full(thread_id, rows)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        async with self._flush_lock:
+            self._pending.pop(str(thread_id), None)
+        await self.saver.adelete_thread(thread_id)
+
+    async def _flush_if_full(self, thread_id: str, rows: _PendingRows) -> None:
+        if len(rows) >= self._max_pending:
+            await self.aflush(thread_id)
+
+    async def aflush(self, thread_id: str | None = None) -> None:
+        """Write the buffered rows of *thread_id*, or of every thread, to Postgres."""
+        async with self._flush_lock:
+            thread_ids = list(self._pending) if thread_id is None else [thread_id]
+            batch = {t: self._pending.pop(t) for t in thread_ids if t in self._pending}
+            if not batch:
+                return
+
+            try:
+                await self._write(batch.values())
+            except Exception:
+                CHECKPOINT_FLUSH_FAILURES_TOTAL.inc()
+                # Put the rows back in front of anything queued meanwhile.
+                for t, rows in batch.items():
+                    if t in self._pending:
+                        rows.extend(self._pending[t])
+                    self._pending[t] = rows
+                raise
+
+    async def _write(self, batch: Iterable[_PendingRows]) -> None:
+        rows = _PendingRows()
+        for thread_rows in batch:
+            rows.extend(thread_rows)
+
+        async with self._pool.connection() as conn:
+            pipeline = (
+                conn.pipeline()
+                if Capabilities().has_pipeline()
+                else contextlib.nullcontext()
+            )
+            async with (
+                pipeline,
+                conn.transaction(),
+                conn.cursor(binary=True) as cur,
+            ):
+                if rows.blobs:
+                    await cur.executemany(
+                        self.saver.UPSERT_CHECKPOINT_BLOBS_SQL, rows.blobs
+                    )
+                if rows.checkpoints:
+                    await cur.executemany(
+                        self.saver.UPSERT_CHECKPOINTS_SQL, rows.checkpoints
+                    )
+                if rows.upsert_writes:
+                    await cur.executemany(
+                        self.saver.UPSERT_CHECKPOINT_WRITES_SQL, rows.upsert_writes
+                    )
+                if rows.insert_writes:
+                    await cur.executemany(
+                        self.saver.INSERT_CHECKPOINT_WRITES_SQL, rows.insert_writes
+                    )
+
+        CHECKPOINT_FLUSH_ROWS.observe(len(rows))
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            deadline = time.monotonic() - self._flush_interval
+            for thread_id, rows in list(self._pending.items()):
+                if rows.since > deadline:
+                    continue
+                try:
+                    await self.aflush(thread_id)
+                except Exception as e:
+                    logger.error(f"Failed to flush checkpoints for {thread_id}: {e}")
+
+
+class WriteBehindCheckpointer(BaseCheckpointer):
+    """PostgreSQL checkpointer with write-behind batching of checkpoint writes."""
+
+    def __init__(
+        self,
+        postgres: PostgresCheckpointer,
+        flush_interval: float = 1.0,
+        max_pending: int = 500,
+    ):
+        self.postgres = postgres
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._checkpointer: WriteBehindSaver | None = None
+
+    async def initialize(self) -> None:
+        """Initialize the wrapped PostgreSQL checkpointer and start flushing."""
+        if self._checkpointer is None:
+            await self.postgres.initialize()
+            self._checkpointer = WriteBehindSaver(
+                await self.postgres.get_checkpointer(),
+                flush_interval=self._flush_interval,
+                max_pending=self._max_pending,
+            )
+            await self._checkpointer.start()
+            logger.debug("Write-behind checkpoint provider initialized")
+
+    async def cleanup(self) -> None:
+        """Flush pending checkpoints, then clean up PostgreSQL resources."""
+        if self._checkpointer is not None:
+            try:
+                await self._checkpointer.stop()
+            except Exception as e:
+                logger.error(f"Failed to flush pending checkpoints: {e}")
+        await self.postgres.cleanup()
+
+    async def get_checkpointer(self) -> WriteBehindSaver:
+        """Get the write-behind checkpointer instance."""
+        if self._checkpointer is None:
+            raise ValueError("Checkpointer has not been initialized.")
+
+        return self._checkpointer
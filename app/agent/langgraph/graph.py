@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any, TypedDict, cast
 
 from langchain.chat_models import init_chat_model
@@ -19,6 +20,23 @@ from app.agent.prompt import Prompt, PromptProvider
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _chat_model(
+    provider: str, model: str, temperature: float | None, max_tokens: int | None
+) -> BaseChatModel:
+    """Build a chat model once per configuration.
+
+    Chat models are stateless between calls but own an HTTP client, so
+    sharing them lets every run reuse the provider's connection pool.
+    """
+    return init_chat_model(
+        model,
+        model_provider=provider,
+        temperature=temperature,
+        max_tokens=max_tokens,
+    )
+
+
 class ModelResponse(TypedDict):
     messages: list[AIMessage]
     message_trace_map: list[dict[str, str | None]]
@@ -49,14 +67,8 @@ class Graph(ABC):
         cfg_model = cfg.get("model", "")
         provider, model = cfg_model.split("/", 1)
 
-        return cast(
-            BaseChatModel,
-            init_chat_model(
-                model,
-                model_provider=provider,
-                temperature=cfg.get("temperature"),
-                max_tokens=cfg.get("max_tokens"),
-            ),
+        return _chat_model(
+            provider, model, cfg.get("temperature"), cfg.get("max_tokens")
         )
 
     def get_prompt_name(self) -> str:
@@ -117,13 +129,17 @@ class Graph(ABC):
     def _with_tools(model: Any, tools: list[Any] | None = None) -> Any:
         return model.bind_tools(tools) if tools else model
 
+    def load_prompt(self) -> Prompt:
+        """Fetch the prompt for this graph from the prompt provider."""
+        return self._prompt_provider.get_prompt(
+            self.get_prompt_name(), self.get_prompt_label(), self.get_prompt_fallback()
+        )
+
     async def call_model(
         self, state: BaseState, config: RunnableConfig
     ) -> ModelResponse:
         """Base implementation of call_model. Can be overridden if needed."""
-        prompt = self._prompt_provider.get_prompt(
-            self.get_prompt_name(), self.get_prompt_label(), self.get_prompt_fallback()
-        )
+        prompt = self.load_prompt()
 
         model = self._with_tools(self.get_model(prompt), self.get_tools())
 
@@ -0,0 +1,113 @@
+import asyncio
+import logging
+from collections.abc import Mapping
+from typing import Any
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.graph.state import CompiledStateGraph
+
+from app.agent.langgraph.graph import Graph
+from app.agent.prompt import PromptProvider
+
+logger = logging.getLogger(__name__)
+
+
+class UnknownAgentError(ValueError):
+    """Raised when a run or feedback targets an agent id that is not registered."""
+
+    def __init__(self, agent_id: str):
+        super().__init__(f"Unknown agent: {agent_id}")
+        self.agent_id = agent_id
+
+
+class GraphRegistry:
+    """Maps agent ids to :class:`Graph` subclasses and caches compiled graphs.
+
+    Every graph shares the same checkpointer and prompt provider. A graph is
+    compiled at most once: the first ``get`` for an agent id compiles it under
+    a per-agent lock, every later call is a plain dict lookup.
+    """
+
+    def __init__(
+        self,
+        checkpointer: BaseCheckpointSaver[Any],
+        prompt_provider: PromptProvider,
+        graphs: Mapping[str, type[Graph]],
+        default_agent_id: str,
+    ):
+        if default_agent_id not in graphs:
+            raise UnknownAgentError(default_agent_id)
+
+        self._checkpointer = checkpointer
+        self._prompt_provider = prompt_provider
+        self._graphs = dict(graphs)
+        self._default_agent_id = default_agent_id
+        self._instances: dict[str, Graph] = {}
+        self._compiled: dict[str, CompiledStateGraph[Any, Any, Any]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    @property
+    def agent_ids(self) -> list[str]:
+        return list(self._graphs)
+
+    @property
+    def default_agent_id(self) -> str:
+        return self._default_agent_id
+
+    @property
+    def checkpointer(self) -> BaseCheckpointSaver[Any]:
+        return self._checkpointer
+
+    def register(self, agent_id: str, graph_cls: type[Graph]) -> None:
+        """Register (or replace) the graph class served under *agent_id*."""
+        self._graphs[agent_id] = graph_cls
+        self._instances.pop(agent_id, None)
+        self._compiled.pop(agent_id, None)
+
+    def resolve(self, agent_id: str | None) -> str:
+        """Return the registered agent id for *agent_id*, falling back to the default."""
+        resolved = agent_id or self._default_agent_id
+        if resolved not in self._graphs:
+            raise UnknownAgentError(resolved)
+        return resolved
+
+    async def get(
+        self, agent_id: str | None = None
+    ) -> CompiledStateGraph[Any, Any, Any]:
+        """Return the compiled graph for *agent_id*, compiling it on first use."""
+        resolved = self.resolve(agent_id)
+
+        compiled = self._compiled.get(resolved)
+        if compiled is not None:
+            return compiled
+
+        lock = self._locks.setdefault(resolved, asyncio.Lock())
+        async with lock:
+            compiled = self._compiled.get(resolved)
+            if compiled is None:
+                compiled = self._instance(resolved).build_graph()
+                self._compiled[resolved] = compiled
+                logger.debug(f"Compiled graph for agent '{resolved}'")
+
+        return compiled
+
+    def _instance(self, agent_id: str) -> Graph:
+        graph = self._instances.get(agent_id)
+        if graph is None:
+            graph = self._graphs[agent_id](self._checkpointer, self._prompt_provider)
+            self._instances[agent_id] = graph
+        return graph
+
+    async def warmup(self, prompts: bool = False) -> None:
+        """Compile every registered graph eagerly.
+
+        With *prompts* set, each graph's prompt is fetched once as well so the
+        prompt provider's cache is populated before the first run.
+        """
+        for agent_id in self._graphs:
+            await self.get(agent_id)
+            if prompts:
+                try:
+                    await asyncio.to_thread(self._instance(agent_id).load_prompt)
+                except Exception as e:
+                    logger.warning(f"Failed to warm prompt for '{agent_id}': {e}")
@@ -1,5 +1,9 @@
-from .agent_service import AgentService
+from .agent_service import AgentService, RunFailedError
+from .feedback import FEEDBACK_QUEUE, feedback_handler
 
 __all__ = [
     "AgentService",
+    "FEEDBACK_QUEUE",
+    "RunFailedError",
+    "feedback_handler",
 ]
@@ -1,93 +1,324 @@
+import asyncio
 import json
 import logging
 from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
 from typing import Any
-from uuid import uuid4
+from uuid import UUID, uuid4
 
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    ToolCall,
+    ToolMessage,
+)
 from langchain_core.runnables import RunnableConfig
 from langfuse import Langfuse  # type: ignore[attr-defined]
 from langfuse.langchain import CallbackHandler
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph.state import CompiledStateGraph
 
 from app.agent.services.events import EndEvent, ErrorEvent
 from app.agent.services.events.base_event import BaseEvent
+from app.agent.services.feedback import FEEDBACK_QUEUE, record_feedback
 from app.agent.services.stream_processor import StreamProcessor
-from app.agent.langgraph.utils import to_chat_message
+from app.agent.langgraph.checkpoint.base import BufferedCheckpointSaver
+from app.agent.langgraph.checkpoint.projection import aget_projection, project_values
+from app.agent.langgraph.utils import concat_text, to_chat_message
+from app.infrastructure.jobs import JobQueue
+from app.infrastructure.ratelimit import RateLimiter
 from app.models import Thread, User
 from app.models.thread import ThreadStatus
+from app.repositories import IndexedMessage, MessageSearchIndex, ThreadRepository
 
 logger = logging.getLogger(__name__)
 
 
+class RunFailedError(Exception):
+    """Raised by :meth:`AgentService.run` when the graph fails mid-run."""
+
+
+def _total_tokens(message: BaseMessage) -> int:
+    if isinstance(message, AIMessage) and message.usage_metadata:
+        return message.usage_metadata.get("total_tokens", 0)
+    return 0
+
+
+def _messages_after(
+    messages: list[BaseMessage], human: BaseMessage
+) -> list[BaseMessage]:
+    """Return the messages the run appended after its *human* input."""
+    for position in range(len(messages) - 1, -1, -1):
+        if messages[position].id == human.id:
+            return messages[position + 1 :]
+    return []
+
+
+def _unanswered_tool_calls(messages: list[BaseMessage]) -> list[ToolCall]:
+    """Return the tool calls of the last AI message that no tool message answers."""
+    answered = set()
+    for message in reversed(messages):
+        if isinstance(message, ToolMessage):
+            answered.add(message.tool_call_id)
+        elif isinstance(message, AIMessage):
+            return [call for call in message.tool_calls if call["id"] not in answered]
+        else:
+            break
+    return []
+
+
+def _to_payload(message: BaseMessage, run_id: UUID, trace_id: str) -> dict[str, Any]:
+    chat = to_chat_message(
+        message, trace_id=trace_id if isinstance(message, AIMessage) else None
+    )
+    chat.run_id = str(run_id)
+    return chat.model_dump()
+
+
 class AgentService:
-    def __init__(self, agent: CompiledStateGraph[Any, Any, Any], langfuse: Langfuse):
+    def __init__(
+        self,
+        graph: CompiledStateGraph[Any, Any, Any],
+        langfuse: Langfuse,
+        threads: ThreadRepository | None = None,
+        search_index: MessageSearchIndex | None = None,
+        rate_limiter: RateLimiter | None = None,
+        jobs: JobQueue | None = None,
+    ):
         self.langfuse = langfuse
-        self.agent = agent
+        self.graph = graph
+        self.threads = threads
+        self.search_index = search_index
+        self.rate_limiter = rate_limiter
+        self.jobs = jobs
         self.stream_processor = StreamProcessor()
 
+    def _set_status(self, thread: Thread, status: ThreadStatus) -> None:
+        thread.status = status
+        thread.updated_at = datetime.now(UTC)
+        if self.threads is not None:
+            self.threads.save_status(thread)
+
+    def _index_message(self, thread: Thread, message: BaseMessage) -> None:
+        """Make the text of a human or final AI message searchable."""
+        if self.search_index is None or not message.id:
+            return
+        if not isinstance(message, HumanMessage | AIMessage):
+            return
+        content = concat_text(message.content)
+        if not content.strip():
+            return
+        self.search_index.add(
+            IndexedMessage(
+                thread_id=thread.id,
+                message_id=message.id,
+                user_id=thread.user_id,
+                role=message.type,
+                content=content,
+            )
+        )
+
+    def _start_run(
+        self, message: str, thread: Thread, user: User, run_id: UUID, trace_id: str
+    ) -> tuple[dict[str, Any], RunnableConfig]:
+        """Mark *thread* busy and build the graph input and config of a run."""
+        self._set_status(thread, ThreadStatus.busy)
+
+        human = HumanMessage(content=message, id=str(uuid4()))
+        self._index_message(thread, human)
+        inputs = {
+            "messages": [human],
+        }
+
+        config = RunnableConfig(
+            configurable={
+                "thread_id": thread.id,
+                "user_id": user.id,
+            },
+            metadata={
+                "langfuse_session_id": str(thread.id),
+                "langfuse_user_id": str(user.id),
+                "langfuse_tags": ["production", "chat-bot"],
+                "trace_id": trace_id,
+            },
+            run_id=run_id,
+            callbacks=[CallbackHandler()],
+        )
+        return inputs, config
+
+    async def _finish_run(self, thread: Thread, user: User, used_tokens: int) -> None:
+        await self._flush_checkpoints(thread)
+        if self.rate_limiter is not None and used_tokens:
+            await self.rate_limiter.record_usage(
+                RateLimiter.principal(user.id), used_tokens
+            )
+
     async def stream_response(
-        self, message: str, thread: Thread, user: User
+        self, message: str, thread: Thread, user: User, run_id: UUID | None = None
     ) -> AsyncGenerator[dict[str, Any]]:
         with self.langfuse.start_as_current_span(
-            name=self.agent.name, input=message
+            name=self.graph.name, input=message
         ) as span:
-            run_id = uuid4()
-
-            thread.status = ThreadStatus.busy
-            thread.updated_at = datetime.now(UTC)
+            run_id = run_id or uuid4()
+            inputs, config = self._start_run(
+                message, thread, user, run_id, span.trace_id
+            )
 
-            inputs = {
-                "messages": [HumanMessage(content=message)],
-            }
+            used_tokens = 0
 
-            config = RunnableConfig(
-                configurable={
-                    "thread_id": thread.id,
-                    "user_id": user.id,
-                },
-                metadata={
-                    "langfuse_session_id": str(thread.id),
-                    "langfuse_user_id": str(user.id),
-                    "langfuse_tags": ["production", "chat-bot"],
-                    "trace_id": span.trace_id,
-                },
-                run_id=run_id,
-                callbacks=[CallbackHandler()],
-            )
+            def observe(message: BaseMessage) -> None:
+                nonlocal used_tokens
+                self._index_message(thread, message)
+                used_tokens += _total_tokens(message)
 
             try:
-                stream = self.agent.astream(
+                stream = self.graph.astream(
                     inputs, stream_mode=["updates", "messages", "custom"], config=config
                 )
                 async for event in self.stream_processor.process_stream(
-                    stream, run_id, span # type: ignore[arg-type]
+                    stream,  # type: ignore[arg-type]
+                    run_id,
+                    span,
+                    observe,
                 ):
-                    thread.status = ThreadStatus.idle
                     yield event.model_dump()
+                self._set_status(thread, ThreadStatus.idle)
+            except asyncio.CancelledError:
+                self._set_status(thread, ThreadStatus.interrupted)
+                await asyncio.shield(self._close_tool_calls(thread, user))
+                raise
             except Exception as e:
-                thread.status = ThreadStatus.error
+                self._set_status(thread, ThreadStatus.error)
                 yield ErrorEvent(
                     data=json.dumps({"run_id": str(run_id), "content": str(e)})
                 ).model_dump()
+            finally:
+                await self._finish_run(thread, user, used_tokens)
+
+    async def run(
+        self, message: str, thread: Thread, user: User, run_id: UUID | None = None
+    ) -> list[dict[str, Any]]:
+        """Execute a run to completion and return the messages it produced.
+
+        The graph is invoked instead of streamed: the model is not asked to
+        stream and no events are built, only the produced messages are
+        converted once at the end.
+        """
+        with self.langfuse.start_as_current_span(
+            name=self.graph.name, input=message
+        ) as span:
+            run_id = run_id or uuid4()
+            inputs, config = self._start_run(
+                message, thread, user, run_id, span.trace_id
+            )
+
+            produced: list[BaseMessage] = []
+            try:
+                state = await self.graph.ainvoke(inputs, config=config)
+                produced = _messages_after(
+                    state.get("messages", []), inputs["messages"][0]
+                )
+                for produced_message in produced:
+                    self._index_message(thread, produced_message)
+                self._set_status(thread, ThreadStatus.idle)
+            except asyncio.CancelledError:
+                self._set_status(thread, ThreadStatus.interrupted)
+                await asyncio.shield(self._close_tool_calls(thread, user))
+                raise
+            except Exception as e:
+                self._set_status(thread, ThreadStatus.error)
+                raise RunFailedError(str(e)) from e
+            finally:
+                await self._finish_run(
+                    thread, user, sum(_total_tokens(m) for m in produced)
+                )
+
+            span.update(output=produced)
+            return [_to_payload(m, run_id, span.trace_id) for m in produced]
+
+    async def _close_tool_calls(self, thread: Thread, user: User) -> None:
+        """Answer the tool calls a cancelled run left without results.
+
+        The checkpoint of a run cancelled between the model and its tools
+        ends with tool calls nobody answered, and providers refuse such a
+        history on the next run. The answers are written as if the pending
+        node had produced them, so the graph continues from there.
+        """
+        config = RunnableConfig(
+            configurable={"thread_id": thread.id, "user_id": user.id}
+        )
+        try:
+            state = await self.graph.aget_state(config)
+            unanswered = _unanswered_tool_calls(state.values.get("messages", []))
+            if not unanswered:
+                return
+
+            await self.graph.aupdate_state(
+                config,
+                {
+                    "messages": [
+                        ToolMessage(
+                            content="The run was cancelled before the tool returned.",
+                            tool_call_id=call["id"],
+                            name=call["name"],
+                            status="error",
+                        )
+                        for call in unanswered
+                    ]
+                },
+                as_node=state.next[0] if state.next else None,
+            )
+        except Exception as e:
+            logger.error(f"Failed to close tool calls of thread {thread.id}: {e}")
+
+    async def _flush_checkpoints(self, thread: Thread) -> None:
+        """Persist checkpoints a write-behind checkpointer still buffers."""
+        checkpointer = self.graph.checkpointer
+        if isinstance(checkpointer, BufferedCheckpointSaver):
+            try:
+                await checkpointer.aflush(thread.id)
+            except Exception as e:
+                logger.error(f"Failed to flush checkpoints for {thread.id}: {e}")
+
+    async def _load_channels(
+        self,
+        config: RunnableConfig,
+        channels: list[str],
+        limit: int | None = None,
+        skip: int = 0,
+    ) -> dict[str, Any]:
+        """Read *channels* of the thread's state and a page of its messages."""
+        checkpointer = self.graph.checkpointer
+        if isinstance(checkpointer, BaseCheckpointSaver):
+            projection = await aget_projection(
+                checkpointer, config, channels, limit, skip
+            )
+            return projection.values if projection is not None else {}
+
+        state_snapshot = await self.graph.aget_state(config=config)
+        return project_values(
+            config, state_snapshot.values, channels, limit, skip
+        ).values
 
     async def load_history(
-        self, thread: Thread, user: User
+        self, thread: Thread, user: User, limit: int | None = None, skip: int = 0
     ) -> AsyncGenerator[dict[str, Any]]:
         try:
-            state_snapshot = await self.agent.aget_state(
-                config=RunnableConfig(
+            values = await self._load_channels(
+                RunnableConfig(
                     configurable={"thread_id": thread.id, "user_id": user.id}
                 ),
+                ["messages", "message_trace_map"],
+                limit,
+                skip,
             )
 
             trace_by_id = {
-                m["id"]: m["trace_id"]
-                for m in state_snapshot.values.get("message_trace_map", [])
+                m["id"]: m["trace_id"] for m in values.get("message_trace_map", [])
             }
 
-            messages = state_snapshot.values.get("messages", [])
+            messages = values.get("messages", [])
             if not messages:
                 yield EndEvent(data=json.dumps({"status": "completed"})).model_dump()
                 return
@@ -112,18 +343,13 @@ class AgentService:
     async def add_feedback(
         self, trace: str, feedback: float, thread: Thread, user: User
     ) -> dict[str, str]:
+        """Score *trace*, through the job queue when there is one."""
+        payload = {"trace_id": trace, "value": feedback, "user_id": str(user.id)}
         try:
-            self.langfuse.create_score(
-                trace_id=trace,
-                name="user_feedback",
-                value=feedback,
-                data_type="NUMERIC",
-                # session_id=thread.id, # Bug in Langfuse SDK, session_id is broken
-                comment="User feedback on the response",
-                metadata={
-                    "langfuse_user_id": str(user.id),
-                },
-            )
+            if self.jobs is not None:
+                await self.jobs.enqueue(FEEDBACK_QUEUE, payload)
+            else:
+                record_feedback(self.langfuse, payload)
             thread.updated_at = datetime.now(UTC)
             return {"status": "success", "message": "Feedback recorded successfully."}
         except Exception as e:
@@ -0,0 +1,32 @@
+import asyncio
+from typing import Any
+
+from langfuse import Langfuse
+
+from app.infrastructure.jobs import JobHandler
+
+FEEDBACK_QUEUE = "feedback"
+
+
+def record_feedback(langfuse: Langfuse, payload: dict[str, Any]) -> None:
+    """Send a user's score of a trace to Langfuse."""
+    langfuse.create_score(
+        trace_id=payload["trace_id"],
+        name="user_feedback",
+        value=payload["value"],
+        data_type="NUMERIC",
+        # session_id=thread.id, # Bug in Langfuse SDK, session_id is broken
+        comment="User feedback on the response",
+        metadata={
+            "langfuse_user_id": payload["user_id"],
+        },
+    )
+
+
+def feedback_handler(langfuse: Langfuse) -> JobHandler:
+    """Job handler for :data:`FEEDBACK_QUEUE`; the Langfuse call runs in a thread."""
+
+    async def handle(payload: dict[str, Any]) -> None:
+        await asyncio.to_thread(record_feedback, langfuse, payload)
+
+    return handle
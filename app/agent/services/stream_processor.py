@@ -8,7 +8,7 @@ from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
 from langfuse._client.span import LangfuseSpan
 
 from app.agent.models import AIMessage as CustomAIMessage
@@ -58,6 +58,7 @@ class StreamProcessor:
         messages: list[Any],
         run_id: UUID,
         span: LangfuseSpan | None,
+        on_message: Callable[[BaseMessage], None] | None = None,
     ) -> list[BaseEvent]:
         consolidated: list[Any] = []
         current: dict[str, Any] = {}
@@ -79,6 +80,8 @@ class StreamProcessor:
 
         events: list[BaseEvent] = []
         for message in consolidated:
+            if on_message is not None and isinstance(message, BaseMessage):
+                on_message(message)
             try:
                 chat = to_chat_message(message)
                 chat.run_id = str(run_id)
@@ -133,7 +136,12 @@ class StreamProcessor:
         stream: AsyncGenerator[tuple[str, Any]],
         run_id: UUID,
         span: LangfuseSpan | None = None,
+        on_message: Callable[[BaseMessage], None] | None = None,
     ) -> AsyncGenerator[BaseEvent]:
+        """Turn graph stream chunks into events.
+
+        *on_message* is called with every complete message a node emits.
+        """
         strategy: dict[StreamMode, Callable[[Any], Iterable[list[Any]]]] = {
             StreamMode.UPDATES: lambda payload: [self._flatten_updates(payload)],
             StreamMode.CUSTOM: lambda payload: [self._wrap_as_list(payload)],
@@ -157,7 +165,7 @@ class StreamProcessor:
                 if not messages:
                     continue
 
-                events = self._messages_to_events(messages, run_id, span)
+                events = self._messages_to_events(messages, run_id, span, on_message)
                 if span:
                     span.update(output=messages)
 
@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from uuid import uuid4
 
 from asgi_correlation_id import CorrelationIdMiddleware
@@ -8,20 +10,36 @@ from fastapi.staticfiles import StaticFiles
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from app.http.middleware.cors_middleware import CORSConfig, setup_cors_middleware
+from app.http.middleware.rate_limit_middleware import setup_rate_limit_middleware
 from app.utils.utils import is_valid_uuid4
 
-from ..http.routes import health_router, runs_router, thread_router
+from ..http.routes import auth_router, health_router, runs_router, thread_router
 from .config import AppConfig
+from .container import Container
 
 
 def create_app(config: AppConfig) -> FastAPI:
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        container = Container(config)
+        app.state.container = container
+        await container.startup()
+        try:
+            yield
+        finally:
+            await container.shutdown()
+
     app = FastAPI(
         title="Raw LangGraph",
         description="A test application",
         version="0.0.1",
         debug=config.debug,
+        lifespan=lifespan,
     )
 
+    if config.rate_limit_enabled:
+        setup_rate_limit_middleware(app)
+
     cors_config = CORSConfig(
         allow_origins=config.cors_origins,
         allow_credentials=config.cors_allow_credentials,
@@ -42,6 +60,8 @@ def create_app(config: AppConfig) -> FastAPI:
     app.include_router(runs_router, prefix="/api/v1")
     app.include_router(thread_router, prefix="/api/v1")
     app.include_router(health_router, prefix="/api/v1")
+    if config.auth_dev_tokens:
+        app.include_router(auth_router, prefix="/api/v1")
 
     # FastAPIInstrumentor.instrument_app(app, excluded_urls="/api/v1/health*,/docs,/metrics,/openapi.json")
     Instrumentator(
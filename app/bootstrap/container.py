@@ -0,0 +1,263 @@
+import asyncio
+import logging
+from typing import TypeVar
+
+from langfuse import Langfuse
+
+from app.agent.langgraph import GraphRegistry
+from app.agent.langgraph.agents import AGENTS
+from app.agent.langgraph.checkpoint.base import BaseCheckpointer
+from app.agent.langgraph.checkpoint.factory import CheckpointerFactory
+from app.agent.prompt import LangfusePromptProvider, PromptProvider
+from app.agent.services import FEEDBACK_QUEUE, feedback_handler
+from app.bootstrap.config import AppConfig
+from app.http.controllers import ThreadController
+from app.infrastructure.admission import AdmissionController
+from app.infrastructure.auth import Authenticator
+from app.infrastructure.cancellation import RunCanceller, RunCancellerFactory
+from app.infrastructure.database.connection import (
+    DatabaseConnection,
+    DatabaseConnectionFactory,
+)
+from app.infrastructure.database.notifications import NotificationListener
+from app.infrastructure.idempotency import IdempotencyStore, IdempotencyStoreFactory
+from app.infrastructure.jobs import JobQueue, JobQueueFactory
+from app.infrastructure.locks import RunLock, RunLockFactory, RunLockPolicy
+from app.infrastructure.ratelimit import RateLimiter, RateLimiterFactory
+from app.infrastructure.streams import RunEventBroker, RunEventBrokerFactory
+from app.repositories import (
+    MessageSearchIndex,
+    MessageSearchIndexFactory,
+    ThreadRepository,
+    ThreadRepositoryFactory,
+    UserRepository,
+    UserRepositoryFactory,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Container:
+    """Process-wide services shared by every route.
+
+    Built once in the FastAPI lifespan: ``startup`` opens the database pool,
+    initializes the checkpointer, compiles every registered graph and warms
+    the prompt cache before the application starts accepting requests.
+    """
+
+    def __init__(self, config: AppConfig):
+        self.config = config
+        self._lock = asyncio.Lock()
+        self._ready = False
+
+        self._langfuse: Langfuse | None = None
+        self._user_repository: UserRepository | None = None
+        self._authenticator: Authenticator | None = None
+        self._rate_limiter: RateLimiter | None = None
+        self._database_connection: DatabaseConnection | None = None
+        self._listener: NotificationListener | None = None
+        self._checkpointer_provider: BaseCheckpointer | None = None
+        self._prompt_provider: PromptProvider | None = None
+        self._registry: GraphRegistry | None = None
+        self._run_lock: RunLock | None = None
+        self._admission: AdmissionController | None = None
+        self._broker: RunEventBroker | None = None
+        self._canceller: RunCanceller | None = None
+        self._jobs: JobQueue | None = None
+        self._thread_repository: ThreadRepository | None = None
+        self._search_index: MessageSearchIndex | None = None
+        self._idempotency: IdempotencyStore | None = None
+        self._thread_controller: ThreadController | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    @property
+    def langfuse(self) -> Langfuse:
+        return self._require(self._langfuse)
+
+    @property
+    def user_repository(self) -> UserRepository:
+        return self._require(self._user_repository)
+
+    @property
+    def authenticator(self) -> Authenticator:
+        return self._require(self._authenticator)
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self._require(self._rate_limiter)
+
+    @property
+    def database_connection(self) -> DatabaseConnection | None:
+        return self._database_connection
+
+    @property
+    def registry(self) -> GraphRegistry:
+        return self._require(self._registry)
+
+    @property
+    def thread_repository(self) -> ThreadRepository:
+        return self._require(self._thread_repository)
+
+    @property
+    def thread_controller(self) -> ThreadController:
+        return self._require(self._thread_controller)
+
+    def _require(self, service: T | None) -> T:
+        if service is None:
+            raise RuntimeError("Container has not been started.")
+        return service
+
+    async def startup(self) -> None:
+        async with self._lock:
+            if self._ready:
+                return
+
+            self._langfuse = Langfuse(debug=False)
+
+            if self.config.postgres_enabled:
+                self._database_connection = DatabaseConnectionFactory.create_connection(
+                    self.config
+                )
+                self._listener = NotificationListener(self._database_connection)
+
+            self._user_repository = UserRepositoryFactory.create(
+                self.config, self._database_connection
+            )
+            await self._user_repository.start()
+            self._authenticator = Authenticator(
+                self.config.secret_key,
+                self._user_repository.get,
+                cache_size=self.config.auth_cache_size,
+                cache_ttl=self.config.auth_cache_ttl,
+                leeway=self.config.auth_leeway,
+            )
+            self._rate_limiter = RateLimiterFactory.create(
+                self.config, self._database_connection
+            )
+            await self._rate_limiter.start()
+
+            self._checkpointer_provider = await CheckpointerFactory.create(
+                self.config, self._database_connection
+            )
+            checkpointer = await self._checkpointer_provider.get_checkpointer()
+
+            self._prompt_provider = LangfusePromptProvider(self._langfuse)
+            self._registry = GraphRegistry(
+                checkpointer,
+                self._prompt_provider,
+                AGENTS,
+                self.config.default_agent_id,
+            )
+            await self._registry.warmup(prompts=True)
+
+            self._run_lock = RunLockFactory.create(self._database_connection)
+            self._admission = AdmissionController(
+                max_concurrency=self.config.admission_max_concurrency,
+                min_concurrency=self.config.admission_min_concurrency,
+                max_queue=self.config.admission_max_queue,
+                queue_timeout=self.config.admission_queue_timeout,
+                lag_threshold=self.config.admission_lag_threshold,
+                saturation_threshold=self.config.admission_saturation_threshold,
+                shed_status_code=self.config.admission_shed_status_code,
+                tenant_weights=self.config.admission_tenant_weights,
+                max_queue_per_tenant=self.config.admission_max_queue_per_tenant,
+                saturation_probe=(
+                    self._database_connection.get_pool_saturation
+                    if self._database_connection is not None
+                    else None
+                ),
+            )
+            await self._admission.start()
+
+            self._broker = RunEventBrokerFactory.create(
+                self.config, self._database_connection, self._listener
+            )
+            await self._broker.start()
+            self._canceller = RunCancellerFactory.create(
+                self._database_connection, self._listener, self._broker
+            )
+            await self._canceller.start()
+            self._jobs = JobQueueFactory.create(
+                self.config, self._database_connection, self._listener
+            )
+            self._jobs.register(FEEDBACK_QUEUE, feedback_handler(self._langfuse))
+            await self._jobs.start()
+            if self._listener is not None:
+                await self._listener.start()
+
+            self._thread_repository = ThreadRepositoryFactory.create(
+                self.config, self._database_connection
+            )
+            await self._thread_repository.start()
+            self._search_index = MessageSearchIndexFactory.create(
+                self.config, self._database_connection
+            )
+            await self._search_index.start()
+            self._idempotency = IdempotencyStoreFactory.create(
+                self.config, self._database_connection
+            )
+            await self._idempotency.start()
+
+            self._thread_controller = ThreadController(
+                self._registry,
+                self._langfuse,
+                self._run_lock,
+                self._admission,
+                self._broker,
+                self._thread_repository,
+                self._search_index,
+                self._rate_limiter,
+                self._idempotency,
+                self._canceller,
+                self._jobs,
+                RunLockPolicy(self.config.run_lock_policy),
+                self.config.run_lock_timeout,
+                self.config.batch_max_concurrency,
+                self.config.batch_max_runs,
+                self.config.run_wait_timeout,
+            )
+
+            self._ready = True
+            logger.info(
+                f"Container ready with agents: {', '.join(self._registry.agent_ids)}"
+            )
+
+    async def shutdown(self) -> None:
+        async with self._lock:
+            self._ready = False
+
+            if self._admission is not None:
+                await self._admission.stop()
+            if self._run_lock is not None:
+                await self._run_lock.cleanup()
+            if self._broker is not None:
+                await self._broker.cleanup()
+            if self._listener is not None:
+                await self._listener.stop()
+            if self._canceller is not None:
+                await self._canceller.cleanup()
+            if self._jobs is not None:
+                await self._jobs.cleanup()
+            if self._thread_repository is not None:
+                await self._thread_repository.cleanup()
+            if self._search_index is not None:
+                await self._search_index.cleanup()
+            if self._idempotency is not None:
+                await self._idempotency.cleanup()
+            if self._user_repository is not None:
+                await self._user_repository.cleanup()
+            if self._rate_limiter is not None:
+                await self._rate_limiter.cleanup()
+            if self._checkpointer_provider is not None:
+                await self._checkpointer_provider.cleanup()
+            if self._database_connection is not None:
+                await self._database_connection.close()
+            if self._langfuse is not None:
+                self._langfuse.shutdown()
+
+            logger.info("Container shut down")
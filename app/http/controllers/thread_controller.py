@@ -1,45 +1,202 @@
+import asyncio
+import json
 import logging
+from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack, aclosing
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from fastapi import Depends, HTTPException
+from fastapi import HTTPException
 from langfuse import Langfuse  # type: ignore[attr-defined]
-from langgraph.graph.state import CompiledStateGraph
 from sse_starlette.sse import EventSourceResponse
+from starlette.background import BackgroundTask
+from starlette.responses import JSONResponse, StreamingResponse
 
-from app.agent.langgraph.checkpoint.factory import CheckpointerFactory
-from app.agent.langgraph.demo.demo_graph import DemoGraph
-from app.agent.prompt import LangfusePromptProvider
-from app.agent.services import AgentService
-from app.bootstrap.config import AppConfig
-from app.http.requests import FeedbackRequest
+from app.agent.langgraph import GraphRegistry, UnknownAgentError
+from app.agent.langgraph.checkpoint import afork
+from app.agent.services import AgentService, RunFailedError
+from app.agent.services.events import ErrorEvent
+from app.http.requests import BatchRunItem, FeedbackRequest, ForkThread
+from app.infrastructure.admission import (
+    DEFAULT_TENANT,
+    AdmissionController,
+    AdmissionRejectedError,
+)
+from app.infrastructure.cancellation import RunCanceller
+from app.infrastructure.idempotency import (
+    IdempotencyRecord,
+    IdempotencyStore,
+    fingerprint,
+)
+from app.infrastructure.jobs import JobQueue
+from app.infrastructure.locks import (
+    RunConflictError,
+    RunLease,
+    RunLock,
+    RunLockPolicy,
+)
+from app.infrastructure.ratelimit import RateLimiter
+from app.infrastructure.streams import RunEventBroker
 from app.models import Thread, User
-from app.repositories import ThreadRepository, UserRepository
+from app.repositories import (
+    InvalidCursorError,
+    MessageSearchIndex,
+    ThreadPage,
+    ThreadRepository,
+    ThreadSearchPage,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class ThreadController:
-    def __init__(self, config: AppConfig):
-        self.config = config
-        self._checkpointer_provider: CheckpointerFactory | None = None
-        self._graph: CompiledStateGraph[Any, Any, Any] | None = None
-        self._agent_service: AgentService | None = None
-        self._langfuse: Langfuse | None = None
-
-    async def _initialize(self) -> None:
-        if self._graph is None:
-            self._langfuse = Langfuse(debug=False)
-
-            if self._checkpointer_provider is None:
-                self._checkpointer_provider = await CheckpointerFactory.create(
-                    self.config
-                )  # type: ignore[assignment]
-
-            checkpointer = await self._checkpointer_provider.get_checkpointer()  # type: ignore[union-attr]
-            prompt_provider = LangfusePromptProvider(self._langfuse)
-            self._graph = DemoGraph(checkpointer, prompt_provider).build_graph()
-            self._agent_service = AgentService(self._graph, self._langfuse)
+    def __init__(
+        self,
+        registry: GraphRegistry,
+        langfuse: Langfuse,
+        run_lock: RunLock,
+        admission: AdmissionController,
+        broker: RunEventBroker,
+        threads: ThreadRepository,
+        search_index: MessageSearchIndex,
+        rate_limiter: RateLimiter,
+        idempotency: IdempotencyStore,
+        canceller: RunCanceller,
+        jobs: JobQueue,
+        run_lock_policy: RunLockPolicy = RunLockPolicy.reject,
+        run_lock_timeout: float | None = None,
+        batch_concurrency: int = 8,
+        batch_max_runs: int = 1000,
+        wait_timeout: float = 300.0,
+    ):
+        self._registry = registry
+        self._langfuse = langfuse
+        self._run_lock = run_lock
+        self._admission = admission
+        self._broker = broker
+        self._threads = threads
+        self._search_index = search_index
+        self._rate_limiter = rate_limiter
+        self._idempotency = idempotency
+        self._canceller = canceller
+        self._jobs = jobs
+        self._run_lock_policy = run_lock_policy
+        self._run_lock_timeout = run_lock_timeout
+        self._batch_concurrency = batch_concurrency
+        self._batch_max_runs = batch_max_runs
+        self._wait_timeout = wait_timeout
+        self._background_runs: set[asyncio.Task[None]] = set()
+        self._agent_services: dict[str, AgentService] = {}
+
+    async def _get_agent_service(self, agent_id: str | None) -> AgentService:
+        try:
+            resolved = self._registry.resolve(agent_id)
+        except UnknownAgentError as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
+
+        service = self._agent_services.get(resolved)
+        if service is None:
+            graph = await self._registry.get(resolved)
+            service = AgentService(
+                graph,
+                self._langfuse,
+                self._threads,
+                self._search_index,
+                self._rate_limiter,
+                self._jobs,
+            )
+            self._agent_services[resolved] = service
+
+        return service
+
+    async def _acquire_run(
+        self, thread: Thread, multitask_strategy: str | None
+    ) -> RunLease:
+        policy = RunLockPolicy(multitask_strategy or self._run_lock_policy)
+        try:
+            return await self._run_lock.acquire(
+                thread.id, policy, self._run_lock_timeout
+            )
+        except RunConflictError as e:
+            raise HTTPException(status_code=409, detail=str(e)) from e
+
+    async def _admit_run(
+        self, thread: Thread, multitask_strategy: str | None, run_id: UUID
+    ) -> tuple[RunLease, AsyncExitStack]:
+        """Take the thread's run lease, then a global execution slot.
+
+        Returns the lease together with a stack that releases both. Until
+        then the run can be cancelled through ``cancel_run``.
+        """
+        resources = AsyncExitStack()
+        lease = await self._acquire_run(thread, multitask_strategy)
+        resources.push_async_callback(lease.release)
+
+        try:
+            ticket = await self._admission.admit(thread.user_id or DEFAULT_TENANT)
+        except AdmissionRejectedError as e:
+            await resources.aclose()
+            raise HTTPException(
+                status_code=e.status_code,
+                detail=str(e),
+                headers={"Retry-After": str(e.retry_after)},
+            ) from e
+        except BaseException:
+            await resources.aclose()
+            raise
+
+        resources.push_async_callback(ticket.release)
+        self._canceller.track(str(run_id), lease)
+        resources.callback(self._canceller.untrack, str(run_id))
+        return lease, resources
+
+    async def _run_guarded(
+        self,
+        events: AsyncGenerator[dict[str, Any]],
+        run_id: str,
+        lease: RunLease,
+        resources: AsyncExitStack,
+    ) -> AsyncGenerator[dict[str, Any]]:
+        """Execute *events* in a task owned by *lease* and relay them to the client.
+
+        The run gets its own task so that a newer run on the same thread can
+        interrupt it without tearing down the SSE response that relays it.
+        Every event is published to the broker first, so clients joining
+        through ``join_stream`` see the same ids.
+        """
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+
+        async def publish(event: dict[str, Any]) -> dict[str, Any]:
+            seq = await self._broker.publish(run_id, event)
+            return {**event, "id": str(seq)}
+
+        async def pump() -> None:
+            try:
+                async with aclosing(events):
+                    async for event in events:
+                        queue.put_nowait(await publish(event))
+            finally:
+                queue.put_nowait(None)
+
+        task = asyncio.create_task(pump())
+        lease.attach(task)
+        try:
+            while (event := await queue.get()) is not None:
+                yield event
+
+            if lease.interrupted:
+                yield await publish(
+                    ErrorEvent(
+                        data=json.dumps({"content": lease.interrupt_reason})
+                    ).model_dump()
+                )
+            else:
+                await task
+        finally:
+            if not task.done():
+                task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            await resources.aclose()
 
     async def stream(
         self,
@@ -47,36 +204,447 @@ class ThreadController:
         thread_id: UUID | None,
         metadata: dict[str, Any] | None,
         user: User,
+        agent_id: str | None = None,
+        multitask_strategy: str | None = None,
+        idempotency_key: str | None = None,
+        last_event_id: str | None = None,
+    ) -> EventSourceResponse:
+        """Start a run and stream its events.
+
+        A request carrying an *idempotency_key* that already started a run
+        does not execute again: it follows that run from the broker instead,
+        replaying it from the start or after *last_event_id*.
+        """
+        thread_key = str(thread_id or uuid4())
+        run_id = uuid4()
+        if idempotency_key is None:
+            return await self._start_stream(
+                query, thread_key, metadata, user, agent_id, multitask_strategy, run_id
+            )
+
+        request_fingerprint = fingerprint(query, thread_id, metadata, agent_id)
+        record = await self._idempotency.claim(
+            user.id,
+            idempotency_key,
+            IdempotencyRecord(thread_key, str(run_id), request_fingerprint),
+        )
+        if record.run_id != str(run_id):
+            return await self._join_claimed_run(
+                record, request_fingerprint, user, last_event_id
+            )
+
+        try:
+            return await self._start_stream(
+                query, thread_key, metadata, user, agent_id, multitask_strategy, run_id
+            )
+        except BaseException:
+            # The run never started, so a retry may start it.
+            await self._idempotency.release(user.id, idempotency_key, str(run_id))
+            raise
+
+    async def _start_stream(
+        self,
+        query: dict[str, Any] | list[Any] | str | float | bool | None,
+        thread_id: str,
+        metadata: dict[str, Any] | None,
+        user: User,
+        agent_id: str | None,
+        multitask_strategy: str | None,
+        run_id: UUID,
     ) -> EventSourceResponse:
-        thread = await ThreadRepository.get_thread_by_id(str(thread_id))
+        thread = await self._threads.get_or_create(thread_id, user, metadata)
+        if thread is None:
+            raise HTTPException(status_code=404, detail=f"Thread {thread_id} not found")
+        agent_service = await self._get_agent_service(agent_id)
+        lease, resources = await self._admit_run(thread, multitask_strategy, run_id)
 
         try:
-            await self._initialize()
             logger.debug(f"Received chat request: {str(query)[:50]}...")
 
+            await self._broker.open(thread.id, str(run_id))
+            resources.push_async_callback(self._broker.finish, str(run_id))
+
             return EventSourceResponse(
-                self._agent_service.stream_response(str(query), thread, user),  # type: ignore[union-attr]
+                self._run_guarded(
+                    agent_service.stream_response(str(query), thread, user, run_id),
+                    str(run_id),
+                    lease,
+                    resources,
+                ),
                 headers={
+                    "X-Thread-Id": thread.id,
+                    "X-Run-Id": str(run_id),
                     "Cache-Control": "no-cache",
                     "Connection": "keep-alive",
                     "Access-Control-Allow-Origin": "*",
                     "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
                     "Access-Control-Allow-Headers": "Content-Type, Authorization",
                 },
+                background=BackgroundTask(resources.aclose),
             )
         except Exception as e:
+            await resources.aclose()
             logger.error(f"Error processing thread request: {str(e)}")
             raise HTTPException(status_code=500, detail="Internal server error") from e
 
+    async def _join_claimed_run(
+        self,
+        record: IdempotencyRecord,
+        request_fingerprint: str,
+        user: User,
+        last_event_id: str | None,
+    ) -> EventSourceResponse:
+        if record.fingerprint != request_fingerprint:
+            raise HTTPException(
+                status_code=422,
+                detail="Idempotency-Key was already used for a different request",
+            )
+        thread = await self._threads.get_for_user(record.thread_id, user)
+        if thread is None or not await self._broker.exists(
+            record.thread_id, record.run_id
+        ):
+            # Claimed by a request still waiting for its lease or admission.
+            raise HTTPException(
+                status_code=409,
+                detail="The run for this Idempotency-Key has not started yet",
+                headers={"Retry-After": "1"},
+            )
+        logger.debug(f"Replaying run {record.run_id} for a repeated request")
+        return await self.join_stream(thread, UUID(record.run_id), last_event_id)
+
+    async def wait(
+        self,
+        query: dict[str, Any] | list[Any] | str | float | bool | None,
+        thread_id: UUID | None,
+        metadata: dict[str, Any] | None,
+        user: User,
+        agent_id: str | None = None,
+        multitask_strategy: str | None = None,
+        timeout: float | None = None,
+    ) -> JSONResponse:
+        """Execute a run and answer with the messages it produced.
+
+        The run gets its own task, so neither the *timeout* (capped by the
+        service limit) nor a client that goes away cancels it: the caller
+        then gets 202 with the run's ids and reads the outcome from the
+        thread's history.
+        """
+        thread = await self._threads.get_or_create(
+            str(thread_id or uuid4()), user, metadata
+        )
+        if thread is None:
+            raise HTTPException(status_code=404, detail=f"Thread {thread_id} not found")
+        agent_service = await self._get_agent_service(agent_id)
+        run_id = uuid4()
+        lease, resources = await self._admit_run(thread, multitask_strategy, run_id)
+        messages: list[dict[str, Any]] = []
+
+        async def execute() -> None:
+            async with resources:
+                # Attached once running: a task cancelled before its first
+                # step would never enter the block that releases the slots.
+                lease.attach(task)
+                messages.extend(
+                    await agent_service.run(str(query), thread, user, run_id)
+                )
+
+        task = asyncio.create_task(execute())
+        self._background_runs.add(task)
+        task.add_done_callback(self._forget_run)
+
+        result = {"thread_id": thread.id, "run_id": str(run_id)}
+        timeout = min(timeout or self._wait_timeout, self._wait_timeout)
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout)
+        except TimeoutError:
+            return JSONResponse({**result, "status": "pending"}, status_code=202)
+        except asyncio.CancelledError:
+            if not lease.interrupted:
+                raise
+            raise HTTPException(
+                status_code=409, detail=lease.interrupt_reason
+            ) from None
+        except RunFailedError as e:
+            raise HTTPException(status_code=500, detail=str(e)) from e
+
+        return JSONResponse({**result, "status": "success", "messages": messages})
+
+    def _forget_run(self, task: asyncio.Task[None]) -> None:
+        self._background_runs.discard(task)
+        if not task.cancelled() and (e := task.exception()) is not None:
+            logger.error(f"Run failed: {e}")
+
+    async def batch(
+        self,
+        runs: list[BatchRunItem],
+        user: User,
+        agent_id: str | None = None,
+        multitask_strategy: str | None = None,
+        concurrency: int | None = None,
+    ) -> StreamingResponse:
+        """Execute *runs* and stream one NDJSON result per run as each finishes.
+
+        At most *concurrency* runs (capped by the service limit) execute at
+        once; each still takes its thread's lease and an admission slot, so a
+        batch competes fairly with interactive runs. Every run of the batch
+        shares one agent service, and with it the compiled graph and model
+        clients. A failing run yields an error line and the rest carry on.
+        """
+        if len(runs) > self._batch_max_runs:
+            raise HTTPException(
+                status_code=413,
+                detail=f"A batch holds at most {self._batch_max_runs} runs",
+            )
+        agent_service = await self._get_agent_service(agent_id)
+        workers = min(concurrency or self._batch_concurrency, self._batch_concurrency)
+
+        async def lines() -> AsyncGenerator[str]:
+            results = self._run_batch(
+                runs, user, agent_service, multitask_strategy, workers
+            )
+            async with aclosing(results):
+                async for result in results:
+                    yield json.dumps(result) + "\n"
+
+        return StreamingResponse(
+            lines(),
+            media_type="application/x-ndjson",
+            headers={"Cache-Control": "no-cache"},
+        )
+
+    async def _run_batch(
+        self,
+        runs: list[BatchRunItem],
+        user: User,
+        agent_service: AgentService,
+        multitask_strategy: str | None,
+        workers: int,
+    ) -> AsyncGenerator[dict[str, Any]]:
+        """Yield the result of every run in completion order.
+
+        A fixed pool of *workers* pulls runs off a shared iterator, so a batch
+        of thousands holds *workers* tasks rather than one per run. Closing
+        the generator, e.g. when the client disconnects, cancels what is
+        still running.
+        """
+        pending = iter(enumerate(runs))
+        results: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+
+        async def work() -> None:
+            try:
+                for index, item in pending:
+                    results.put_nowait(
+                        await self._run_batch_item(
+                            index, item, user, agent_service, multitask_strategy
+                        )
+                    )
+            finally:
+                results.put_nowait(None)
+
+        tasks = [asyncio.create_task(work()) for _ in range(min(workers, len(runs)))]
+        try:
+            running = len(tasks)
+            while running:
+                if (result := await results.get()) is None:
+                    running -= 1
+                else:
+                    yield result
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run_batch_item(
+        self,
+        index: int,
+        item: BatchRunItem,
+        user: User,
+        agent_service: AgentService,
+        multitask_strategy: str | None,
+    ) -> dict[str, Any]:
+        thread_id = str(item.thread_id or uuid4())
+        run_id = uuid4()
+        result: dict[str, Any] = {
+            "index": index,
+            "thread_id": thread_id,
+            "run_id": str(run_id),
+        }
+
+        try:
+            thread = await self._threads.get_or_create(thread_id, user, item.metadata)
+            if thread is None:
+                raise HTTPException(
+                    status_code=404, detail=f"Thread {thread_id} not found"
+                )
+            lease, resources = await self._admit_run(thread, multitask_strategy, run_id)
+        except HTTPException as e:
+            return {**result, "status": "error", "error": e.detail}
+        except Exception as e:
+            logger.error(f"Failed to start batch run {run_id}: {e}")
+            return {**result, "status": "error", "error": "Internal server error"}
+
+        async with resources:
+            messages: list[dict[str, Any]] = []
+
+            async def execute() -> None:
+                messages.extend(
+                    await agent_service.run(str(item.input), thread, user, run_id)
+                )
+
+            # Own task, as in _run_guarded, so a newer run on the thread can
+            # interrupt this one without cancelling the worker.
+            task = asyncio.create_task(execute())
+            lease.attach(task)
+            try:
+                await task
+            except asyncio.CancelledError:
+                if not lease.interrupted:
+                    raise
+                return {
+                    **result,
+                    "status": "error",
+                    "error": lease.interrupt_reason,
+                }
+            except RunFailedError as e:
+                return {**result, "status": "error", "error": str(e)}
+            except Exception as e:
+                logger.error(f"Batch run {run_id} failed: {e}")
+                return {**result, "status": "error", "error": "Internal server error"}
+            finally:
+                if not task.done():
+                    task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+        return {**result, "status": "success", "messages": messages}
+
+    async def join_stream(
+        self, thread: Thread, run_id: UUID, last_event_id: str | None = None
+    ) -> EventSourceResponse:
+        """Follow a run's events from any worker, resuming after *last_event_id*."""
+        if not await self._broker.exists(thread.id, str(run_id)):
+            raise HTTPException(status_code=404, detail=f"Run {run_id} not found")
+
+        try:
+            after = int(last_event_id) if last_event_id else 0
+        except ValueError:
+            after = 0
+
+        async def events() -> AsyncGenerator[dict[str, Any]]:
+            async for seq, event in self._broker.subscribe(
+                thread.id, str(run_id), after
+            ):
+                yield {**event, "id": str(seq)}
+
+        return EventSourceResponse(
+            events(),
+            headers={
+                "X-Thread-Id": thread.id,
+                "X-Run-Id": str(run_id),
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "Access-Control-Allow-Origin": "*",
+                "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
+                "Access-Control-Allow-Headers": "Content-Type, Authorization",
+            },
+        )
+
+    async def cancel_run(self, thread: Thread, run_id: UUID) -> dict[str, str]:
+        """Stop a run of *thread* on whichever worker executes it.
+
+        The run's task is cancelled, which closes the model stream, records
+        the thread as interrupted and settles its checkpoint; its lease and
+        execution slot are released as it unwinds.
+        """
+        if not await self._canceller.cancel(thread.id, str(run_id)):
+            raise HTTPException(status_code=404, detail=f"Run {run_id} is not running")
+        logger.debug(f"Cancelling run {run_id} of thread {thread.id}")
+        return {"thread_id": thread.id, "run_id": str(run_id), "status": "cancelling"}
+
+    async def list_threads(
+        self, user: User, limit: int = 20, cursor: str | None = None
+    ) -> ThreadPage:
+        try:
+            return await self._threads.list(user.id, limit, cursor)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
+    async def search_threads(
+        self, user: User, query: str, limit: int = 20, skip: int = 0
+    ) -> ThreadSearchPage:
+        return await self._search_index.search(user.id, query, limit, skip)
+
+    async def delete_thread(self, thread: Thread) -> None:
+        """Remove *thread* with every checkpoint, pending write and blob.
+
+        Refused with 409 while a run holds the thread.
+        """
+        lease = await self._acquire_run(thread, RunLockPolicy.reject)
+        try:
+            await self._registry.checkpointer.adelete_thread(thread.id)
+            await self._threads.delete(thread.id)
+            await self._search_index.delete_thread(thread.id)
+            logger.debug(f"Deleted checkpoints of thread {thread.id}")
+        finally:
+            await lease.release()
+
+    async def fork_thread(
+        self, thread: Thread, user: User, request: ForkThread
+    ) -> Thread:
+        """Start a new thread of *user* from a checkpoint of *thread*.
+
+        The new thread begins where the checkpoint left off, with its own
+        copy of that checkpoint; the history before it stays with *thread*.
+        """
+        config: dict[str, Any] = {"thread_id": thread.id, "checkpoint_ns": ""}
+        if request.checkpoint_id is not None:
+            config["checkpoint_id"] = request.checkpoint_id
+        fork_id = str(uuid4())
+
+        checkpointer = self._registry.checkpointer
+        forked = await afork(checkpointer, {"configurable": config}, fork_id)
+        if forked is None:
+            detail = (
+                f"Checkpoint {request.checkpoint_id} not found"
+                if request.checkpoint_id is not None
+                else f"Thread {thread.id} has no checkpoints"
+            )
+            raise HTTPException(status_code=404, detail=detail)
+
+        checkpoint_id = forked["configurable"]["checkpoint_id"]
+        try:
+            fork = await self._threads.create(
+                Thread(
+                    id=fork_id,
+                    user_id=user.id,
+                    metadata={
+                        **thread.metadata,
+                        **(request.metadata or {}),
+                        "forked_from": {
+                            "thread_id": thread.id,
+                            "checkpoint_id": checkpoint_id,
+                        },
+                    },
+                )
+            )
+        except Exception:
+            await checkpointer.adelete_thread(fork_id)
+            raise
+        logger.debug(f"Forked thread {thread.id} at {checkpoint_id} into {fork_id}")
+        return fork
+
     async def get_thread_history(
         self,
-        user: User = Depends(UserRepository.get_user_by_id),  # noqa: B008
-        thread: Thread = Depends(ThreadRepository.get_thread_by_id),  # noqa: B008
+        user: User,
+        thread: Thread,
+        agent_id: str | None = None,
+        limit: int | None = None,
+        skip: int = 0,
     ) -> EventSourceResponse:
         try:
-            await self._initialize()
+            agent_service = await self._get_agent_service(agent_id)
             return EventSourceResponse(
-                self._agent_service.load_history(thread, user),  # type: ignore[union-attr]
+                agent_service.load_history(thread, user, limit, skip),
                 headers={
                     "Cache-Control": "no-cache",
                     "Connection": "keep-alive",
@@ -85,6 +653,8 @@ class ThreadController:
                     "Access-Control-Allow-Headers": "Content-Type, Authorization",
                 },
             )
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error fetching thread history: {str(e)}")
             raise HTTPException(status_code=500, detail="Internal server error") from e
@@ -92,10 +662,10 @@ class ThreadController:
     async def feedback(
         self,
         request: FeedbackRequest,
-        user: User = Depends(UserRepository.get_user_by_id),  # noqa: B008
-        thread: Thread = Depends(ThreadRepository.get_thread_by_id),  # noqa: B008
+        user: User,
+        thread: Thread,
     ) -> dict[str, str]:
-        await self._initialize()
-        return await self._agent_service.add_feedback(  # type: ignore[union-attr]
+        agent_service = await self._get_agent_service(request.agent_id)
+        return await agent_service.add_feedback(
             trace=request.trace_id, feedback=request.feedback, thread=thread, user=user
         )
@@ -0,0 +1,50 @@
+from typing import TYPE_CHECKING, cast
+
+from fastapi import Depends, HTTPException, Request
+
+from app.http.controllers import ThreadController
+from app.http.middleware import get_current_user
+from app.models import Thread, User
+
+if TYPE_CHECKING:
+    from app.bootstrap.container import Container
+
+
+def get_container(request: Request) -> "Container":
+    return cast("Container", request.app.state.container)
+
+
+def get_thread_controller(request: Request) -> ThreadController:
+    return get_container(request).thread_controller
+
+
+async def get_thread(
+    request: Request,
+    thread_id: str,
+    user: User = Depends(get_current_user),  # noqa: B008
+) -> Thread:
+    """Resolve the ``thread_id`` path parameter to one of the user's threads."""
+    thread = await get_container(request).thread_repository.get_for_user(
+        thread_id, user
+    )
+    if thread is None:
+        raise HTTPException(status_code=404, detail=f"Thread {thread_id} not found")
+    return thread
+
+
+async def get_thread_or_new(
+    request: Request,
+    thread_id: str,
+    user: User = Depends(get_current_user),  # noqa: B008
+) -> Thread:
+    """Like :func:`get_thread`, but an unknown id yields an unsaved thread.
+
+    Lets clients read the (empty) history of a thread before its first run.
+    """
+    repository = get_container(request).thread_repository
+    thread = await repository.get(thread_id)
+    if thread is None:
+        return Thread(id=thread_id, user_id=user.id, metadata={})
+    if thread.user_id not in (None, user.id):
+        raise HTTPException(status_code=404, detail=f"Thread {thread_id} not found")
+    return thread
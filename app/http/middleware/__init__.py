@@ -1,8 +1,11 @@
 from .auth import get_current_user
 from .cors_middleware import CORSConfig, setup_cors_middleware
+from .rate_limit_middleware import RateLimitMiddleware, setup_rate_limit_middleware
 
 __all__ = [
     "setup_cors_middleware",
+    "setup_rate_limit_middleware",
+    "RateLimitMiddleware",
     "CORSConfig",
     "get_current_user"
 ]
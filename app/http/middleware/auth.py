@@ -1,24 +1,33 @@
-import base64
-import json
+from typing import TYPE_CHECKING, cast
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from app.infrastructure.auth import AuthenticationError
 from app.models import User
-from app.repositories import UserRepository
+
+if TYPE_CHECKING:
+    from app.bootstrap.container import Container
 
 security = HTTPBearer()
 
 async def get_current_user(
+        request: Request,
         creds: HTTPAuthorizationCredentials = Depends(security) # noqa: B008
 ) -> User:
-    try:
-        token = creds.credentials
-        payload = json.loads(base64.b64decode(token).decode("utf-8"))
-        user_id = payload.get("user_id")
-        user = await UserRepository.get_user_by_id(user_id)
-        if not user:
-            raise HTTPException(status_code=401, detail="Invalid user")
+    # Memoized per request, so every dependency that needs the user shares it.
+    user: User | None = getattr(request.state, "user", None)
+    if user is not None:
         return user
-    except Exception as e:
-        raise HTTPException(status_code=401, detail="Authentication failed") from e
+
+    container = cast("Container", request.app.state.container)
+    try:
+        user = await container.authenticator.authenticate(creds.credentials)
+    except AuthenticationError as e:
+        raise HTTPException(
+            status_code=401,
+            detail="Authentication failed",
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from e
+    request.state.user = user
+    return user
@@ -0,0 +1,106 @@
+import json
+import math
+from typing import TYPE_CHECKING, cast
+
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.auth import AuthenticationError
+from app.infrastructure.ratelimit import RateLimiter, RateLimitState
+
+if TYPE_CHECKING:
+    from app.bootstrap.container import Container
+
+
+def _headers(states: list[RateLimitState]) -> dict[str, str]:
+    # Report the policy closest to its limit, as the RateLimit header
+    # fields draft asks for.
+    state = min(states, key=lambda s: (s.allowed, s.remaining / max(s.limit, 1)))
+    headers = {
+        "RateLimit-Limit": str(state.limit),
+        "RateLimit-Remaining": str(state.remaining),
+        "RateLimit-Reset": str(math.ceil(state.reset_after)),
+        "RateLimit-Policy": f'"{state.policy}";q={state.limit}',
+    }
+    if not state.allowed:
+        headers["Retry-After"] = str(max(math.ceil(state.retry_after), 1))
+    return headers
+
+
+class RateLimitMiddleware:
+    """Enforces the container's rate limits on ``/api`` requests.
+
+    Runs before routing, so it resolves the bearer token itself through the
+    authenticator's cache and leaves the user on ``request.state`` for
+    ``get_current_user``. Requests without a valid token are limited per
+    client address and rejected later by authentication.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str = "/api/"):
+        self.app = app
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        container = cast(
+            "Container | None", getattr(scope["app"].state, "container", None)
+        )
+        if container is None or not container.ready:
+            await self.app(scope, receive, send)
+            return
+
+        principal = await self._principal(scope, container)
+        states = await container.rate_limiter.check(
+            principal, scope["method"], scope["path"]
+        )
+        if not states:
+            await self.app(scope, receive, send)
+            return
+
+        headers = _headers(states)
+        if not all(state.allowed for state in states):
+            body = json.dumps({"detail": "Rate limit exceeded"}).encode()
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 429,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode()),
+                        *((k.lower().encode(), v.encode()) for k, v in headers.items()),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for key, value in headers.items():
+                    response_headers[key] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    async def _principal(self, scope: Scope, container: "Container") -> str:
+        scheme, _, token = Headers(scope=scope).get("authorization", "").partition(" ")
+        if scheme.lower() == "bearer" and token:
+            try:
+                user = await container.authenticator.authenticate(token)
+            except AuthenticationError:
+                pass
+            else:
+                scope.setdefault("state", {})["user"] = user
+                return RateLimiter.principal(user.id)
+
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+
+def setup_rate_limit_middleware(app: FastAPI) -> None:
+    app.add_middleware(RateLimitMiddleware)
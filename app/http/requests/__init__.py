@@ -1,4 +1,15 @@
+from .batch_run import BatchRun, BatchRunItem
+from .dev_token import DevToken
 from .feedback_request import FeedbackRequest
-from .run import Run
+from .fork_thread import ForkThread
+from .run import Run, WaitRun
 
-__all__ = ["Run", "FeedbackRequest"]
+__all__ = [
+    "Run",
+    "WaitRun",
+    "BatchRun",
+    "BatchRunItem",
+    "FeedbackRequest",
+    "ForkThread",
+    "DevToken",
+]
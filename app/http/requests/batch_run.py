@@ -0,0 +1,43 @@
+from typing import Any, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class BatchRunItem(BaseModel):
+    input: dict[str, Any] | list[Any] | str | float | bool | None = Field(
+        None, description="The input to the agent.", title="Input"
+    )
+    metadata: dict[str, Any] | None = Field(
+        None, description="Metadata to assign to the thread.", title="Metadata"
+    )
+    thread_id: UUID | None = Field(
+        None,
+        description="The ID of the thread to run. A new thread is created if not provided.",
+        title="Thread Id",
+    )
+
+
+class BatchRun(BaseModel):
+    runs: list[BatchRunItem] = Field(
+        ...,
+        min_length=1,
+        description="The runs to execute. Results refer to them by index.",
+        title="Runs",
+    )
+    agent_id: str | None = Field(
+        None,
+        description="The agent ID to run. If not provided will use the default agent for this service.",
+        title="Agent Id",
+    )
+    multitask_strategy: Literal["reject", "enqueue", "interrupt"] | None = Field(
+        None,
+        description="What to do when a thread already has an active run. If not provided will use the service default.",
+        title="Multitask Strategy",
+    )
+    concurrency: int | None = Field(
+        None,
+        ge=1,
+        description="How many runs execute at once. Capped by the service limit.",
+        title="Concurrency",
+    )
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+
+
+class DevToken(BaseModel):
+    user_id: str = Field(
+        min_length=1,
+        max_length=128,
+        description="The user to sign a token for. Created if it does not exist.",
+        title="User Id",
+    )
+    email: str | None = Field(
+        None,
+        description="Email of a user that is created. Derived from the id if not provided.",
+        title="Email",
+    )
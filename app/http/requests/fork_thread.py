@@ -0,0 +1,16 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class ForkThread(BaseModel):
+    checkpoint_id: str | None = Field(
+        None,
+        description="The checkpoint to branch from. The latest checkpoint of the thread if not provided.",
+        title="Checkpoint Id",
+    )
+    metadata: dict[str, Any] | None = Field(
+        None,
+        description="Metadata merged over the source thread's metadata.",
+        title="Metadata",
+    )
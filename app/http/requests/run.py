@@ -49,3 +49,17 @@ class Run(BaseModel):
         description="The agent ID to run. If not provided will use the default agent for this service.",
         title="Agent Id",
     )
+    multitask_strategy: Literal["reject", "enqueue", "interrupt"] | None = Field(
+        None,
+        description="What to do when the thread already has an active run. If not provided will use the service default.",
+        title="Multitask Strategy",
+    )
+
+
+class WaitRun(Run):
+    timeout: float | None = Field(
+        None,
+        gt=0,
+        description="Seconds to wait for the run. If it takes longer the response is 202 and the run continues. Capped by the service limit.",
+        title="Timeout",
+    )
@@ -1,5 +1,7 @@
 from .error_response import ErrorResponse
+from .token_response import TokenResponse
 
 __all__ = [
     "ErrorResponse",
+    "TokenResponse",
 ]
@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+
+class TokenResponse(BaseModel):
+    access_token: str = Field(description="An HS256 bearer token.")
+    token_type: str = Field("bearer", description="Always ``bearer``.")
+    expires_in: int = Field(description="Seconds until the token expires.")
@@ -1,5 +1,6 @@
+from .auth_routes import auth_router
 from .health_routes import health_router
 from .runs_routes import runs_router
 from .thread_routes import thread_router
 
-__all__ = ["thread_router", "runs_router", "health_router"]
+__all__ = ["thread_router", "runs_router", "health_router", "auth_router"]
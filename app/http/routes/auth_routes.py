@@ -0,0 +1,42 @@
+import logging
+
+from fastapi import APIRouter, HTTPException, Request
+
+from app.http.dependencies import get_container
+from app.http.requests import DevToken
+from app.http.responses import ErrorResponse, TokenResponse
+from app.infrastructure.auth import issue_token
+from app.models import User
+
+logger = logging.getLogger(__name__)
+
+auth_router = APIRouter(prefix="/auth", tags=["auth"])
+
+
+@auth_router.post(
+    "/dev-token",
+    responses={"503": {"model": ErrorResponse}},
+)
+async def dev_token(request: Request, body: DevToken) -> TokenResponse:
+    """Sign a bearer token for any user, for local development.
+
+    Only mounted with ``AUTH_DEV_TOKENS=true``: whoever can reach it can act
+    as every user.
+    """
+    container = get_container(request)
+    config = container.config
+    if not config.secret_key:
+        raise HTTPException(status_code=503, detail="SECRET_KEY is not set")
+
+    repository = container.user_repository
+    if await repository.get(body.user_id) is None:
+        email = body.email or f"user{body.user_id}@example.com"
+        await repository.save(User(id=body.user_id, email=email))
+        logger.info(f"Created development user {body.user_id}")
+
+    return TokenResponse(
+        access_token=issue_token(
+            body.user_id, config.secret_key, config.auth_dev_token_ttl
+        ),
+        expires_in=int(config.auth_dev_token_ttl),
+    )
@@ -1,7 +1,10 @@
 import logging
 from datetime import datetime
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+from app.http.dependencies import get_container
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +20,19 @@ async def health_check() -> dict[str, str]:
     }
 
 
+@health_router.get("/ready")
+async def readiness_check(request: Request) -> JSONResponse:
+    ready = get_container(request).ready
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "starting",
+            "timestamp": datetime.utcnow().isoformat(),
+            "service": "enterprise-chat-api",
+        },
+    )
+
+
 @health_router.get("/detailed")
 async def detailed_health_check() -> dict[str, str | dict[str, str]]:
     try:
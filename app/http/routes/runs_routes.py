@@ -1,21 +1,63 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from sse_starlette import EventSourceResponse
+from starlette.responses import JSONResponse, StreamingResponse
 
-from app.bootstrap.config import get_config
 from app.http.controllers import ThreadController
+from app.http.dependencies import get_thread_controller
 from app.http.middleware import get_current_user
-from app.http.requests import Run
+from app.http.requests import BatchRun, Run, WaitRun
 from app.models import User
 
 runs_router = APIRouter(tags=["runs"])
-thread_controller = ThreadController(get_config())
 
 
 @runs_router.post("/runs/stream")
 async def run_stream(
     request: Run,
+    idempotency_key: str | None = Header(default=None, max_length=255),
+    last_event_id: str | None = Header(default=None),
     user: User = Depends(get_current_user), # noqa: B008
+    thread_controller: ThreadController = Depends(get_thread_controller),  # noqa: B008
 ) -> EventSourceResponse:
     return await thread_controller.stream(
-        request.input, request.thread_id, request.metadata or {}, user
+        request.input,
+        request.thread_id,
+        request.metadata or {},
+        user,
+        request.agent_id,
+        request.multitask_strategy,
+        idempotency_key,
+        last_event_id,
+    )
+
+
+@runs_router.post("/runs/wait")
+async def run_wait(
+    request: WaitRun,
+    user: User = Depends(get_current_user), # noqa: B008
+    thread_controller: ThreadController = Depends(get_thread_controller),  # noqa: B008
+) -> JSONResponse:
+    return await thread_controller.wait(
+        request.input,
+        request.thread_id,
+        request.metadata or {},
+        user,
+        request.agent_id,
+        request.multitask_strategy,
+        request.timeout,
+    )
+
+
+@runs_router.post("/runs/batch")
+async def run_batch(
+    request: BatchRun,
+    user: User = Depends(get_current_user), # noqa: B008
+    thread_controller: ThreadController = Depends(get_thread_controller),  # noqa: B008
+) -> StreamingResponse:
+    return await thread_controller.batch(
+        request.runs,
+        user,
+        request.agent_id,
+        request.multitask_strategy,
+        request.concurrency,
     )
@@ -1,39 +1,58 @@
-from datetime import UTC, datetime
-from typing import Any
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Header, Query, Request
 from sse_starlette import EventSourceResponse
 
-from app.bootstrap.config import get_config
 from app.http.controllers import ThreadController
+from app.http.dependencies import (
+    get_thread,
+    get_thread_controller,
+    get_thread_or_new,
+)
 from app.http.middleware import get_current_user
-from app.http.requests import FeedbackRequest
+from app.http.requests import FeedbackRequest, ForkThread
 from app.http.responses import ErrorResponse
 from app.models import Thread, User
-from app.repositories import ThreadRepository
+from app.repositories import ThreadPage, ThreadSearchPage
 
 thread_router = APIRouter(tags=["threads"])
-thread_controller = ThreadController(get_config())
+
+
+@thread_router.get(
+    "/threads",
+    responses={"400": {"model": ErrorResponse}, "422": {"model": ErrorResponse}},
+)
+async def list_threads(
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = None,
+    user: User = Depends(get_current_user), # noqa: B008
+    thread_controller: ThreadController = Depends(get_thread_controller),  # noqa: B008
+) -> ThreadPage:
+    return await thread_controller.list_threads(user, limit, cursor)
+
+
+@thread_router.get(
+    "/threads/search",
+    responses={"422": {"model": ErrorResponse}},
+)
+async def search_threads(
+    q: str = Query(min_length=1, max_length=256),
+    limit: int = Query(default=20, ge=1, le=100),
+    skip: int = Query(default=0, ge=0, le=1000),
+    user: User = Depends(get_current_user), # noqa: B008
+    thread_controller: ThreadController = Depends(get_thread_controller),  # noqa: B008
+) -> ThreadSearchPage:
+    return await thread_controller.search_threads(user, q, limit, skip)
 
 
 @thread_router.get(
     "/threads/{thread_id}",
     responses={"404": {"model": ErrorResponse}, "422": {"model": ErrorResponse}},
 )
-async def get_thread(
-    user: User = Depends(get_current_user), # noqa: B008
-    thread: Thread = Depends(ThreadRepository.get_thread_by_id),  # noqa: B008
-) -> dict[str, str | Any]:
-    return {
-        "thread_id": thread.id,
-        "created_at": datetime.now(tz=UTC).isoformat(),
-        "updated_at": datetime.now(tz=UTC).isoformat(),
-        "metadata": {
-            "title": "Thread Title",
-            "user_id": user.id,
-        },
-        "status": "idle",
-    }
+async def get_thread_by_id(
+    thread: Thread = Depends(get_thread),  # noqa: B008
+) -> Thread:
+    return thread
 
 
 @thread_router.delete(
@@ -45,22 +64,71 @@ async def get_thread(
 async def delete_thread(
     request: Request,
     user: User = Depends(get_current_user), # noqa: B008
-    thread: Thread = Depends(ThreadRepository.get_thread_by_id),  # noqa: B008
+    thread: Thread = Depends(get_thread),  # noqa: B008
+    thread_controller: ThreadController = Depends(get_thread_controller),  # noqa: B008
 ) -> ErrorResponse | None:
-    # await ThreadRepository.delete_thread(thread.id)
+    await thread_controller.delete_thread(thread)
     return None
 
 
+@thread_router.post(
+    "/threads/{thread_id}/fork",
+    status_code=201,
+    responses={"404": {"model": ErrorResponse}, "422": {"model": ErrorResponse}},
+)
+async def fork_thread(
+    request_body: ForkThread,
+    user: User = Depends(get_current_user), # noqa: B008
+    thread: Thread = Depends(get_thread),  # noqa: B008
+    thread_controller: ThreadController = Depends(get_thread_controller),  # noqa: B008
+) -> Thread:
+    return await thread_controller.fork_thread(thread, user, request_body)
+
+
 @thread_router.get(
     "/threads/{thread_id}/history",
     responses={"404": {"model": ErrorResponse}, "422": {"model": ErrorResponse}},
 )
 async def get_thread_history(
     request: Request,
+    agent_id: str | None = None,
+    limit: int | None = Query(default=None, ge=1),
+    skip: int = Query(default=0, ge=0),
     user: User = Depends(get_current_user), # noqa: B008
-    thread: Thread = Depends(ThreadRepository.get_thread_by_id),  # noqa: B008
+    thread: Thread = Depends(get_thread_or_new),  # noqa: B008
+    thread_controller: ThreadController = Depends(get_thread_controller),  # noqa: B008
 ) -> EventSourceResponse:
-    return await thread_controller.get_thread_history(user, thread)
+    return await thread_controller.get_thread_history(
+        user, thread, agent_id, limit, skip
+    )
+
+
+@thread_router.get(
+    "/threads/{thread_id}/runs/{run_id}/stream",
+    responses={"404": {"model": ErrorResponse}, "422": {"model": ErrorResponse}},
+)
+async def join_run_stream(
+    run_id: UUID,
+    last_event_id: str | None = Header(default=None),
+    user: User = Depends(get_current_user), # noqa: B008
+    thread: Thread = Depends(get_thread),  # noqa: B008
+    thread_controller: ThreadController = Depends(get_thread_controller),  # noqa: B008
+) -> EventSourceResponse:
+    return await thread_controller.join_stream(thread, run_id, last_event_id)
+
+
+@thread_router.post(
+    "/threads/{thread_id}/runs/{run_id}/cancel",
+    status_code=202,
+    responses={"404": {"model": ErrorResponse}, "422": {"model": ErrorResponse}},
+)
+async def cancel_run(
+    run_id: UUID,
+    user: User = Depends(get_current_user), # noqa: B008
+    thread: Thread = Depends(get_thread),  # noqa: B008
+    thread_controller: ThreadController = Depends(get_thread_controller),  # noqa: B008
+) -> dict[str, str]:
+    return await thread_controller.cancel_run(thread, run_id)
 
 
 @thread_router.post("/threads/{thread_id}/feedback")
@@ -68,6 +136,7 @@ async def post_thread_feedback(
     request: Request,
     request_body: FeedbackRequest,
     user: User = Depends(get_current_user), # noqa: B008
-    thread: Thread = Depends(ThreadRepository.get_thread_by_id),  # noqa: B008
+    thread: Thread = Depends(get_thread),  # noqa: B008
+    thread_controller: ThreadController = Depends(get_thread_controller),  # noqa: B008
 ) -> dict[str, str]:
     return await thread_controller.feedback(request_body, user, thread)
@@ -0,0 +1,13 @@
+from .admission_controller import (
+    DEFAULT_TENANT,
+    AdmissionController,
+    AdmissionRejectedError,
+    AdmissionTicket,
+)
+
+__all__ = [
+    "DEFAULT_TENANT",
+    "AdmissionController",
+    "AdmissionRejectedError",
+    "AdmissionTicket",
+]
@@ -0,0 +1,321 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+
+from prometheus_client import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+ADMISSION_ACTIVE_RUNS = Gauge(
+    "admission_active_runs", "Runs currently admitted and executing."
+)
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "admission_queue_depth", "Runs waiting for an execution slot."
+)
+ADMISSION_CONCURRENCY_LIMIT = Gauge(
+    "admission_concurrency_limit", "Current adaptive limit of concurrent runs."
+)
+ADMISSION_WAIT_SECONDS = Histogram(
+    "admission_wait_seconds", "Time a run waited for an execution slot."
+)
+ADMISSION_SHED_TOTAL = Counter(
+    "admission_shed_total", "Runs rejected by admission control.", ["reason"]
+)
+ADMISSION_TENANT_WAIT_SECONDS = Histogram(
+    "admission_tenant_wait_seconds",
+    "Time a run waited for an execution slot, per tenant.",
+    ["tenant"],
+)
+ADMISSION_TENANT_QUEUE_DEPTH = Gauge(
+    "admission_tenant_queue_depth", "Runs waiting per tenant.", ["tenant"]
+)
+EVENT_LOOP_LAG_SECONDS = Gauge(
+    "event_loop_lag_seconds", "Smoothed event loop scheduling lag."
+)
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when a run is shed instead of being admitted."""
+
+    def __init__(self, status_code: int, retry_after: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class AdmissionTicket:
+    """An execution slot held by one run, released exactly once."""
+
+    def __init__(self, controller: "AdmissionController") -> None:
+        self._controller = controller
+        self._started = time.monotonic()
+        self._released = False
+
+    async def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        self._controller._release(time.monotonic() - self._started)
+
+
+DEFAULT_TENANT = "default"
+
+# Label for tenants without a configured weight, which keeps the per-tenant
+# metrics to a bounded set of series.
+OTHER_TENANTS = "other"
+
+
+class AdmissionController:
+    """Bounds concurrent runs, queues a limited number and sheds the rest.
+
+    The concurrency limit moves between *min_concurrency* and
+    *max_concurrency*: a monitor task samples event-loop lag and, through
+    *saturation_probe*, database pool saturation, and shrinks the limit
+    multiplicatively while either is over its threshold. It grows back by one
+    slot per probe while runs keep the current limit busy.
+
+    Waiting runs are queued per tenant and freed slots are handed out by
+    deficit round robin: each visit credits a tenant with its weight (1 by
+    default, see *tenant_weights*) and the tenant starts one run per whole
+    credit. A tenant that floods the queue therefore waits behind its own
+    runs, not in front of everyone else's. *max_queue_per_tenant* keeps a
+    single tenant from filling the shared queue.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout: float,
+        min_concurrency: int = 1,
+        lag_threshold: float = 0.1,
+        saturation_threshold: float = 0.9,
+        probe_interval: float = 0.5,
+        shed_status_code: int = 503,
+        saturation_probe: Callable[[], float] | None = None,
+        tenant_weights: dict[str, float] | None = None,
+        max_queue_per_tenant: int | None = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min(min_concurrency, max_concurrency)
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.lag_threshold = lag_threshold
+        self.saturation_threshold = saturation_threshold
+        self.probe_interval = probe_interval
+        self.shed_status_code = shed_status_code
+        self._saturation_probe = saturation_probe
+        self.tenant_weights = tenant_weights or {}
+        for tenant, weight in self.tenant_weights.items():
+            # A tenant whose credit never reaches one run would keep the
+            # round robin spinning forever.
+            if not 0 < weight < math.inf:
+                raise ValueError(
+                    f"Weight of tenant {tenant} must be positive: {weight}"
+                )
+        self.max_queue_per_tenant = max_queue_per_tenant or max_queue
+
+        self._limit = max_concurrency
+        self._active = 0
+        self._queued = 0
+        self._queues: dict[str, deque[asyncio.Future[None]]] = {}
+        self._deficits: dict[str, float] = {}
+        # Tenants with waiting runs, in round robin order.
+        self._round: deque[str] = deque()
+        self._avg_run_seconds = 1.0
+        self._loop_lag = 0.0
+        self._monitor: asyncio.Task[None] | None = None
+
+        ADMISSION_CONCURRENCY_LIMIT.set(self._limit)
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    def queued_for(self, tenant: str) -> int:
+        return len(self._queues.get(tenant, ()))
+
+    async def start(self) -> None:
+        if self._monitor is None:
+            self._monitor = asyncio.create_task(self._monitor_loop())
+
+    async def stop(self) -> None:
+        if self._monitor is not None:
+            self._monitor.cancel()
+            await asyncio.gather(self._monitor, return_exceptions=True)
+            self._monitor = None
+
+    async def admit(self, tenant: str = DEFAULT_TENANT) -> AdmissionTicket:
+        """Wait for an execution slot or raise :class:`AdmissionRejectedError`."""
+        if self._active < self._limit and not self._queued:
+            self._acquired(0.0)
+            ADMISSION_TENANT_WAIT_SECONDS.labels(self._label(tenant)).observe(0.0)
+            return AdmissionTicket(self)
+
+        if self._queued >= self.max_queue:
+            ADMISSION_SHED_TOTAL.labels("queue_full").inc()
+            raise self._rejection("Server is at capacity, retry later")
+        if self.queued_for(tenant) >= self.max_queue_per_tenant:
+            ADMISSION_SHED_TOTAL.labels("tenant_queue_full").inc()
+            raise self._rejection("Too many queued runs, retry later")
+
+        started = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        self._enqueue(tenant, waiter)
+
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await waiter
+        except TimeoutError as e:
+            if not self._handed_over(tenant, waiter):
+                ADMISSION_SHED_TOTAL.labels("queue_timeout").inc()
+                raise self._rejection("Timed out waiting for capacity") from e
+        except asyncio.CancelledError:
+            if self._handed_over(tenant, waiter):
+                # The slot was handed to us right as we were cancelled.
+                self._release(None)
+            raise
+
+        waited = time.monotonic() - started
+        ADMISSION_WAIT_SECONDS.observe(waited)
+        ADMISSION_TENANT_WAIT_SECONDS.labels(self._label(tenant)).observe(waited)
+        return AdmissionTicket(self)
+
+    def _label(self, tenant: str) -> str:
+        return tenant if tenant in self.tenant_weights else OTHER_TENANTS
+
+    def _enqueue(self, tenant: str, waiter: asyncio.Future[None]) -> None:
+        queue = self._queues.get(tenant)
+        if queue is None:
+            queue = self._queues[tenant] = deque()
+            self._deficits[tenant] = 0.0
+            self._round.append(tenant)
+        queue.append(waiter)
+        self._queued += 1
+        self._report_queue(tenant)
+
+    def _dequeue(self) -> asyncio.Future[None] | None:
+        """Pick the next waiter by deficit round robin."""
+        while self._round:
+            tenant = self._round[0]
+            queue = self._queues[tenant]
+            if self._deficits[tenant] < 1:
+                self._deficits[tenant] += self.tenant_weights.get(tenant, 1.0)
+                if self._deficits[tenant] < 1:
+                    self._round.rotate(-1)
+                    continue
+
+            self._deficits[tenant] -= 1
+            waiter = queue.popleft()
+            self._queued -= 1
+            if not queue:
+                self._forget(tenant)
+            elif self._deficits[tenant] < 1:
+                self._round.rotate(-1)
+            self._report_queue(tenant)
+            return waiter
+        return None
+
+    def _forget(self, tenant: str) -> None:
+        del self._queues[tenant]
+        del self._deficits[tenant]
+        self._round.remove(tenant)
+
+    def _handed_over(self, tenant: str, waiter: asyncio.Future[None]) -> bool:
+        if waiter.done() and not waiter.cancelled():
+            return True
+        queue = self._queues.get(tenant)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            self._queued -= 1
+            if not queue:
+                self._forget(tenant)
+            self._report_queue(tenant)
+        return False
+
+    def _report_queue(self, tenant: str) -> None:
+        ADMISSION_QUEUE_DEPTH.set(self._queued)
+        label = self._label(tenant)
+        if label == OTHER_TENANTS:
+            depth = sum(
+                len(q) for t, q in self._queues.items() if self._label(t) == label
+            )
+        else:
+            depth = self.queued_for(tenant)
+        ADMISSION_TENANT_QUEUE_DEPTH.labels(label).set(depth)
+
+    def _acquired(self, waited: float) -> None:
+        self._active += 1
+        ADMISSION_ACTIVE_RUNS.set(self._active)
+        ADMISSION_WAIT_SECONDS.observe(waited)
+
+    def _release(self, duration: float | None) -> None:
+        if duration is not None:
+            self._avg_run_seconds += 0.2 * (duration - self._avg_run_seconds)
+
+        self._active -= 1
+        self._wake()
+        ADMISSION_ACTIVE_RUNS.set(self._active)
+
+    def _wake(self) -> None:
+        while self._active < self._limit:
+            waiter = self._dequeue()
+            if waiter is None:
+                break
+            if waiter.done():
+                continue
+            self._active += 1
+            waiter.set_result(None)
+
+    def _rejection(self, message: str) -> AdmissionRejectedError:
+        return AdmissionRejectedError(
+            self.shed_status_code, self.retry_after(), message
+        )
+
+    def retry_after(self) -> int:
+        """Seconds a shed client should wait, from the queue ahead and run time."""
+        backlog = (self._queued + 1) / max(self._limit, 1)
+        return min(max(math.ceil(self._avg_run_seconds * backlog), 1), 60)
+
+    async def _monitor_loop(self) -> None:
+        while True:
+            expected = time.monotonic() + self.probe_interval
+            await asyncio.sleep(self.probe_interval)
+            lag = max(time.monotonic() - expected, 0.0)
+            self._loop_lag += 0.3 * (lag - self._loop_lag)
+            EVENT_LOOP_LAG_SECONDS.set(self._loop_lag)
+
+            saturation = 0.0
+            if self._saturation_probe is not None:
+                try:
+                    saturation = self._saturation_probe()
+                except Exception as e:
+                    logger.debug(f"Saturation probe failed: {e}")
+
+            self._adjust(self._loop_lag, saturation)
+
+    def _adjust(self, lag: float, saturation: float) -> None:
+        previous = self._limit
+        if lag > self.lag_threshold or saturation >= self.saturation_threshold:
+            self._limit = max(self.min_concurrency, math.floor(self._limit * 0.8))
+        elif self._limit < self.max_concurrency and self._active >= self._limit:
+            self._limit += 1
+            self._wake()
+
+        if self._limit != previous:
+            logger.debug(
+                f"Admission limit {previous} -> {self._limit} "
+                f"(lag={lag:.3f}s, saturation={saturation:.2f})"
+            )
+            ADMISSION_CONCURRENCY_LIMIT.set(self._limit)
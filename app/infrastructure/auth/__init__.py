@@ -0,0 +1,11 @@
+from .authenticator import AuthenticationError, Authenticator
+from .tokens import InvalidTokenError, decode_token, encode_token, issue_token
+
+__all__ = [
+    "AuthenticationError",
+    "Authenticator",
+    "InvalidTokenError",
+    "decode_token",
+    "encode_token",
+    "issue_token",
+]
@@ -0,0 +1,30 @@
+"""Print a bearer token signed with ``SECRET_KEY``.
+
+Usage: ``python -m app.infrastructure.auth USER_ID [--ttl SECONDS]``. The
+user must exist, unless users are kept in memory, where any id is accepted.
+"""
+
+import argparse
+import sys
+
+from app.bootstrap.config import get_config
+from app.infrastructure.auth.tokens import issue_token
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.infrastructure.auth")
+    parser.add_argument("user_id")
+    parser.add_argument("--ttl", type=float, default=None, help="seconds")
+    args = parser.parse_args()
+
+    config = get_config()
+    if not config.secret_key:
+        print("SECRET_KEY is not set", file=sys.stderr)  # noqa: T201
+        return 1
+    ttl = args.ttl if args.ttl is not None else config.auth_dev_token_ttl
+    print(issue_token(args.user_id, config.secret_key, ttl))  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+import hashlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from prometheus_client import Counter
+
+from app.infrastructure.auth.tokens import InvalidTokenError, decode_token
+from app.models import User
+from app.utils.cache import SingleFlight, TTLCache
+
+logger = logging.getLogger(__name__)
+
+AUTH_CACHE_LOOKUPS_TOTAL = Counter(
+    "auth_cache_lookups_total",
+    "Bearer tokens resolved from the verified principal cache, or not.",
+    ["result"],
+)
+
+
+class AuthenticationError(Exception):
+    """Raised when a bearer token does not identify a known user."""
+
+
+class Authenticator:
+    """Resolves bearer tokens to users, verifying each token only once.
+
+    A verified token is cached under its SHA-256 digest until it expires or
+    *cache_ttl* passes, whichever is first, so repeat requests and SSE
+    reconnects cost a hash and a dict lookup. On a miss, concurrent requests
+    for the same user share one *load_user* call.
+    """
+
+    def __init__(
+        self,
+        secret_key: str | None,
+        load_user: Callable[[str], Awaitable[User | None]],
+        cache_size: int = 10000,
+        cache_ttl: float = 300.0,
+        leeway: float = 30.0,
+    ):
+        if not secret_key:
+            logger.warning("SECRET_KEY is not set, every token will be rejected")
+        self._secret_key = secret_key
+        self._load_user = load_user
+        self._leeway = leeway
+        self._principals: TTLCache[bytes, User] = TTLCache(cache_size, cache_ttl)
+        self._lookups: SingleFlight[str, User | None] = SingleFlight()
+
+    async def authenticate(self, token: str) -> User:
+        key = hashlib.sha256(token.encode()).digest()
+        user = self._principals.get(key)
+        if user is not None:
+            AUTH_CACHE_LOOKUPS_TOTAL.labels("hit").inc()
+            return user
+        AUTH_CACHE_LOOKUPS_TOTAL.labels("miss").inc()
+
+        if not self._secret_key:
+            raise AuthenticationError("Token signing is not configured")
+        try:
+            claims = decode_token(token, self._secret_key, self._leeway)
+        except InvalidTokenError as e:
+            raise AuthenticationError(str(e)) from e
+
+        user_id = claims.get("sub") or claims.get("user_id")
+        if not isinstance(user_id, str) or not user_id:
+            raise AuthenticationError("Token has no subject")
+
+        user = await self._lookups.do(user_id, lambda: self._load_user(user_id))
+        if user is None:
+            raise AuthenticationError("Unknown user")
+
+        ttl = None
+        if "exp" in claims:
+            ttl = float(claims["exp"]) + self._leeway - time.time()
+        self._principals.set(key, user, ttl)
+        return user
+
+    def invalidate(self) -> None:
+        """Forget every verified token, e.g. after rotating the secret."""
+        self._principals.clear()
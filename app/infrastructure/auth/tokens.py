@@ -0,0 +1,84 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from typing import Any
+
+ALGORITHM = "HS256"
+
+
+class InvalidTokenError(ValueError):
+    """Raised when a token is malformed, forged, expired or not yet valid."""
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(signing_input: bytes, secret: str) -> bytes:
+    return hmac.new(secret.encode(), signing_input, hashlib.sha256).digest()
+
+
+def encode_token(claims: dict[str, Any], secret: str) -> str:
+    """Sign *claims* as a compact HS256 JWT."""
+    header = _b64encode(json.dumps({"alg": ALGORITHM, "typ": "JWT"}).encode())
+    payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+    signing_input = f"{header}.{payload}".encode()
+    return f"{header}.{payload}.{_b64encode(_sign(signing_input, secret))}"
+
+
+def issue_token(subject: str, secret: str, ttl: float, now: float | None = None) -> str:
+    """Sign a token for *subject* that expires in *ttl* seconds."""
+    issued_at = int(time.time() if now is None else now)
+    return encode_token(
+        {"sub": subject, "iat": issued_at, "exp": issued_at + int(ttl)}, secret
+    )
+
+
+def decode_token(
+    token: str, secret: str, leeway: float = 0.0, now: float | None = None
+) -> dict[str, Any]:
+    """Verify an HS256 JWT and return its claims.
+
+    Only HS256 is accepted, whatever the header says, so a token cannot
+    downgrade itself to ``none``. ``exp`` and ``nbf`` are checked with
+    *leeway* seconds of clock skew.
+    """
+    try:
+        header_b64, payload_b64, signature_b64 = token.split(".")
+        header = json.loads(_b64decode(header_b64))
+        signature = _b64decode(signature_b64)
+    except (ValueError, binascii.Error) as e:
+        raise InvalidTokenError("Malformed token") from e
+
+    if not isinstance(header, dict) or header.get("alg") != ALGORITHM:
+        raise InvalidTokenError("Unsupported token algorithm")
+    expected = _sign(f"{header_b64}.{payload_b64}".encode(), secret)
+    if not hmac.compare_digest(signature, expected):
+        raise InvalidTokenError("Invalid token signature")
+
+    try:
+        claims = json.loads(_b64decode(payload_b64))
+    except (ValueError, binascii.Error) as e:
+        raise InvalidTokenError("Malformed token") from e
+    if not isinstance(claims, dict):
+        raise InvalidTokenError("Malformed token")
+
+    try:
+        expires_at = float(claims["exp"]) if "exp" in claims else None
+        not_before = float(claims["nbf"]) if "nbf" in claims else None
+    except (TypeError, ValueError) as e:
+        raise InvalidTokenError("Malformed token claims") from e
+
+    now = time.time() if now is None else now
+    if expires_at is not None and now > expires_at + leeway:
+        raise InvalidTokenError("Token has expired")
+    if not_before is not None and now < not_before - leeway:
+        raise InvalidTokenError("Token is not valid yet")
+    return claims
@@ -0,0 +1,12 @@
+from .base import CANCELLED_REASON, RunCanceller
+from .factory import RunCancellerFactory
+from .memory import InMemoryRunCanceller
+from .postgres import PostgresRunCanceller
+
+__all__ = [
+    "CANCELLED_REASON",
+    "RunCanceller",
+    "RunCancellerFactory",
+    "InMemoryRunCanceller",
+    "PostgresRunCanceller",
+]
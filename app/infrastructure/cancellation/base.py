@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+
+from prometheus_client import Counter
+
+from app.infrastructure.locks import RunLease
+
+RUN_CANCELLATIONS_TOTAL = Counter(
+    "run_cancellations_total",
+    "Run cancellation requests by where the run was found.",
+    ["outcome"],
+)
+
+CANCELLED_REASON = "Run cancelled"
+
+
+class RunCanceller(ABC):
+    """Finds the task executing a run and cancels it on request.
+
+    Every worker tracks the leases of the runs it executes. Cancelling
+    interrupts the lease, which cancels the run's task; the run then winds
+    down as for an interrupt by a newer run and releases its slots.
+    """
+
+    def __init__(self) -> None:
+        self._leases: dict[str, RunLease] = {}
+
+    async def start(self) -> None:  # noqa: B027
+        """Start receiving cancellations from other workers."""
+        pass
+
+    async def cleanup(self) -> None:  # noqa: B027
+        """Release backend resources."""
+        pass
+
+    def track(self, run_id: str, lease: RunLease) -> None:
+        self._leases[run_id] = lease
+
+    def untrack(self, run_id: str) -> None:
+        self._leases.pop(run_id, None)
+
+    @abstractmethod
+    async def cancel(self, thread_id: str, run_id: str) -> bool:
+        """Cancel the run, wherever it executes.
+
+        Returns ``False`` when the run is known not to be running.
+        """
+        pass
+
+    def _cancel_local(self, thread_id: str, run_id: str) -> bool:
+        lease = self._leases.get(run_id)
+        if lease is None or lease.thread_id != thread_id:
+            return False
+        lease.interrupt(CANCELLED_REASON)
+        return True
@@ -0,0 +1,24 @@
+import logging
+
+from app.infrastructure.cancellation.base import RunCanceller
+from app.infrastructure.cancellation.memory import InMemoryRunCanceller
+from app.infrastructure.cancellation.postgres import PostgresRunCanceller
+from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.database.notifications import NotificationListener
+from app.infrastructure.streams import RunEventBroker
+
+logger = logging.getLogger(__name__)
+
+
+class RunCancellerFactory:
+    @classmethod
+    def create(
+        cls,
+        database_connection: DatabaseConnection | None,
+        listener: NotificationListener | None,
+        broker: RunEventBroker,
+    ) -> RunCanceller:
+        if database_connection is not None and listener is not None:
+            logger.debug("Cancelling runs across workers through Postgres NOTIFY")
+            return PostgresRunCanceller(database_connection, listener, broker)
+        return InMemoryRunCanceller()
@@ -0,0 +1,10 @@
+from app.infrastructure.cancellation.base import RUN_CANCELLATIONS_TOTAL, RunCanceller
+
+
+class InMemoryRunCanceller(RunCanceller):
+    """Cancels runs of the current process, which is every run without Postgres."""
+
+    async def cancel(self, thread_id: str, run_id: str) -> bool:
+        cancelled = self._cancel_local(thread_id, run_id)
+        RUN_CANCELLATIONS_TOTAL.labels("local" if cancelled else "not_running").inc()
+        return cancelled
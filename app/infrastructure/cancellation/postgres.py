@@ -0,0 +1,51 @@
+import logging
+
+from app.infrastructure.cancellation.base import RUN_CANCELLATIONS_TOTAL, RunCanceller
+from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.database.notifications import NotificationListener
+from app.infrastructure.streams import RunEventBroker
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "run_cancellations"
+
+NOTIFY_SQL = "SELECT pg_notify(%s, %s)"
+
+
+class PostgresRunCanceller(RunCanceller):
+    """Cancels runs on any worker through Postgres ``NOTIFY``.
+
+    A run of this process is cancelled directly. Otherwise, if *broker* knows
+    the run as started and not finished, every worker is notified and the one
+    executing the run cancels it; since nobody answers, the run may still
+    finish before the notification arrives.
+    """
+
+    def __init__(
+        self,
+        database_connection: DatabaseConnection,
+        listener: NotificationListener,
+        broker: RunEventBroker,
+    ):
+        super().__init__()
+        self.database_connection = database_connection
+        self.broker = broker
+        listener.add_handler(CHANNEL, self._on_notification)
+
+    async def cancel(self, thread_id: str, run_id: str) -> bool:
+        if self._cancel_local(thread_id, run_id):
+            RUN_CANCELLATIONS_TOTAL.labels("local").inc()
+            return True
+        if not await self.broker.is_running(thread_id, run_id):
+            RUN_CANCELLATIONS_TOTAL.labels("not_running").inc()
+            return False
+
+        async with self.database_connection.connection() as conn:
+            await conn.execute(NOTIFY_SQL, (CHANNEL, f"{thread_id}:{run_id}"))
+        RUN_CANCELLATIONS_TOTAL.labels("notified").inc()
+        return True
+
+    def _on_notification(self, payload: str) -> None:
+        thread_id, _, run_id = payload.partition(":")
+        if self._cancel_local(thread_id, run_id):
+            logger.debug(f"Cancelled run {run_id} on request of another worker")
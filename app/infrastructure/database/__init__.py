@@ -1,4 +1,10 @@
 from .connection import DatabaseConnection, DatabaseConnectionFactory
+from .notifications import NotificationListener
 from .postgresql_connection import PostgreSQLConnection
 
-__all__ = ["DatabaseConnection", "DatabaseConnectionFactory", "PostgreSQLConnection"]
+__all__ = [
+    "DatabaseConnection",
+    "DatabaseConnectionFactory",
+    "NotificationListener",
+    "PostgreSQLConnection",
+]
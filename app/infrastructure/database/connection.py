@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from app.bootstrap.config import AppConfig
@@ -9,14 +11,21 @@ class DatabaseConnection(ABC):
     def get_sync_connection(self) -> Any:
         pass
 
-    @abstractmethod
-    async def get_async_connection(self) -> Any:
-        pass
-
     @abstractmethod
     async def get_pool(self) -> Any:
         pass
 
+    @asynccontextmanager
+    async def connection(self, timeout: float | None = None) -> AsyncIterator[Any]:
+        """Borrow a pooled connection for the duration of the block.
+
+        The connection goes back to the pool however the block exits; a
+        transaction left open is rolled back first.
+        """
+        pool = await self.get_pool()
+        async with pool.connection(timeout=timeout) as conn:
+            yield conn
+
     @abstractmethod
     def get_connection_string(self) -> str:
         pass
@@ -25,6 +34,19 @@ class DatabaseConnection(ABC):
     def close(self) -> Any:
         pass
 
+    def get_pool_stats(self) -> dict[str, int]:
+        """Return connection pool counters, empty when no pool is open."""
+        return {}
+
+    def get_pool_saturation(self) -> float:
+        """Fraction of the pool in use or waited for, 0.0 when unknown."""
+        stats = self.get_pool_stats()
+        pool_max = stats.get("pool_max", 0)
+        if not pool_max:
+            return 0.0
+        in_use = stats.get("pool_size", 0) - stats.get("pool_available", 0)
+        return (in_use + stats.get("requests_waiting", 0)) / pool_max
+
 
 class DatabaseConnectionFactory:
     @staticmethod
@@ -0,0 +1,100 @@
+import weakref
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+from prometheus_client import REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+if TYPE_CHECKING:
+    from app.infrastructure.database.connection import DatabaseConnection
+
+
+class PoolStatsCollector(Collector):
+    """Exports the statistics of every open connection pool on scrape.
+
+    Reads the pool's own counters (``get_stats``), so connections taken by
+    langgraph's savers are accounted for as well as our own. Connections are
+    tracked weakly and labelled by pool name.
+    """
+
+    def __init__(self) -> None:
+        self._connections: weakref.WeakValueDictionary[str, DatabaseConnection] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def track(self, name: str, connection: "DatabaseConnection") -> None:
+        self._connections[name] = connection
+
+    def collect(self) -> Iterator[GaugeMetricFamily | CounterMetricFamily]:
+        size = GaugeMetricFamily(
+            "db_pool_connections", "Open connections in the pool.", labels=["pool"]
+        )
+        in_use = GaugeMetricFamily(
+            "db_pool_connections_in_use",
+            "Connections currently checked out of the pool.",
+            labels=["pool"],
+        )
+        idle = GaugeMetricFamily(
+            "db_pool_connections_idle",
+            "Connections waiting in the pool to be used.",
+            labels=["pool"],
+        )
+        max_size = GaugeMetricFamily(
+            "db_pool_connections_max", "Configured pool max_size.", labels=["pool"]
+        )
+        waiting = GaugeMetricFamily(
+            "db_pool_requests_waiting",
+            "Clients waiting for a connection right now.",
+            labels=["pool"],
+        )
+        requests = CounterMetricFamily(
+            "db_pool_requests",
+            "Connections requested from the pool.",
+            labels=["pool"],
+        )
+        queued = CounterMetricFamily(
+            "db_pool_requests_queued",
+            "Requests that had to wait for a connection.",
+            labels=["pool"],
+        )
+        wait = CounterMetricFamily(
+            "db_pool_wait_seconds",
+            "Total time spent waiting for a connection.",
+            labels=["pool"],
+        )
+        errors = CounterMetricFamily(
+            "db_pool_request_errors",
+            "Requests that failed, timed out or were rejected by the pool.",
+            labels=["pool"],
+        )
+        lost = CounterMetricFamily(
+            "db_pool_connections_lost",
+            "Connections found broken by health checks or on return.",
+            labels=["pool"],
+        )
+
+        for name, connection in list(self._connections.items()):
+            stats = connection.get_pool_stats()
+            if not stats:
+                continue
+            available = stats.get("pool_available", 0)
+            size.add_metric([name], stats.get("pool_size", 0))
+            in_use.add_metric([name], stats.get("pool_size", 0) - available)
+            idle.add_metric([name], available)
+            max_size.add_metric([name], stats.get("pool_max", 0))
+            waiting.add_metric([name], stats.get("requests_waiting", 0))
+            requests.add_metric([name], stats.get("requests_num", 0))
+            queued.add_metric([name], stats.get("requests_queued", 0))
+            wait.add_metric([name], stats.get("requests_wait_ms", 0) / 1000)
+            errors.add_metric([name], stats.get("requests_errors", 0))
+            lost.add_metric(
+                [name], stats.get("connections_lost", 0) + stats.get("returns_bad", 0)
+            )
+
+        yield from (size, in_use, idle, max_size, waiting)
+        yield from (requests, queued, wait, errors, lost)
+
+
+POOL_STATS = PoolStatsCollector()
+REGISTRY.register(POOL_STATS)
@@ -0,0 +1,81 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from psycopg import AsyncConnection, sql
+
+from app.infrastructure.database.connection import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+NotificationHandler = Callable[[str], None]
+
+
+class NotificationListener:
+    """Dispatches Postgres ``NOTIFY`` payloads to in-process handlers.
+
+    One pooled connection is held for the lifetime of the listener and
+    ``LISTEN``s on every channel that has a handler. Handlers run on the event
+    loop and must not block. Channels have to be registered before ``start``;
+    when the connection drops it is replaced after *reconnect_delay* seconds,
+    and notifications sent in between are lost, so consumers should treat a
+    notification as a hint and keep a slow poll as fallback.
+    """
+
+    def __init__(
+        self, database_connection: DatabaseConnection, reconnect_delay: float = 1.0
+    ):
+        self.database_connection = database_connection
+        self._reconnect_delay = reconnect_delay
+        self._handlers: dict[str, list[NotificationHandler]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def add_handler(self, channel: str, handler: NotificationHandler) -> None:
+        if self._task is not None:
+            raise RuntimeError("Handlers must be registered before the listener starts")
+        self._handlers.setdefault(channel, []).append(handler)
+
+    async def start(self) -> None:
+        if self._task is None and self._handlers:
+            self._task = asyncio.create_task(self._listen_loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _listen_loop(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Notification listener disconnected: {e}")
+            await asyncio.sleep(self._reconnect_delay)
+
+    async def _listen(self) -> None:
+        pool = await self.database_connection.get_pool()
+        conn: AsyncConnection[Any] = await pool.getconn()
+        try:
+            for channel in self._handlers:
+                await conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+            logger.debug(f"Listening on {', '.join(self._handlers)}")
+
+            async for notification in conn.notifies():
+                self._dispatch(notification.channel, notification.payload)
+        finally:
+            with contextlib.suppress(Exception):
+                await asyncio.shield(conn.execute("UNLISTEN *"))
+            await asyncio.shield(pool.putconn(conn))
+
+    def _dispatch(self, channel: str, payload: str) -> None:
+        for handler in self._handlers.get(channel, ()):
+            try:
+                handler(payload)
+            except Exception as e:
+                logger.error(f"Notification handler for {channel} failed: {e}")
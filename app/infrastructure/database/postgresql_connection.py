@@ -1,24 +1,26 @@
 import logging
 from typing import Any
 
-from psycopg import AsyncConnection
 from psycopg.rows import dict_row
 from psycopg_pool import AsyncConnectionPool
 
 from app.bootstrap.config import AppConfig
 from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.database.metrics import POOL_STATS
 
 logger = logging.getLogger(__name__)
 
 
 class PostgreSQLConnection(DatabaseConnection):
-    def __init__(self, config: AppConfig):
+    def __init__(self, config: AppConfig, name: str = "main"):
         self.config = config
+        self.name = name
         self._pool: AsyncConnectionPool | None = None
         self._connection_kwargs = {
             "autocommit": True,  # Mandatory for checkpointing
             "row_factory": dict_row,  # Mandatory for checkpointing
         }
+        POOL_STATS.track(name, self)
 
     def get_connection_string(self) -> str:
         if not self.config.database_url:
@@ -31,24 +33,27 @@ class PostgreSQLConnection(DatabaseConnection):
             "Sync connection not supported in async implementation"
         )
 
-    async def get_async_connection(self) -> AsyncConnection:
-        pool = await self.get_pool()
-        try:
-            return await pool.getconn()
-        except Exception as e:
-            logger.error(f"Failed to get connection from pool: {e}")
-            raise
-
     async def get_pool(self) -> AsyncConnectionPool:
         if self._pool is None:
             try:
                 self._pool = AsyncConnectionPool(
                     conninfo=self.get_connection_string(),
-                    min_size=1,
-                    max_size=20,
+                    min_size=self.config.database_pool_min_size,
+                    max_size=self.config.database_pool_max_size,
+                    timeout=self.config.database_pool_timeout,
+                    max_waiting=self.config.database_pool_max_waiting,
+                    max_idle=self.config.database_pool_max_idle,
+                    max_lifetime=self.config.database_pool_max_lifetime,
+                    check=(
+                        AsyncConnectionPool.check_connection
+                        if self.config.database_pool_check
+                        else None
+                    ),
                     kwargs=self._connection_kwargs,
+                    name=self.name,
+                    open=False,
                 )
-                await self._pool.wait()
+                await self._pool.open(wait=True)
                 logger.debug("PostgreSQL connection pool initialized")
             except Exception as e:
                 logger.error(f"Failed to initialize PostgreSQL connection pool: {e}")
@@ -56,7 +61,13 @@ class PostgreSQLConnection(DatabaseConnection):
 
         return self._pool
 
+    def get_pool_stats(self) -> dict[str, int]:
+        if self._pool is None:
+            return {}
+        return self._pool.get_stats()
+
     async def close(self) -> Any:
         if self._pool:
             await self._pool.close()
+            self._pool = None
             logger.debug("PostgreSQL connection pool closed")
@@ -0,0 +1,13 @@
+from .base import IdempotencyRecord, IdempotencyStore, fingerprint
+from .factory import IdempotencyStoreFactory
+from .memory import InMemoryIdempotencyStore
+from .postgres import PostgresIdempotencyStore
+
+__all__ = [
+    "IdempotencyRecord",
+    "IdempotencyStore",
+    "IdempotencyStoreFactory",
+    "InMemoryIdempotencyStore",
+    "PostgresIdempotencyStore",
+    "fingerprint",
+]
@@ -0,0 +1,53 @@
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from typing import Any, NamedTuple
+
+
+class IdempotencyRecord(NamedTuple):
+    """The run an idempotency key was first used for."""
+
+    thread_id: str
+    run_id: str
+    fingerprint: str
+
+
+def fingerprint(*parts: Any) -> str:
+    """Digest of the request a key was used with, to spot reuse for another one."""
+    raw = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class IdempotencyStore(ABC):
+    """Remembers which run each idempotency key started, for *ttl* seconds.
+
+    Keys are scoped, normally per user, so clients cannot collide with or
+    probe each other's keys.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+
+    async def start(self) -> None:  # noqa: B027
+        """Create storage and start background work."""
+        pass
+
+    async def cleanup(self) -> None:  # noqa: B027
+        """Stop background work and release backend resources."""
+        pass
+
+    @abstractmethod
+    async def claim(
+        self, scope: str, key: str, record: IdempotencyRecord
+    ) -> IdempotencyRecord:
+        """Bind *key* to *record* unless it is bound already.
+
+        Returns the record the key is bound to: *record* itself when this
+        call claimed the key, the earlier one otherwise.
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, scope: str, key: str, run_id: str) -> None:
+        """Forget *key* if it still belongs to *run_id*, e.g. when the run never started."""
+        pass
@@ -0,0 +1,22 @@
+import logging
+
+from app.bootstrap.config import AppConfig
+from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.idempotency.base import IdempotencyStore
+from app.infrastructure.idempotency.memory import InMemoryIdempotencyStore
+from app.infrastructure.idempotency.postgres import PostgresIdempotencyStore
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyStoreFactory:
+    @classmethod
+    def create(
+        cls, config: AppConfig, database_connection: DatabaseConnection | None
+    ) -> IdempotencyStore:
+        if config.idempotency_backend == "postgres" and database_connection is not None:
+            logger.debug("Sharing idempotency keys between workers through Postgres")
+            return PostgresIdempotencyStore(database_connection, config.idempotency_ttl)
+        return InMemoryIdempotencyStore(
+            config.idempotency_ttl, config.idempotency_cache_size
+        )
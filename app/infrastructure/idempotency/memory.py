@@ -0,0 +1,30 @@
+from app.infrastructure.idempotency.base import IdempotencyRecord, IdempotencyStore
+from app.utils.cache import TTLCache
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """Keys of this worker, at most *maxsize* of them.
+
+    Under pressure the least recently used keys are forgotten before their
+    TTL, so a very late retry may execute again.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 10000):
+        super().__init__(ttl)
+        self._records: TTLCache[tuple[str, str], IdempotencyRecord] = TTLCache(
+            maxsize, ttl
+        )
+
+    async def claim(
+        self, scope: str, key: str, record: IdempotencyRecord
+    ) -> IdempotencyRecord:
+        existing = self._records.get((scope, key))
+        if existing is not None:
+            return existing
+        self._records.set((scope, key), record)
+        return record
+
+    async def release(self, scope: str, key: str, run_id: str) -> None:
+        existing = self._records.get((scope, key))
+        if existing is not None and existing.run_id == run_id:
+            self._records.pop((scope, key))
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+
+from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.idempotency.base import IdempotencyRecord, IdempotencyStore
+
+logger = logging.getLogger(__name__)
+
+SETUP_SQL = """
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    scope text NOT NULL,
+    key text NOT NULL,
+    thread_id text NOT NULL,
+    run_id text NOT NULL,
+    fingerprint text NOT NULL,
+    expires_at timestamptz NOT NULL,
+    PRIMARY KEY (scope, key)
+);
+"""
+
+# An expired key is taken over in place; a live one is left alone, in which
+# case no row comes back.
+CLAIM_SQL = """
+INSERT INTO idempotency_keys AS k
+    (scope, key, thread_id, run_id, fingerprint, expires_at)
+VALUES (%s, %s, %s, %s, %s, now() + make_interval(secs => %s))
+ON CONFLICT (scope, key) DO UPDATE
+SET thread_id = EXCLUDED.thread_id,
+    run_id = EXCLUDED.run_id,
+    fingerprint = EXCLUDED.fingerprint,
+    expires_at = EXCLUDED.expires_at
+WHERE k.expires_at <= now()
+RETURNING thread_id, run_id, fingerprint
+"""
+
+SELECT_SQL = """
+SELECT thread_id, run_id, fingerprint FROM idempotency_keys
+WHERE scope = %s AND key = %s AND expires_at > now()
+"""
+
+RELEASE_SQL = """
+DELETE FROM idempotency_keys WHERE scope = %s AND key = %s AND run_id = %s
+"""
+
+PRUNE_SQL = "DELETE FROM idempotency_keys WHERE expires_at <= now()"
+
+
+class PostgresIdempotencyStore(IdempotencyStore):
+    """Keys shared by every worker, so a retry may land on any of them.
+
+    Expired keys are deleted every *ttl* seconds.
+    """
+
+    def __init__(self, database_connection: DatabaseConnection, ttl: float):
+        super().__init__(ttl)
+        self.database_connection = database_connection
+        self._pruner: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        async with self.database_connection.connection() as conn:
+            await conn.execute(SETUP_SQL)
+        if self._pruner is None:
+            self._pruner = asyncio.create_task(self._prune_loop())
+
+    async def cleanup(self) -> None:
+        if self._pruner is not None:
+            self._pruner.cancel()
+            await asyncio.gather(self._pruner, return_exceptions=True)
+            self._pruner = None
+
+    async def claim(
+        self, scope: str, key: str, record: IdempotencyRecord
+    ) -> IdempotencyRecord:
+        async with self.database_connection.connection() as conn:
+            while True:
+                cursor = await conn.execute(CLAIM_SQL, (scope, key, *record, self.ttl))
+                row = await cursor.fetchone()
+                if row is None:
+                    cursor = await conn.execute(SELECT_SQL, (scope, key))
+                    row = await cursor.fetchone()
+                # Nothing either way means the key expired in between.
+                if row is not None:
+                    return IdempotencyRecord(**row)
+
+    async def release(self, scope: str, key: str, run_id: str) -> None:
+        async with self.database_connection.connection() as conn:
+            await conn.execute(RELEASE_SQL, (scope, key, run_id))
+
+    async def _prune_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.ttl)
+            try:
+                async with self.database_connection.connection() as conn:
+                    await conn.execute(PRUNE_SQL)
+            except Exception as e:
+                logger.error(f"Failed to prune idempotency keys: {e}")
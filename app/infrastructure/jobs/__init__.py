@@ -0,0 +1,15 @@
+from .base import Job, JobHandler, JobQueue, UnknownQueueError
+from .factory import JobQueueFactory
+from .memory import DeadJob, InMemoryJobQueue
+from .postgres import PostgresJobQueue
+
+__all__ = [
+    "DeadJob",
+    "InMemoryJobQueue",
+    "Job",
+    "JobHandler",
+    "JobQueue",
+    "JobQueueFactory",
+    "PostgresJobQueue",
+    "UnknownQueueError",
+]
@@ -0,0 +1,182 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+from prometheus_client import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUE_DEPTH = Gauge(
+    "job_queue_depth", "Jobs waiting or running per queue.", ["queue"]
+)
+JOB_QUEUE_LATENCY_SECONDS = Histogram(
+    "job_queue_latency_seconds",
+    "Time a job waited from being due until a worker picked it up.",
+    ["queue"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+JOB_DURATION_SECONDS = Histogram(
+    "job_duration_seconds",
+    "Time spent executing a job.",
+    ["queue"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+JOBS_TOTAL = Counter(
+    "jobs_total", "Finished job attempts per queue.", ["queue", "outcome"]
+)
+
+JobHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class Job(NamedTuple):
+    """A claimed job; *attempts* counts this one."""
+
+    id: str
+    queue: str
+    payload: dict[str, Any]
+    attempts: int
+    waited: float
+
+
+class UnknownQueueError(ValueError):
+    """Raised when a job is enqueued on a queue without a handler."""
+
+    def __init__(self, queue: str):
+        super().__init__(f"No handler registered for queue: {queue}")
+        self.queue = queue
+
+
+class JobQueue(ABC):
+    """Durable work the request path hands off instead of waiting for it.
+
+    Each queue name has one handler, registered before ``start``; payloads
+    are JSON objects. *workers* coroutines take due jobs from every queue.
+    A job whose handler raises is retried after an exponential backoff
+    starting at *retry_backoff* seconds and capped at *max_backoff*; after
+    *max_attempts* attempts it is moved to the dead letters instead. Jobs
+    are executed at least once, so handlers must be safe to repeat.
+
+    Idle workers wait for an enqueue or *poll_interval* seconds, whichever
+    comes first.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_attempts: int = 5,
+        retry_backoff: float = 1.0,
+        max_backoff: float = 300.0,
+        poll_interval: float = 1.0,
+    ):
+        self.max_attempts = max_attempts
+        self._worker_count = workers
+        self._retry_backoff = retry_backoff
+        self._max_backoff = max_backoff
+        self._poll_interval = poll_interval
+        self._handlers: dict[str, JobHandler] = {}
+        self._workers: list[asyncio.Task[None]] = []
+        self._wakeup = asyncio.Event()
+
+    @property
+    def queues(self) -> list[str]:
+        return list(self._handlers)
+
+    def register(self, queue: str, handler: JobHandler) -> None:
+        if self._workers:
+            raise RuntimeError("Handlers must be registered before the queue starts")
+        self._handlers[queue] = handler
+
+    async def start(self) -> None:
+        """Create storage and start the workers."""
+        if not self._workers and self._handlers:
+            self._workers = [
+                asyncio.create_task(self._work()) for _ in range(self._worker_count)
+            ]
+
+    async def cleanup(self) -> None:
+        """Stop the workers; jobs they were executing are retried later."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def enqueue(
+        self, queue: str, payload: dict[str, Any], delay: float = 0.0
+    ) -> str:
+        """Store a job for *queue*, due in *delay* seconds, and return its id."""
+        if queue not in self._handlers:
+            raise UnknownQueueError(queue)
+        job_id = await self._put(queue, payload, delay)
+        self._wakeup.set()
+        return job_id
+
+    async def run_once(self) -> bool:
+        """Execute one due job, returning whether there was one."""
+        job = await self._claim()
+        if job is None:
+            return False
+        JOB_QUEUE_LATENCY_SECONDS.labels(job.queue).observe(job.waited)
+
+        try:
+            with JOB_DURATION_SECONDS.labels(job.queue).time():
+                await self._handlers[job.queue](job.payload)
+        except asyncio.CancelledError:
+            await asyncio.shield(self._retry(job, 0.0, "Worker stopped"))
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if job.attempts >= self.max_attempts:
+                logger.error(f"Job {job.id} on {job.queue} failed for good: {error}")
+                JOBS_TOTAL.labels(job.queue, "dead").inc()
+                await self._dead_letter(job, error)
+            else:
+                logger.warning(f"Job {job.id} on {job.queue} failed: {error}")
+                JOBS_TOTAL.labels(job.queue, "retried").inc()
+                await self._retry(job, self.backoff(job.attempts), error)
+        else:
+            JOBS_TOTAL.labels(job.queue, "succeeded").inc()
+            await self._complete(job)
+        return True
+
+    def backoff(self, attempts: int) -> float:
+        """Seconds to wait before the attempt following *attempts* failures."""
+        return float(min(self._retry_backoff * 2 ** (attempts - 1), self._max_backoff))
+
+    async def _work(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                if await self.run_once():
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job worker failed: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+            except TimeoutError:
+                pass
+
+    @abstractmethod
+    async def _put(self, queue: str, payload: dict[str, Any], delay: float) -> str:
+        pass
+
+    @abstractmethod
+    async def _claim(self) -> Job | None:
+        """Take the next due job of a registered queue, counting an attempt."""
+        pass
+
+    @abstractmethod
+    async def _complete(self, job: Job) -> None:
+        pass
+
+    @abstractmethod
+    async def _retry(self, job: Job, delay: float, error: str) -> None:
+        """Make *job* due again in *delay* seconds."""
+        pass
+
+    @abstractmethod
+    async def _dead_letter(self, job: Job, error: str) -> None:
+        pass
@@ -0,0 +1,33 @@
+import logging
+
+from app.bootstrap.config import AppConfig
+from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.database.notifications import NotificationListener
+from app.infrastructure.jobs.base import JobQueue
+from app.infrastructure.jobs.memory import InMemoryJobQueue
+from app.infrastructure.jobs.postgres import PostgresJobQueue
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFactory:
+    @classmethod
+    def create(
+        cls,
+        config: AppConfig,
+        database_connection: DatabaseConnection | None,
+        listener: NotificationListener | None = None,
+    ) -> JobQueue:
+        options = {
+            "workers": config.jobs_workers,
+            "max_attempts": config.jobs_max_attempts,
+            "retry_backoff": config.jobs_retry_backoff,
+            "max_backoff": config.jobs_max_backoff,
+            "poll_interval": config.jobs_poll_interval,
+        }
+        if config.jobs_backend == "postgres" and database_connection is not None:
+            logger.debug("Running background jobs from the Postgres job queue")
+            return PostgresJobQueue(
+                database_connection, listener, lease=config.jobs_lease, **options
+            )
+        return InMemoryJobQueue(**options)
@@ -0,0 +1,59 @@
+import heapq
+import itertools
+import time
+from typing import Any, NamedTuple
+from uuid import uuid4
+
+from app.infrastructure.jobs.base import JOB_QUEUE_DEPTH, Job, JobQueue
+
+
+class DeadJob(NamedTuple):
+    job: Job
+    error: str
+
+
+class InMemoryJobQueue(JobQueue):
+    """Jobs held in process memory, for tests and single-worker setups.
+
+    Jobs do not survive a restart. Dead letters are kept in ``dead``.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.dead: list[DeadJob] = []
+        self._due: list[tuple[float, int, Job]] = []
+        self._order = itertools.count()
+        self._depth: dict[str, int] = {}
+
+    @property
+    def pending(self) -> int:
+        return sum(self._depth.values())
+
+    async def _put(self, queue: str, payload: dict[str, Any], delay: float) -> str:
+        job = Job(str(uuid4()), queue, payload, 0, 0.0)
+        self._schedule(job, delay)
+        self._count(queue, 1)
+        return job.id
+
+    async def _claim(self) -> Job | None:
+        if not self._due or self._due[0][0] > time.monotonic():
+            return None
+        due_at, _, job = heapq.heappop(self._due)
+        return job._replace(attempts=job.attempts + 1, waited=time.monotonic() - due_at)
+
+    async def _complete(self, job: Job) -> None:
+        self._count(job.queue, -1)
+
+    async def _retry(self, job: Job, delay: float, error: str) -> None:
+        self._schedule(job, delay)
+
+    async def _dead_letter(self, job: Job, error: str) -> None:
+        self.dead.append(DeadJob(job, error))
+        self._count(job.queue, -1)
+
+    def _schedule(self, job: Job, delay: float) -> None:
+        heapq.heappush(self._due, (time.monotonic() + delay, next(self._order), job))
+
+    def _count(self, queue: str, delta: int) -> None:
+        self._depth[queue] = self._depth.get(queue, 0) + delta
+        JOB_QUEUE_DEPTH.labels(queue).set(self._depth[queue])
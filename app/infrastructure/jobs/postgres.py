@@ -0,0 +1,183 @@
+import asyncio
+import logging
+from typing import Any
+
+from psycopg.types.json import Jsonb
+
+from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.database.notifications import NotificationListener
+from app.infrastructure.jobs.base import JOB_QUEUE_DEPTH, Job, JobQueue
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "jobs"
+
+SETUP_SQL = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id bigserial PRIMARY KEY,
+    queue text NOT NULL,
+    payload jsonb NOT NULL,
+    attempts integer NOT NULL DEFAULT 0,
+    run_at timestamptz NOT NULL DEFAULT now(),
+    locked_until timestamptz,
+    last_error text,
+    created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS jobs_queue_run_at_idx ON jobs (queue, run_at);
+CREATE TABLE IF NOT EXISTS dead_jobs (
+    id bigint PRIMARY KEY,
+    queue text NOT NULL,
+    payload jsonb NOT NULL,
+    attempts integer NOT NULL,
+    last_error text,
+    created_at timestamptz NOT NULL,
+    failed_at timestamptz NOT NULL DEFAULT now()
+);
+"""
+
+ENQUEUE_SQL = """
+WITH job AS (
+    INSERT INTO jobs (queue, payload, run_at)
+    VALUES (%s, %s, now() + make_interval(secs => %s))
+    RETURNING id, queue
+)
+SELECT id, pg_notify(%s, queue) FROM job
+"""
+
+# Claimed jobs are leased rather than kept locked, so no connection is held
+# while the handler runs. A worker that dies lets its lease run out and the
+# job becomes due again. Other workers skip rows that are being claimed.
+CLAIM_SQL = """
+UPDATE jobs
+SET attempts = attempts + 1,
+    locked_until = now() + make_interval(secs => %(lease)s)
+WHERE id = (
+    SELECT id FROM jobs
+    WHERE queue = ANY(%(queues)s)
+      AND run_at <= now()
+      AND (locked_until IS NULL OR locked_until <= now())
+    ORDER BY run_at, id
+    LIMIT 1
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING id, queue, payload, attempts,
+    extract(epoch FROM now() - run_at)::float8 AS waited
+"""
+
+COMPLETE_SQL = "DELETE FROM jobs WHERE id = %s"
+
+RETRY_SQL = """
+UPDATE jobs
+SET run_at = now() + make_interval(secs => %s), locked_until = NULL, last_error = %s
+WHERE id = %s
+"""
+
+DEAD_LETTER_SQL = """
+WITH job AS (DELETE FROM jobs WHERE id = %s RETURNING *)
+INSERT INTO dead_jobs (id, queue, payload, attempts, last_error, created_at)
+SELECT id, queue, payload, attempts, %s, created_at FROM job
+ON CONFLICT (id) DO NOTHING
+"""
+
+DEPTH_SQL = """
+SELECT queue, count(*) AS depth FROM jobs WHERE queue = ANY(%s) GROUP BY queue
+"""
+
+
+class PostgresJobQueue(JobQueue):
+    """Jobs in a ``jobs`` table shared by every worker process.
+
+    Workers claim due jobs with ``FOR UPDATE SKIP LOCKED`` and hold them for
+    *lease* seconds, which must exceed the slowest handler. Enqueues
+    ``NOTIFY`` idle workers when a *listener* is given. Failed jobs move to
+    ``dead_jobs``. Queue depths are sampled every *depth_interval* seconds.
+    """
+
+    def __init__(
+        self,
+        database_connection: DatabaseConnection,
+        listener: NotificationListener | None = None,
+        lease: float = 300.0,
+        depth_interval: float = 15.0,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.database_connection = database_connection
+        self._lease = lease
+        self._depth_interval = depth_interval
+        self._sampler: asyncio.Task[None] | None = None
+        if listener is not None:
+            listener.add_handler(CHANNEL, self._on_notification)
+
+    async def start(self) -> None:
+        async with self.database_connection.connection() as conn:
+            await conn.execute(SETUP_SQL)
+        await super().start()
+        if self._sampler is None:
+            self._sampler = asyncio.create_task(self._sample_loop())
+
+    async def cleanup(self) -> None:
+        if self._sampler is not None:
+            self._sampler.cancel()
+            await asyncio.gather(self._sampler, return_exceptions=True)
+            self._sampler = None
+        await super().cleanup()
+
+    async def _put(self, queue: str, payload: dict[str, Any], delay: float) -> str:
+        async with self.database_connection.connection() as conn:
+            cursor = await conn.execute(
+                ENQUEUE_SQL, (queue, Jsonb(payload), delay, CHANNEL)
+            )
+            row = await cursor.fetchone()
+        return str(row["id"])
+
+    async def _claim(self) -> Job | None:
+        async with self.database_connection.connection() as conn:
+            cursor = await conn.execute(
+                CLAIM_SQL, {"queues": self.queues, "lease": self._lease}
+            )
+            row = await cursor.fetchone()
+        if row is None:
+            return None
+        return Job(
+            str(row["id"]),
+            row["queue"],
+            row["payload"],
+            row["attempts"],
+            max(row["waited"], 0.0),
+        )
+
+    async def _complete(self, job: Job) -> None:
+        async with self.database_connection.connection() as conn:
+            await conn.execute(COMPLETE_SQL, (int(job.id),))
+
+    async def _retry(self, job: Job, delay: float, error: str) -> None:
+        async with self.database_connection.connection() as conn:
+            await conn.execute(RETRY_SQL, (delay, error, int(job.id)))
+
+    async def _dead_letter(self, job: Job, error: str) -> None:
+        async with self.database_connection.connection() as conn:
+            await conn.execute(DEAD_LETTER_SQL, (int(job.id), error))
+
+    def _on_notification(self, payload: str) -> None:
+        if payload in self._handlers:
+            self._wakeup.set()
+
+    async def sample_depth(self) -> dict[str, int]:
+        """Record and return how many jobs each queue holds."""
+        async with self.database_connection.connection() as conn:
+            cursor = await conn.execute(DEPTH_SQL, (self.queues,))
+            rows = await cursor.fetchall()
+        depths = dict.fromkeys(self.queues, 0)
+        depths.update({row["queue"]: row["depth"] for row in rows})
+        for queue, depth in depths.items():
+            JOB_QUEUE_DEPTH.labels(queue).set(depth)
+        return depths
+
+    async def _sample_loop(self) -> None:
+        while True:
+            try:
+                await self.sample_depth()
+            except Exception as e:
+                logger.error(f"Failed to sample job queue depth: {e}")
+            await asyncio.sleep(self._depth_interval)
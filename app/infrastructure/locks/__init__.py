@@ -0,0 +1,14 @@
+from .factory import RunLockFactory
+from .memory import InMemoryRunLock
+from .postgres import PostgresRunLock
+from .run_lock import RunConflictError, RunLease, RunLock, RunLockPolicy
+
+__all__ = [
+    "RunLock",
+    "RunLease",
+    "RunLockPolicy",
+    "RunConflictError",
+    "RunLockFactory",
+    "InMemoryRunLock",
+    "PostgresRunLock",
+]
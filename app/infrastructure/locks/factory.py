@@ -0,0 +1,18 @@
+import logging
+
+from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.locks.memory import InMemoryRunLock
+from app.infrastructure.locks.postgres import PostgresRunLock
+from app.infrastructure.locks.run_lock import RunLock
+
+logger = logging.getLogger(__name__)
+
+
+class RunLockFactory:
+    @classmethod
+    def create(cls, database_connection: DatabaseConnection | None) -> RunLock:
+        if database_connection is not None:
+            logger.debug("Using Postgres advisory locks for thread runs")
+            return PostgresRunLock(database_connection)
+
+        return InMemoryRunLock()
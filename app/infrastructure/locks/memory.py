@@ -0,0 +1,83 @@
+import asyncio
+import logging
+
+from app.infrastructure.locks.run_lock import (
+    RunConflictError,
+    RunLease,
+    RunLock,
+    RunLockPolicy,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _ThreadSlot:
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.lease: RunLease | None = None
+        self.waiters = 0
+
+
+class _MemoryRunLease(RunLease):
+    def __init__(self, owner: "InMemoryRunLock", thread_id: str) -> None:
+        super().__init__(thread_id)
+        self._owner = owner
+
+    async def _release(self) -> None:
+        self._owner._release(self)
+
+
+class InMemoryRunLock(RunLock):
+    """Per-thread run lock scoped to the current process."""
+
+    def __init__(self) -> None:
+        self._slots: dict[str, _ThreadSlot] = {}
+
+    def is_locked(self, thread_id: str) -> bool:
+        slot = self._slots.get(thread_id)
+        return slot is not None and slot.lock.locked()
+
+    async def _acquire(
+        self, thread_id: str, policy: RunLockPolicy, timeout: float | None
+    ) -> RunLease:
+        slot = self._slots.setdefault(thread_id, _ThreadSlot())
+
+        if slot.lock.locked():
+            if policy is RunLockPolicy.reject:
+                raise RunConflictError(thread_id)
+            if policy is RunLockPolicy.interrupt and slot.lease is not None:
+                logger.debug(f"Interrupting active run on thread {thread_id}")
+                slot.lease.interrupt()
+
+        slot.waiters += 1
+        try:
+            await asyncio.wait_for(slot.lock.acquire(), timeout)
+        except TimeoutError as e:
+            raise RunConflictError(
+                thread_id, f"Timed out waiting for the active run on thread {thread_id}"
+            ) from e
+        finally:
+            slot.waiters -= 1
+            self._discard_idle(thread_id, slot)
+
+        lease = _MemoryRunLease(self, thread_id)
+        slot.lease = lease
+        return lease
+
+    async def cleanup(self) -> None:
+        for slot in self._slots.values():
+            if slot.lease is not None:
+                slot.lease.interrupt()
+
+    def _release(self, lease: RunLease) -> None:
+        slot = self._slots.get(lease.thread_id)
+        if slot is None or slot.lease is not lease:
+            return
+        slot.lease = None
+        slot.lock.release()
+        self._discard_idle(lease.thread_id, slot)
+
+    def _discard_idle(self, thread_id: str, slot: _ThreadSlot) -> None:
+        if slot.waiters == 0 and not slot.lock.locked():
+            if self._slots.get(thread_id) is slot:
+                del self._slots[thread_id]
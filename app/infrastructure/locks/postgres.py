@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import time
+from typing import Any
+
+from psycopg import AsyncConnection
+from psycopg.rows import dict_row
+
+from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.locks.memory import InMemoryRunLock
+from app.infrastructure.locks.run_lock import (
+    RunConflictError,
+    RunLease,
+    RunLockPolicy,
+)
+
+logger = logging.getLogger(__name__)
+
+# Advisory locks live in a single bigint keyspace shared by the whole
+# database; hashing the thread id keeps run locks apart from anything else
+# as long as other users pick their own keys.
+TRY_LOCK_SQL = "SELECT pg_try_advisory_lock(hashtextextended(%s, 0)) AS locked"
+UNLOCK_SQL = "SELECT pg_advisory_unlock(hashtextextended(%s, 0))"
+
+
+class _PostgresRunLease(RunLease):
+    def __init__(self, local: RunLease, owner: "PostgresRunLock") -> None:
+        super().__init__(local.thread_id)
+        self._local = local
+        self._owner = owner
+
+    @property
+    def interrupted(self) -> bool:
+        return self._local.interrupted
+
+    @property
+    def interrupt_reason(self) -> str:
+        return self._local.interrupt_reason
+
+    def attach(self, task: asyncio.Task[None]) -> None:
+        self._local.attach(task)
+
+    def interrupt(self, reason: str = "Run interrupted by a newer run") -> None:
+        self._local.interrupt(reason)
+
+    async def _release(self) -> None:
+        try:
+            await self._owner._unlock(self.thread_id)
+        finally:
+            await self._local.release()
+
+
+class PostgresRunLock(InMemoryRunLock):
+    """Per-thread run lock shared by every worker through Postgres advisory locks.
+
+    Contention inside the process is settled by the in-memory lock first, so a
+    worker holds at most one advisory lock per busy thread. All of them live
+    on one dedicated session opened outside the pool, so long runs do not
+    take pooled connections away from checkpoint and event writes. Waiting
+    for another worker's run (``enqueue`` and ``interrupt``) polls with a try
+    lock every *poll_interval* seconds rather than blocking the session.
+
+    When the session drops, its locks are gone; the next lock operation
+    reconnects and takes the locks of the runs still active here again.
+    ``interrupt`` can only cancel runs of the local process; a run held by
+    another worker is waited for as with ``enqueue``.
+    """
+
+    def __init__(
+        self, database_connection: DatabaseConnection, poll_interval: float = 0.1
+    ):
+        super().__init__()
+        self.database_connection = database_connection
+        self._poll_interval = poll_interval
+        self._conn: AsyncConnection[Any] | None = None
+        self._conn_lock = asyncio.Lock()
+        self._held: set[str] = set()
+
+    async def _acquire(
+        self, thread_id: str, policy: RunLockPolicy, timeout: float | None
+    ) -> RunLease:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        local = await super()._acquire(thread_id, policy, timeout)
+
+        try:
+            while not await self._try_lock(thread_id):
+                if policy is RunLockPolicy.reject:
+                    raise RunConflictError(
+                        thread_id,
+                        f"Thread {thread_id} has an active run on another worker",
+                    )
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise RunConflictError(
+                        thread_id,
+                        f"Timed out waiting for the active run on thread {thread_id}",
+                    )
+                await asyncio.sleep(self._poll_interval)
+        except BaseException:
+            await local.release()
+            raise
+
+        return _PostgresRunLease(local, self)
+
+    async def cleanup(self) -> None:
+        await super().cleanup()
+        async with self._conn_lock:
+            if self._conn is not None:
+                await self._conn.close()
+                self._conn = None
+            self._held.clear()
+
+    async def _try_lock(self, thread_id: str) -> bool:
+        async with self._conn_lock:
+            conn = await self._session()
+            try:
+                cursor = await conn.execute(TRY_LOCK_SQL, (thread_id,))
+                row = await cursor.fetchone()
+            except Exception:
+                await self._discard_session()
+                raise
+            if row and row["locked"]:
+                self._held.add(thread_id)
+                return True
+            return False
+
+    async def _unlock(self, thread_id: str) -> None:
+        async with self._conn_lock:
+            if thread_id not in self._held:
+                return
+            self._held.discard(thread_id)
+            if self._conn is None:
+                return
+            try:
+                await self._conn.execute(UNLOCK_SQL, (thread_id,))
+            except Exception as e:
+                # Closing the session is the only other way to drop the lock;
+                # the locks of other runs are taken again on reconnect.
+                logger.error(f"Failed to release advisory lock for {thread_id}: {e}")
+                await self._discard_session()
+
+    async def _session(self) -> AsyncConnection[Any]:
+        if self._conn is not None and not self._conn.closed:
+            return self._conn
+
+        self._conn = await AsyncConnection.connect(
+            self.database_connection.get_connection_string(),
+            autocommit=True,
+            row_factory=dict_row,
+        )
+        for thread_id in list(self._held):
+            cursor = await self._conn.execute(TRY_LOCK_SQL, (thread_id,))
+            row = await cursor.fetchone()
+            if not (row and row["locked"]):
+                logger.error(
+                    f"Lost the advisory lock for {thread_id} to another worker"
+                )
+                self._held.discard(thread_id)
+        return self._conn
+
+    async def _discard_session(self) -> None:
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
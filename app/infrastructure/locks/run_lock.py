@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from enum import StrEnum
+
+from prometheus_client import Histogram
+
+logger = logging.getLogger(__name__)
+
+RUN_LOCK_WAIT_SECONDS = Histogram(
+    "run_lock_wait_seconds",
+    "Time spent waiting for the per-thread run lock.",
+    ["policy", "outcome"],
+)
+
+
+class RunLockPolicy(StrEnum):
+    """What to do when a run arrives for a thread that already has one."""
+
+    reject = "reject"
+    enqueue = "enqueue"
+    interrupt = "interrupt"
+
+
+class RunConflictError(Exception):
+    """Raised when a thread already has an active run and the policy refuses to wait."""
+
+    def __init__(self, thread_id: str, message: str | None = None):
+        super().__init__(message or f"Thread {thread_id} already has an active run")
+        self.thread_id = thread_id
+
+
+class RunLease:
+    """Ownership of a thread's run slot, released exactly once."""
+
+    def __init__(self, thread_id: str) -> None:
+        self.thread_id = thread_id
+        self._task: asyncio.Task[None] | None = None
+        self._interrupted = False
+        self._interrupt_reason = ""
+        self._released = False
+
+    @property
+    def interrupted(self) -> bool:
+        return self._interrupted
+
+    @property
+    def interrupt_reason(self) -> str:
+        return self._interrupt_reason
+
+    def attach(self, task: asyncio.Task[None]) -> None:
+        """Bind the task executing the run so a newer run can interrupt it."""
+        self._task = task
+        if self._interrupted:
+            task.cancel()
+
+    def interrupt(self, reason: str = "Run interrupted by a newer run") -> None:
+        self._interrupted = True
+        self._interrupt_reason = reason
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    async def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        await self._release()
+
+    async def _release(self) -> None:
+        pass
+
+
+class RunLock(ABC):
+    """Serializes runs per thread."""
+
+    async def acquire(
+        self, thread_id: str, policy: RunLockPolicy, timeout: float | None = None
+    ) -> RunLease:
+        """Acquire the run slot of *thread_id* according to *policy*.
+
+        ``reject`` raises :class:`RunConflictError` right away when the thread
+        is busy, ``enqueue`` waits up to *timeout* seconds for the current run
+        to finish and ``interrupt`` cancels the current run before taking over.
+        """
+        started = time.perf_counter()
+        outcome = "acquired"
+        try:
+            return await self._acquire(thread_id, policy, timeout)
+        except RunConflictError:
+            outcome = "rejected"
+            raise
+        except BaseException:
+            outcome = "error"
+            raise
+        finally:
+            RUN_LOCK_WAIT_SECONDS.labels(policy.value, outcome).observe(
+                time.perf_counter() - started
+            )
+
+    @abstractmethod
+    async def _acquire(
+        self, thread_id: str, policy: RunLockPolicy, timeout: float | None
+    ) -> RunLease:
+        pass
+
+    @abstractmethod
+    async def cleanup(self) -> None:
+        """Release backend resources."""
+        pass
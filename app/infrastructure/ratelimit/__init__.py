@@ -0,0 +1,16 @@
+from .base import RateLimitPolicy, RateLimitState, RateLimitStore
+from .factory import RateLimiterFactory
+from .limiter import RateLimiter, RouteLimit
+from .memory import InMemoryRateLimitStore
+from .postgres import PostgresRateLimitStore
+
+__all__ = [
+    "RateLimitPolicy",
+    "RateLimitState",
+    "RateLimitStore",
+    "RateLimiter",
+    "RateLimiterFactory",
+    "RouteLimit",
+    "InMemoryRateLimitStore",
+    "PostgresRateLimitStore",
+]
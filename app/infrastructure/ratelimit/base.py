@@ -0,0 +1,83 @@
+import math
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import NamedTuple
+
+
+class RateLimitPolicy(NamedTuple):
+    """*burst* requests at once, refilled at *rate* requests per second."""
+
+    name: str
+    rate: float
+    burst: int
+
+    @property
+    def emission_interval(self) -> float:
+        return 1.0 / self.rate
+
+    @property
+    def tolerance(self) -> float:
+        return self.burst * self.emission_interval
+
+
+class RateLimitState(NamedTuple):
+    """Outcome of one request against one policy, as sent in headers."""
+
+    policy: str
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float  # Seconds until the bucket is full again
+    retry_after: float = 0.0  # Seconds until a denied request would pass
+
+
+def bucket_state(
+    policy: RateLimitPolicy, allowed: bool, tat: float, now: float, cost: int = 1
+) -> RateLimitState:
+    """Describe a GCRA bucket from its theoretical arrival time *tat*."""
+    interval = policy.emission_interval
+    backlog = max(tat - now, 0.0)
+    remaining = math.floor((policy.tolerance - backlog) / interval + 1e-9)
+    retry_after = 0.0
+    if not allowed:
+        retry_after = max(backlog + cost * interval - policy.tolerance, 0.0)
+    return RateLimitState(
+        policy=policy.name,
+        allowed=allowed,
+        limit=policy.burst,
+        remaining=max(remaining, 0),
+        reset_after=backlog,
+        retry_after=retry_after,
+    )
+
+
+class RateLimitStore(ABC):
+    """Keeps token buckets and daily token usage.
+
+    Buckets use the generic cell rate algorithm: a bucket is a single
+    timestamp, the theoretical arrival time of the next request, so taking
+    from it is one compare-and-set with no refill bookkeeping. A bucket
+    whose timestamp lies in the past is full and equivalent to no bucket.
+    """
+
+    async def start(self) -> None:  # noqa: B027
+        """Create storage and start background work."""
+        pass
+
+    async def cleanup(self) -> None:  # noqa: B027
+        """Release backend resources."""
+        pass
+
+    @abstractmethod
+    async def take(
+        self, key: str, policy: RateLimitPolicy, cost: int = 1
+    ) -> RateLimitState:
+        pass
+
+    @abstractmethod
+    async def add_usage(self, key: str, day: date, tokens: int) -> None:
+        pass
+
+    @abstractmethod
+    async def get_usage(self, key: str, day: date) -> int:
+        pass
@@ -0,0 +1,45 @@
+import logging
+
+from app.bootstrap.config import AppConfig
+from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.ratelimit.base import RateLimitPolicy, RateLimitStore
+from app.infrastructure.ratelimit.limiter import RateLimiter, RouteLimit
+from app.infrastructure.ratelimit.memory import InMemoryRateLimitStore
+from app.infrastructure.ratelimit.postgres import PostgresRateLimitStore
+
+logger = logging.getLogger(__name__)
+
+RUN_ROUTES = [("POST", "/api/v1/runs")]
+
+
+class RateLimiterFactory:
+    @classmethod
+    def create(
+        cls, config: AppConfig, database_connection: DatabaseConnection | None
+    ) -> RateLimiter:
+        store: RateLimitStore
+        if config.rate_limit_backend == "postgres" and database_connection is not None:
+            logger.debug("Sharing rate limits between workers through Postgres")
+            store = PostgresRateLimitStore(database_connection)
+        else:
+            store = InMemoryRateLimitStore()
+
+        user_policy = None
+        if config.rate_limit_user_rate > 0:
+            user_policy = RateLimitPolicy(
+                "user", config.rate_limit_user_rate, config.rate_limit_user_burst
+            )
+        route_limits = []
+        if config.rate_limit_run_rate > 0:
+            policy = RateLimitPolicy(
+                "runs", config.rate_limit_run_rate, config.rate_limit_run_burst
+            )
+            route_limits = [RouteLimit(m, p, policy) for m, p in RUN_ROUTES]
+
+        return RateLimiter(
+            store,
+            user_policy,
+            route_limits,
+            daily_tokens=config.rate_limit_daily_tokens,
+            quota_routes=RUN_ROUTES,
+        )
@@ -0,0 +1,118 @@
+import logging
+from datetime import UTC, datetime, timedelta
+
+from prometheus_client import Counter
+
+from app.infrastructure.ratelimit.base import (
+    RateLimitPolicy,
+    RateLimitState,
+    RateLimitStore,
+)
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMITED_REQUESTS_TOTAL = Counter(
+    "rate_limited_requests_total",
+    "Requests rejected by a rate limit policy.",
+    ["policy"],
+)
+
+
+class RouteLimit:
+    """Applies *policy* to requests whose method and path match."""
+
+    def __init__(self, method: str, path_prefix: str, policy: RateLimitPolicy):
+        self.method = method.upper()
+        self.path_prefix = path_prefix
+        self.policy = policy
+
+    def matches(self, method: str, path: str) -> bool:
+        return method == self.method and path.startswith(self.path_prefix)
+
+
+class RateLimiter:
+    """Per-principal request limits and a daily LLM token quota.
+
+    Every request takes from the principal's *user_policy* bucket, and from
+    the bucket of each matching route limit. Requests to quota routes are
+    refused once the principal used *daily_tokens* LLM tokens since UTC
+    midnight; usage is reported after each run with ``record_usage``.
+    """
+
+    def __init__(
+        self,
+        store: RateLimitStore,
+        user_policy: RateLimitPolicy | None,
+        route_limits: list[RouteLimit] | None = None,
+        daily_tokens: int = 0,
+        quota_routes: list[tuple[str, str]] | None = None,
+    ):
+        self.store = store
+        self.user_policy = user_policy
+        self.route_limits = route_limits or []
+        self.daily_tokens = daily_tokens
+        self.quota_routes = [(m.upper(), p) for m, p in quota_routes or []]
+
+    @staticmethod
+    def principal(user_id: str) -> str:
+        return f"user:{user_id}"
+
+    async def start(self) -> None:
+        await self.store.start()
+
+    async def cleanup(self) -> None:
+        await self.store.cleanup()
+
+    async def check(
+        self, principal: str, method: str, path: str
+    ) -> list[RateLimitState]:
+        """Take one request from every applicable bucket.
+
+        Stops at the first bucket that refuses, so a denied request does not
+        drain the others.
+        """
+        states: list[RateLimitState] = []
+        policies = [self.user_policy] if self.user_policy is not None else []
+        policies += [
+            limit.policy for limit in self.route_limits if limit.matches(method, path)
+        ]
+        for policy in policies:
+            state = await self.store.take(f"{policy.name}:{principal}", policy)
+            states.append(state)
+            if not state.allowed:
+                RATE_LIMITED_REQUESTS_TOTAL.labels(policy.name).inc()
+                return states
+
+        if self.daily_tokens > 0 and any(
+            method == m and path.startswith(p) for m, p in self.quota_routes
+        ):
+            state = await self._quota_state(principal)
+            states.append(state)
+            if not state.allowed:
+                RATE_LIMITED_REQUESTS_TOTAL.labels(state.policy).inc()
+        return states
+
+    async def record_usage(self, principal: str, tokens: int) -> None:
+        if self.daily_tokens <= 0 or tokens <= 0:
+            return
+        try:
+            await self.store.add_usage(principal, datetime.now(UTC).date(), tokens)
+        except Exception as e:
+            logger.error(f"Failed to record token usage of {principal}: {e}")
+
+    async def _quota_state(self, principal: str) -> RateLimitState:
+        now = datetime.now(UTC)
+        used = await self.store.get_usage(principal, now.date())
+        midnight = datetime.combine(
+            now.date() + timedelta(days=1), datetime.min.time(), UTC
+        )
+        until_midnight = (midnight - now).total_seconds()
+        allowed = used < self.daily_tokens
+        return RateLimitState(
+            policy="daily_tokens",
+            allowed=allowed,
+            limit=self.daily_tokens,
+            remaining=max(self.daily_tokens - used, 0),
+            reset_after=until_midnight,
+            retry_after=0.0 if allowed else until_midnight,
+        )
@@ -0,0 +1,71 @@
+import time
+from collections.abc import Callable
+from datetime import UTC, date, datetime
+
+from app.infrastructure.ratelimit.base import (
+    RateLimitPolicy,
+    RateLimitState,
+    RateLimitStore,
+    bucket_state,
+)
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """Buckets of this worker, spread over *shards* dicts.
+
+    Full buckets carry no information, so they are swept one shard at a time
+    every *sweep_interval* seconds. Each sweep touches a fraction of the
+    keys, which keeps cleanup from stalling the event loop when many users
+    are tracked.
+    """
+
+    def __init__(
+        self,
+        shards: int = 16,
+        sweep_interval: float = 10.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._shards: list[dict[str, float]] = [{} for _ in range(shards)]
+        self._usage: dict[tuple[str, date], int] = {}
+        self._sweep_interval = sweep_interval
+        self._next_sweep = 0.0
+        self._sweep_shard = 0
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    async def take(
+        self, key: str, policy: RateLimitPolicy, cost: int = 1
+    ) -> RateLimitState:
+        now = self._clock()
+        self._sweep(now)
+
+        shard = self._shards[hash(key) % len(self._shards)]
+        tat = max(shard.get(key, now), now)
+        new_tat = tat + cost * policy.emission_interval
+        allowed = new_tat - now <= policy.tolerance
+        if allowed:
+            shard[key] = new_tat
+            tat = new_tat
+        return bucket_state(policy, allowed, tat, now, cost)
+
+    async def add_usage(self, key: str, day: date, tokens: int) -> None:
+        self._usage[(key, day)] = self._usage.get((key, day), 0) + tokens
+
+    async def get_usage(self, key: str, day: date) -> int:
+        return self._usage.get((key, day), 0)
+
+    def _sweep(self, now: float) -> None:
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + self._sweep_interval
+        shard = self._shards[self._sweep_shard]
+        self._sweep_shard = (self._sweep_shard + 1) % len(self._shards)
+        for key in [key for key, tat in shard.items() if tat <= now]:
+            del shard[key]
+
+        # Usage is keyed by UTC day, like the limiter computes it.
+        today = datetime.fromtimestamp(now, UTC).date()
+        for usage_key in [k for k in self._usage if k[1] < today]:
+            del self._usage[usage_key]
@@ -0,0 +1,12 @@
+from .broker import RunEventBroker, UnknownRunError
+from .factory import RunEventBrokerFactory
+from .memory import InMemoryRunEventBroker
+from .postgres import PostgresRunEventBroker
+
+__all__ = [
+    "RunEventBroker",
+    "UnknownRunError",
+    "RunEventBrokerFactory",
+    "InMemoryRunEventBroker",
+    "PostgresRunEventBroker",
+]
@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from typing import Any
+
+from prometheus_client import Counter, Gauge
+
+RUN_EVENTS_PUBLISHED_TOTAL = Counter(
+    "run_events_published_total", "Run events published to the broker."
+)
+RUN_EVENT_SUBSCRIBERS = Gauge(
+    "run_event_subscribers", "Clients currently following a run's event stream."
+)
+
+
+class UnknownRunError(LookupError):
+    """Raised when a run is not known to the broker, or belongs to another thread."""
+
+    def __init__(self, run_id: str):
+        super().__init__(f"Unknown run: {run_id}")
+        self.run_id = run_id
+
+
+class RunEventBroker(ABC):
+    """Append-only event log per run that any subscriber can follow.
+
+    The worker executing a run calls ``open``, ``publish`` for each event and
+    ``finish`` once. Sequence numbers start at 1 and are suitable as SSE event
+    ids: ``subscribe(after=n)`` replays every event after *n* and then follows
+    the run live until it finishes.
+    """
+
+    @abstractmethod
+    async def start(self) -> None:
+        pass
+
+    @abstractmethod
+    async def cleanup(self) -> None:
+        """Flush pending events and release backend resources."""
+        pass
+
+    @abstractmethod
+    async def open(self, thread_id: str, run_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def publish(self, run_id: str, event: dict[str, Any]) -> int:
+        """Append *event* to the run's log and return its sequence number."""
+        pass
+
+    @abstractmethod
+    async def finish(self, run_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def exists(self, thread_id: str, run_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def is_running(self, thread_id: str, run_id: str) -> bool:
+        """Whether *run_id* of *thread_id* was opened and has not finished."""
+        pass
+
+    @abstractmethod
+    def subscribe(
+        self, thread_id: str, run_id: str, after: int = 0
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        """Yield ``(seq, event)`` pairs after *after* until the run finishes.
+
+        Raises :class:`UnknownRunError` on first iteration when the run does
+        not exist or does not belong to *thread_id*.
+        """
+        pass
@@ -0,0 +1,31 @@
+import logging
+
+from app.bootstrap.config import AppConfig
+from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.database.notifications import NotificationListener
+from app.infrastructure.streams.broker import RunEventBroker
+from app.infrastructure.streams.memory import InMemoryRunEventBroker
+from app.infrastructure.streams.postgres import PostgresRunEventBroker
+
+logger = logging.getLogger(__name__)
+
+
+class RunEventBrokerFactory:
+    @classmethod
+    def create(
+        cls,
+        config: AppConfig,
+        database_connection: DatabaseConnection | None,
+        listener: NotificationListener | None,
+    ) -> RunEventBroker:
+        if database_connection is not None and listener is not None:
+            logger.debug("Using Postgres LISTEN/NOTIFY for run event streams")
+            return PostgresRunEventBroker(
+                database_connection,
+                listener,
+                flush_interval=config.run_events_flush_interval,
+                batch_size=config.run_events_batch_size,
+                retention=config.run_events_retention,
+            )
+
+        return InMemoryRunEventBroker(retention=config.run_events_retention)
@@ -0,0 +1,104 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from functools import partial
+from typing import Any
+
+from app.infrastructure.streams.broker import (
+    RUN_EVENT_SUBSCRIBERS,
+    RUN_EVENTS_PUBLISHED_TOTAL,
+    RunEventBroker,
+    UnknownRunError,
+)
+
+
+class _RunLog:
+    def __init__(self, thread_id: str) -> None:
+        self.thread_id = thread_id
+        self.events: list[dict[str, Any]] = []
+        self.finished_at: float | None = None
+        self.changed = asyncio.Condition()
+
+    def has_news(self, seq: int) -> bool:
+        return len(self.events) > seq or self.finished_at is not None
+
+
+class InMemoryRunEventBroker(RunEventBroker):
+    """Run event logs kept in process memory.
+
+    Serves subscribers of the current worker only. Logs of finished runs are
+    kept for *retention* seconds so that late subscribers can still replay
+    them.
+    """
+
+    def __init__(self, retention: float = 3600.0):
+        self._retention = retention
+        self._runs: dict[str, _RunLog] = {}
+
+    async def start(self) -> None:
+        pass
+
+    async def cleanup(self) -> None:
+        for run_id in list(self._runs):
+            await self.finish(run_id)
+
+    async def open(self, thread_id: str, run_id: str) -> None:
+        self._prune()
+        self._runs[run_id] = _RunLog(thread_id)
+
+    async def publish(self, run_id: str, event: dict[str, Any]) -> int:
+        log = self._runs[run_id]
+        async with log.changed:
+            log.events.append(event)
+            log.changed.notify_all()
+        RUN_EVENTS_PUBLISHED_TOTAL.inc()
+        return len(log.events)
+
+    async def finish(self, run_id: str) -> None:
+        log = self._runs.get(run_id)
+        if log is None or log.finished_at is not None:
+            return
+        async with log.changed:
+            log.finished_at = time.monotonic()
+            log.changed.notify_all()
+
+    async def exists(self, thread_id: str, run_id: str) -> bool:
+        log = self._runs.get(run_id)
+        return log is not None and log.thread_id == thread_id
+
+    async def is_running(self, thread_id: str, run_id: str) -> bool:
+        log = self._runs.get(run_id)
+        return (
+            log is not None and log.thread_id == thread_id and log.finished_at is None
+        )
+
+    async def subscribe(
+        self, thread_id: str, run_id: str, after: int = 0
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        log = self._runs.get(run_id)
+        if log is None or log.thread_id != thread_id:
+            raise UnknownRunError(run_id)
+
+        seq = max(after, 0)
+        RUN_EVENT_SUBSCRIBERS.inc()
+        try:
+            while True:
+                async with log.changed:
+                    await log.changed.wait_for(partial(log.has_news, seq))
+                    batch = log.events[seq:]
+                    finished = log.finished_at is not None
+
+                for event in batch:
+                    seq += 1
+                    yield seq, event
+
+                if finished and seq >= len(log.events):
+                    return
+        finally:
+            RUN_EVENT_SUBSCRIBERS.dec()
+
+    def _prune(self) -> None:
+        expires = time.monotonic() - self._retention
+        for run_id, log in list(self._runs.items()):
+            if log.finished_at is not None and log.finished_at < expires:
+                del self._runs[run_id]
@@ -0,0 +1,262 @@
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from prometheus_client import Histogram
+
+from app.infrastructure.database.connection import DatabaseConnection
+from app.infrastructure.database.notifications import NotificationListener
+from app.infrastructure.streams.broker import (
+    RUN_EVENT_SUBSCRIBERS,
+    RUN_EVENTS_PUBLISHED_TOTAL,
+    RunEventBroker,
+    UnknownRunError,
+)
+
+logger = logging.getLogger(__name__)
+
+RUN_EVENT_FLUSH_SIZE = Histogram(
+    "run_event_flush_size",
+    "Events written to Postgres per flush.",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500),
+)
+
+CHANNEL = "run_events"
+
+SETUP_SQL = """
+CREATE TABLE IF NOT EXISTS run_events (
+    run_id text NOT NULL,
+    seq integer NOT NULL,
+    thread_id text NOT NULL,
+    event text NOT NULL,
+    data text NOT NULL,
+    final boolean NOT NULL DEFAULT false,
+    created_at timestamptz NOT NULL DEFAULT now(),
+    PRIMARY KEY (run_id, seq)
+);
+CREATE INDEX IF NOT EXISTS run_events_created_at_idx ON run_events (created_at);
+"""
+
+INSERT_SQL = """
+INSERT INTO run_events (run_id, seq, thread_id, event, data, final)
+VALUES (%s, %s, %s, %s, %s, %s)
+ON CONFLICT (run_id, seq) DO NOTHING
+"""
+
+# One notification per run touched by the flush; Postgres folds duplicate
+# payloads sent within the same transaction.
+NOTIFY_SQL = "SELECT pg_notify(%s, run_id) FROM unnest(%s::text[]) AS run_id"
+
+# Seq 0 is the header row written by ``open``; it marks the run as known
+# and is never replayed.
+EXISTS_SQL = "SELECT 1 FROM run_events WHERE run_id = %s AND seq = 0 AND thread_id = %s"
+
+RUNNING_SQL = """
+SELECT 1 FROM run_events
+WHERE run_id = %(run_id)s AND seq = 0 AND thread_id = %(thread_id)s
+  AND NOT EXISTS (SELECT 1 FROM run_events WHERE run_id = %(run_id)s AND final)
+"""
+
+SELECT_SQL = """
+SELECT seq, event, data, final FROM run_events
+WHERE run_id = %s AND seq > %s
+ORDER BY seq
+LIMIT %s
+"""
+
+PRUNE_SQL = (
+    "DELETE FROM run_events WHERE created_at < now() - make_interval(secs => %s)"
+)
+
+_Row = tuple[str, int, str, str, str, bool]
+
+
+class PostgresRunEventBroker(RunEventBroker):
+    """Run event logs stored in Postgres so any worker can serve any subscriber.
+
+    Published events are buffered and written every *flush_interval* seconds,
+    or as soon as *batch_size* events are pending, in one transaction that
+    also sends a single ``NOTIFY`` per touched run. Subscribers read the log
+    table and sleep until the shared :class:`NotificationListener` reports new
+    rows for their run, polling every *poll_interval* seconds as a fallback.
+    """
+
+    def __init__(
+        self,
+        database_connection: DatabaseConnection,
+        listener: NotificationListener,
+        flush_interval: float = 0.05,
+        batch_size: int = 64,
+        retention: float = 3600.0,
+        poll_interval: float = 1.0,
+        page_size: int = 500,
+    ):
+        self.database_connection = database_connection
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+        self._retention = retention
+        self._poll_interval = poll_interval
+        self._page_size = page_size
+
+        self._pending: list[_Row] = []
+        self._runs: dict[str, tuple[str, int]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_requested = asyncio.Event()
+        self._flusher: asyncio.Task[None] | None = None
+        self._watchers: dict[str, set[asyncio.Event]] = {}
+
+        listener.add_handler(CHANNEL, self._notify_watchers)
+
+    async def start(self) -> None:
+        async with self.database_connection.connection() as conn:
+            await conn.execute(SETUP_SQL)
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def cleanup(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        for run_id in list(self._runs):
+            self._append(run_id, "run_end", "", final=True)
+        self._runs.clear()
+        await self.flush()
+
+    async def open(self, thread_id: str, run_id: str) -> None:
+        self._runs[run_id] = (thread_id, 0)
+        self._pending.append((run_id, 0, thread_id, "run_start", "", False))
+        await self.flush()
+
+    async def publish(self, run_id: str, event: dict[str, Any]) -> int:
+        seq = self._append(run_id, event["event"], event["data"])
+        RUN_EVENTS_PUBLISHED_TOTAL.inc()
+        if len(self._pending) >= self._batch_size:
+            self._flush_requested.set()
+        return seq
+
+    async def finish(self, run_id: str) -> None:
+        if run_id not in self._runs:
+            return
+        self._append(run_id, "run_end", "", final=True)
+        del self._runs[run_id]
+        await self.flush()
+
+    def _append(self, run_id: str, event: str, data: str, final: bool = False) -> int:
+        thread_id, seq = self._runs[run_id]
+        seq += 1
+        self._runs[run_id] = (thread_id, seq)
+        self._pending.append((run_id, seq, thread_id, event, data, final))
+        return seq
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            rows, self._pending = self._pending, []
+            if not rows:
+                return
+
+            run_ids = sorted({row[0] for row in rows})
+            try:
+                async with (
+                    self.database_connection.connection() as conn,
+                    conn.transaction(),
+                ):
+                    async with conn.cursor() as cur:
+                        await cur.executemany(INSERT_SQL, rows)
+                        await cur.execute(NOTIFY_SQL, (CHANNEL, run_ids))
+            except Exception as e:
+                # Keep the events; the next flush retries them in order.
+                logger.error(f"Failed to flush {len(rows)} run events: {e}")
+                self._pending[:0] = rows
+                return
+
+            RUN_EVENT_FLUSH_SIZE.observe(len(rows))
+            # Local subscribers do not have to wait for the round trip.
+            for run_id in run_ids:
+                self._notify_watchers(run_id)
+
+    async def _flush_loop(self) -> None:
+        last_prune = time.monotonic()
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._flush_requested.wait(), self._flush_interval
+                )
+            self._flush_requested.clear()
+            await self.flush()
+
+            if time.monotonic() - last_prune >= self._retention / 10:
+                last_prune = time.monotonic()
+                await self._prune()
+
+    async def _prune(self) -> None:
+        try:
+            async with self.database_connection.connection() as conn:
+                await conn.execute(PRUNE_SQL, (self._retention,))
+        except Exception as e:
+            logger.warning(f"Failed to prune run events: {e}")
+
+    async def exists(self, thread_id: str, run_id: str) -> bool:
+        local = self._runs.get(run_id)
+        if local is not None:
+            return local[0] == thread_id
+
+        async with self.database_connection.connection() as conn:
+            cursor = await conn.execute(EXISTS_SQL, (run_id, thread_id))
+            return await cursor.fetchone() is not None
+
+    async def is_running(self, thread_id: str, run_id: str) -> bool:
+        local = self._runs.get(run_id)
+        if local is not None:
+            return local[0] == thread_id
+
+        async with self.database_connection.connection() as conn:
+            cursor = await conn.execute(
+                RUNNING_SQL, {"run_id": run_id, "thread_id": thread_id}
+            )
+            return await cursor.fetchone() is not None
+
+    async def subscribe(
+        self, thread_id: str, run_id: str, after: int = 0
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        if not await self.exists(thread_id, run_id):
+            raise UnknownRunError(run_id)
+
+        seq = max(after, 0)
+        changed = asyncio.Event()
+        self._watchers.setdefault(run_id, set()).add(changed)
+        RUN_EVENT_SUBSCRIBERS.inc()
+        try:
+            while True:
+                # Clear before reading so a notification racing the query
+                # still wakes the next wait.
+                changed.clear()
+                rows = await self._fetch(run_id, seq)
+                for row in rows:
+                    if row["final"]:
+                        return
+                    seq = row["seq"]
+                    yield seq, {"event": row["event"], "data": row["data"]}
+
+                if len(rows) < self._page_size:
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(changed.wait(), self._poll_interval)
+        finally:
+            RUN_EVENT_SUBSCRIBERS.dec()
+            watchers = self._watchers.get(run_id)
+            if watchers is not None:
+                watchers.discard(changed)
+                if not watchers:
+                    del self._watchers[run_id]
+
+    async def _fetch(self, run_id: str, after: int) -> list[dict[str, Any]]:
+        async with self.database_connection.connection() as conn:
+            cursor = await conn.execute(SELECT_SQL, (run_id, after, self._page_size))
+            return list(await cursor.fetchall())
+
+    def _notify_watchers(self, run_id: str) -> None:
+        for changed in self._watchers.get(run_id, ()):
+            changed.set()
@@ -27,6 +27,11 @@ class Thread(BaseModel):
         description="The last time the thread was updated.",
         examples=["2023-10-01T12:00:00Z"],
     )
+    user_id: str | None = Field(
+        default=None,
+        description="ID of the user that owns the thread.",
+        examples=["1437ade37359488e95c0727a1cdf1786d24edce3"],
+    )
     metadata: dict[str, Any] = Field(
         ..., description="The thread metadata.", title="Metadata"
     )
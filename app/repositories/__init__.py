@@ -1,7 +1,26 @@
-from .thread_repository import ThreadRepository
-from .user_repository import UserRepository
+from .search import (
+    IndexedMessage,
+    MessageSearchIndex,
+    MessageSearchIndexFactory,
+    ThreadSearchPage,
+)
+from .threads import (
+    InvalidCursorError,
+    ThreadPage,
+    ThreadRepository,
+    ThreadRepositoryFactory,
+)
+from .users import UserRepository, UserRepositoryFactory
 
 __all__ = [
     "UserRepository",
+    "UserRepositoryFactory",
+    "InvalidCursorError",
+    "ThreadPage",
     "ThreadRepository",
+    "ThreadRepositoryFactory",
+    "IndexedMessage",
+    "MessageSearchIndex",
+    "MessageSearchIndexFactory",
+    "ThreadSearchPage",
 ]
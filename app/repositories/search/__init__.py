@@ -0,0 +1,14 @@
+from .base import IndexedMessage, MessageSearchIndex, ThreadSearchHit, ThreadSearchPage
+from .factory import MessageSearchIndexFactory
+from .memory import InMemoryMessageSearchIndex
+from .postgres import PostgresMessageSearchIndex
+
+__all__ = [
+    "IndexedMessage",
+    "MessageSearchIndex",
+    "ThreadSearchHit",
+    "ThreadSearchPage",
+    "MessageSearchIndexFactory",
+    "InMemoryMessageSearchIndex",
+    "PostgresMessageSearchIndex",
+]
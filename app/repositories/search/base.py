@@ -0,0 +1,62 @@
+from abc import ABC, abstractmethod
+from datetime import UTC, datetime
+
+from pydantic import AwareDatetime, BaseModel, Field
+
+
+class IndexedMessage(BaseModel):
+    thread_id: str
+    message_id: str
+    user_id: str | None = None
+    role: str
+    content: str
+    created_at: AwareDatetime = Field(default_factory=lambda: datetime.now(UTC))
+
+
+class ThreadSearchHit(BaseModel):
+    thread_id: str = Field(
+        description="Thread ID.", examples=["edd5a53c-da04-4db4-84e0-a9f3592eef45"]
+    )
+    message_id: str = Field(description="Best matching message of the thread.")
+    rank: float = Field(description="Relevance of the best matching message.")
+    snippet: str = Field(description="Excerpt of the message around the match.")
+    created_at: AwareDatetime = Field(description="When the message was written.")
+
+
+class ThreadSearchPage(BaseModel):
+    hits: list[ThreadSearchHit] = Field(default_factory=list)
+    next_skip: int | None = Field(
+        default=None, description="Pass as skip to fetch the next page."
+    )
+
+
+class MessageSearchIndex(ABC):
+    """Full-text index over the human and AI messages of every thread.
+
+    Messages are added while a run streams, so searching never has to load
+    thread state. Results are grouped by thread: each hit is the best
+    matching message of one thread, most relevant first.
+    """
+
+    async def start(self) -> None:  # noqa: B027
+        """Create storage and start background work."""
+        pass
+
+    async def cleanup(self) -> None:  # noqa: B027
+        """Write what is still buffered and stop background work."""
+        pass
+
+    @abstractmethod
+    def add(self, message: IndexedMessage) -> None:
+        """Queue *message* for indexing without waiting."""
+        pass
+
+    @abstractmethod
+    async def search(
+        self, user_id: str, query: str, limit: int = 20, skip: int = 0
+    ) -> ThreadSearchPage:
+        pass
+
+    @abstractmethod
+    async def delete_thread(self, thread_id: str) -> None:
+        pass
@@ -0,0 +1,25 @@
+import logging
+
+from app.bootstrap.config import AppConfig
+from app.infrastructure.database.connection import DatabaseConnection
+from app.repositories.search.base import MessageSearchIndex
+from app.repositories.search.memory import InMemoryMessageSearchIndex
+from app.repositories.search.postgres import PostgresMessageSearchIndex
+
+logger = logging.getLogger(__name__)
+
+
+class MessageSearchIndexFactory:
+    @classmethod
+    def create(
+        cls, config: AppConfig, database_connection: DatabaseConnection | None
+    ) -> MessageSearchIndex:
+        if database_connection is not None:
+            logger.debug("Indexing thread messages in Postgres")
+            return PostgresMessageSearchIndex(
+                database_connection,
+                language=config.thread_search_language,
+                flush_interval=config.thread_search_flush_interval,
+            )
+
+        return InMemoryMessageSearchIndex()
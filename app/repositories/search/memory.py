@@ -0,0 +1,63 @@
+import re
+
+from app.repositories.search.base import (
+    IndexedMessage,
+    MessageSearchIndex,
+    ThreadSearchHit,
+    ThreadSearchPage,
+)
+
+WORD = re.compile(r"\w+")
+
+
+def _terms(text: str) -> list[str]:
+    return WORD.findall(text.lower())
+
+
+class InMemoryMessageSearchIndex(MessageSearchIndex):
+    """Scans every message of the user; matches require all query terms."""
+
+    def __init__(self) -> None:
+        self._messages: dict[tuple[str, str], IndexedMessage] = {}
+
+    def add(self, message: IndexedMessage) -> None:
+        self._messages[(message.thread_id, message.message_id)] = message
+
+    async def search(
+        self, user_id: str, query: str, limit: int = 20, skip: int = 0
+    ) -> ThreadSearchPage:
+        terms = set(_terms(query))
+        if not terms:
+            return ThreadSearchPage()
+
+        best: dict[str, ThreadSearchHit] = {}
+        for message in self._messages.values():
+            if message.user_id != user_id:
+                continue
+            words = _terms(message.content)
+            if not terms.issubset(words):
+                continue
+            rank = sum(words.count(term) for term in terms) / len(words)
+            current = best.get(message.thread_id)
+            if current is None or (rank, message.created_at) > (
+                current.rank,
+                current.created_at,
+            ):
+                best[message.thread_id] = ThreadSearchHit(
+                    thread_id=message.thread_id,
+                    message_id=message.message_id,
+                    rank=rank,
+                    snippet=message.content[:200],
+                    created_at=message.created_at,
+                )
+
+        hits = sorted(best.values(), key=lambda h: (-h.rank, -h.created_at.timestamp()))
+        page = hits[skip : skip + limit]
+        return ThreadSearchPage(
+            hits=page,
+            next_skip=skip + limit if len(hits) > skip + limit else None,
+        )
+
+    async def delete_thread(self, thread_id: str) -> None:
+        for key in [key for key in self._messages if key[0] == thread_id]:
+            del self._messages[key]
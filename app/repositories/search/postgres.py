@@ -0,0 +1,172 @@
+import asyncio
+import logging
+
+from prometheus_client import Histogram
+from psycopg import sql
+
+from app.infrastructure.database.connection import DatabaseConnection
+from app.repositories.search.base import (
+    IndexedMessage,
+    MessageSearchIndex,
+    ThreadSearchHit,
+    ThreadSearchPage,
+)
+
+logger = logging.getLogger(__name__)
+
+THREAD_SEARCH_SECONDS = Histogram(
+    "thread_search_seconds",
+    "Time spent answering a thread search query.",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1),
+)
+
+SETUP_SQL = """
+CREATE TABLE IF NOT EXISTS thread_messages (
+    thread_id text NOT NULL,
+    message_id text NOT NULL,
+    user_id text,
+    role text NOT NULL,
+    content text NOT NULL,
+    created_at timestamptz NOT NULL DEFAULT now(),
+    content_tsv tsvector GENERATED ALWAYS AS (to_tsvector({language}, content)) STORED,
+    PRIMARY KEY (thread_id, message_id)
+);
+CREATE INDEX IF NOT EXISTS thread_messages_content_tsv_idx
+    ON thread_messages USING gin (content_tsv);
+"""
+
+# A message is rewritten when it is indexed again, e.g. by a retried run.
+UPSERT_SQL = """
+INSERT INTO thread_messages (thread_id, message_id, user_id, role, content, created_at)
+SELECT * FROM unnest(
+    %s::text[], %s::text[], %s::text[], %s::text[], %s::text[], %s::timestamptz[]
+)
+ON CONFLICT (thread_id, message_id) DO UPDATE SET content = EXCLUDED.content
+"""
+
+# The GIN index finds the matching messages; only the best one per thread
+# gets a headline, which is the expensive part.
+SEARCH_SQL = """
+WITH query AS (SELECT websearch_to_tsquery({language}, %(query)s) AS q),
+best AS (
+    SELECT DISTINCT ON (m.thread_id)
+        m.thread_id, m.message_id, m.content, m.created_at,
+        ts_rank_cd(m.content_tsv, query.q) AS rank
+    FROM thread_messages m, query
+    WHERE m.content_tsv @@ query.q AND m.user_id = %(user_id)s
+    ORDER BY m.thread_id, rank DESC, m.created_at DESC
+),
+page AS (
+    SELECT * FROM best
+    ORDER BY rank DESC, created_at DESC, thread_id
+    LIMIT %(limit)s OFFSET %(skip)s
+)
+SELECT
+    page.thread_id, page.message_id, page.rank, page.created_at,
+    ts_headline({language}, page.content, query.q, 'MaxWords=30, MinWords=10')
+        AS snippet
+FROM page, query
+ORDER BY page.rank DESC, page.created_at DESC, page.thread_id
+"""
+
+DELETE_SQL = "DELETE FROM thread_messages WHERE thread_id = %s"
+
+
+class PostgresMessageSearchIndex(MessageSearchIndex):
+    """Messages in a ``thread_messages`` table with a ``tsvector`` GIN index.
+
+    The ``tsvector`` is a generated column, so Postgres keeps it in sync with
+    the content. Messages added during runs are buffered and written every
+    *flush_interval* seconds in one ``INSERT ... SELECT FROM unnest()``.
+    *language* is the text search configuration used for stemming; changing
+    it requires recreating the table.
+    """
+
+    def __init__(
+        self,
+        database_connection: DatabaseConnection,
+        language: str = "english",
+        flush_interval: float = 0.5,
+    ):
+        self.database_connection = database_connection
+        self._language = sql.Literal(language)
+        self._flush_interval = flush_interval
+        self._pending: dict[tuple[str, str], IndexedMessage] = {}
+        self._flusher: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        async with self.database_connection.connection() as conn:
+            await conn.execute(sql.SQL(SETUP_SQL).format(language=self._language))
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def cleanup(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Failed to index thread messages: {e}")
+
+    def add(self, message: IndexedMessage) -> None:
+        self._pending[(message.thread_id, message.message_id)] = message
+
+    async def flush(self) -> None:
+        """Write every message added since the last flush."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        messages = list(pending.values())
+        try:
+            async with self.database_connection.connection() as conn:
+                await conn.execute(
+                    UPSERT_SQL,
+                    (
+                        [m.thread_id for m in messages],
+                        [m.message_id for m in messages],
+                        [m.user_id for m in messages],
+                        [m.role for m in messages],
+                        [m.content for m in messages],
+                        [m.created_at for m in messages],
+                    ),
+                )
+        except BaseException:
+            self._pending = {**pending, **self._pending}
+            raise
+
+    async def search(
+        self, user_id: str, query: str, limit: int = 20, skip: int = 0
+    ) -> ThreadSearchPage:
+        with THREAD_SEARCH_SECONDS.time():
+            async with self.database_connection.connection() as conn:
+                cursor = await conn.execute(
+                    sql.SQL(SEARCH_SQL).format(language=self._language),
+                    {
+                        "query": query,
+                        "user_id": user_id,
+                        "limit": limit + 1,
+                        "skip": skip,
+                    },
+                )
+                rows = await cursor.fetchall()
+
+        return ThreadSearchPage(
+            hits=[ThreadSearchHit(**row) for row in rows[:limit]],
+            next_skip=skip + limit if len(rows) > limit else None,
+        )
+
+    async def delete_thread(self, thread_id: str) -> None:
+        for key in [key for key in self._pending if key[0] == thread_id]:
+            del self._pending[key]
+        async with self.database_connection.connection() as conn:
+            await conn.execute(DELETE_SQL, (thread_id,))
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to index thread messages: {e}")
@@ -0,0 +1,13 @@
+from .base import InvalidCursorError, ThreadPage, ThreadRepository
+from .factory import ThreadRepositoryFactory
+from .memory import InMemoryThreadRepository
+from .postgres import PostgresThreadRepository
+
+__all__ = [
+    "InvalidCursorError",
+    "ThreadPage",
+    "ThreadRepository",
+    "ThreadRepositoryFactory",
+    "InMemoryThreadRepository",
+    "PostgresThreadRepository",
+]
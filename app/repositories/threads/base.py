@@ -0,0 +1,100 @@
+import base64
+import binascii
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from app.models import Thread, User
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a listing cursor was not produced by :func:`encode_cursor`."""
+
+
+class ThreadPage(BaseModel):
+    threads: list[Thread] = Field(default_factory=list)
+    next_cursor: str | None = Field(
+        default=None, description="Pass as cursor to fetch the next page."
+    )
+
+
+def encode_cursor(thread: Thread) -> str:
+    raw = f"{thread.updated_at.isoformat()}|{thread.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        updated_at, _, thread_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().partition("|")
+        )
+        return datetime.fromisoformat(updated_at), thread_id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+class ThreadRepository(ABC):
+    """Stores threads and lists them per user, newest activity first.
+
+    Listing is keyset-paginated on ``(updated_at, id)``: a page is read from
+    where the previous one ended instead of skipping rows, so every page
+    costs the same. Status changes during a run go through ``save_status``,
+    which implementations may buffer and coalesce.
+    """
+
+    async def start(self) -> None:  # noqa: B027
+        """Create storage and start background work."""
+        pass
+
+    async def cleanup(self) -> None:  # noqa: B027
+        """Write what is still buffered and stop background work."""
+        pass
+
+    @abstractmethod
+    async def get(self, thread_id: str) -> Thread | None:
+        pass
+
+    @abstractmethod
+    async def create(self, thread: Thread) -> Thread:
+        """Insert *thread*, or return the stored one if the id already exists."""
+        pass
+
+    @abstractmethod
+    async def list(
+        self, user_id: str, limit: int = 20, cursor: str | None = None
+    ) -> ThreadPage:
+        pass
+
+    @abstractmethod
+    async def delete(self, thread_id: str) -> None:
+        pass
+
+    @abstractmethod
+    def save_status(self, thread: Thread) -> None:
+        """Record the status and ``updated_at`` of *thread* without waiting."""
+        pass
+
+    async def get_for_user(self, thread_id: str, user: User) -> Thread | None:
+        """Return the thread unless it belongs to another user."""
+        thread = await self.get(thread_id)
+        if thread is None or thread.user_id not in (None, user.id):
+            return None
+        return thread
+
+    async def get_or_create(
+        self, thread_id: str, user: User, metadata: dict[str, Any] | None = None
+    ) -> Thread | None:
+        """Return the user's thread, creating it on first use.
+
+        ``None`` means the id is taken by another user's thread.
+        """
+        thread = await self.get(thread_id)
+        if thread is None:
+            thread = await self.create(
+                Thread(id=thread_id, user_id=user.id, metadata=metadata or {})
+            )
+        if thread.user_id not in (None, user.id):
+            return None
+        return thread
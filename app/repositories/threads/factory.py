@@ -0,0 +1,24 @@
+import logging
+
+from app.bootstrap.config import AppConfig
+from app.infrastructure.database.connection import DatabaseConnection
+from app.repositories.threads.base import ThreadRepository
+from app.repositories.threads.memory import InMemoryThreadRepository
+from app.repositories.threads.postgres import PostgresThreadRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ThreadRepositoryFactory:
+    @classmethod
+    def create(
+        cls, config: AppConfig, database_connection: DatabaseConnection | None
+    ) -> ThreadRepository:
+        if database_connection is not None:
+            logger.debug("Storing threads in Postgres")
+            return PostgresThreadRepository(
+                database_connection,
+                flush_interval=config.thread_status_flush_interval,
+            )
+
+        return InMemoryThreadRepository()
@@ -0,0 +1,50 @@
+from app.models import Thread
+from app.repositories.threads.base import (
+    ThreadPage,
+    ThreadRepository,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+class InMemoryThreadRepository(ThreadRepository):
+    """Threads kept in a dict; enough for a single worker without Postgres."""
+
+    def __init__(self) -> None:
+        self._threads: dict[str, Thread] = {}
+
+    async def get(self, thread_id: str) -> Thread | None:
+        thread = self._threads.get(thread_id)
+        return thread.model_copy() if thread is not None else None
+
+    async def create(self, thread: Thread) -> Thread:
+        stored = self._threads.setdefault(thread.id, thread.model_copy())
+        return stored.model_copy()
+
+    async def list(
+        self, user_id: str, limit: int = 20, cursor: str | None = None
+    ) -> ThreadPage:
+        threads = sorted(
+            (t for t in self._threads.values() if t.user_id == user_id),
+            key=lambda t: (t.updated_at, t.id),
+            reverse=True,
+        )
+        if cursor is not None:
+            after = decode_cursor(cursor)
+            threads = [t for t in threads if (t.updated_at, t.id) < after]
+
+        page = [t.model_copy() for t in threads[:limit]]
+        has_more = len(threads) > limit
+        return ThreadPage(
+            threads=page,
+            next_cursor=encode_cursor(page[-1]) if has_more and page else None,
+        )
+
+    async def delete(self, thread_id: str) -> None:
+        self._threads.pop(thread_id, None)
+
+    def save_status(self, thread: Thread) -> None:
+        stored = self._threads.get(thread.id)
+        if stored is not None:
+            stored.status = thread.status
+            stored.updated_at = max(stored.updated_at, thread.updated_at)
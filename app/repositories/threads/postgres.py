@@ -0,0 +1,213 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any
+
+from prometheus_client import Histogram
+from psycopg.types.json import Jsonb
+
+from app.infrastructure.database.connection import DatabaseConnection
+from app.models import Thread
+from app.models.thread import ThreadStatus
+from app.repositories.threads.base import (
+    ThreadPage,
+    ThreadRepository,
+    decode_cursor,
+    encode_cursor,
+)
+
+logger = logging.getLogger(__name__)
+
+THREAD_STATUS_FLUSH_SIZE = Histogram(
+    "thread_status_flush_size",
+    "Threads whose status was written per coalesced flush.",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500),
+)
+
+SETUP_SQL = """
+CREATE TABLE IF NOT EXISTS threads (
+    thread_id text PRIMARY KEY,
+    user_id text,
+    status text NOT NULL DEFAULT 'idle',
+    metadata jsonb NOT NULL DEFAULT '{}',
+    created_at timestamptz NOT NULL DEFAULT now(),
+    updated_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS threads_user_id_updated_at_idx
+    ON threads (user_id, updated_at DESC, thread_id DESC);
+"""
+
+COLUMNS = "thread_id, user_id, status, metadata, created_at, updated_at"
+
+SELECT_SQL = f"SELECT {COLUMNS} FROM threads WHERE thread_id = %s"
+
+# The no-op update makes RETURNING yield the existing row on conflict.
+INSERT_SQL = f"""
+INSERT INTO threads (thread_id, user_id, status, metadata, created_at, updated_at)
+VALUES (%s, %s, %s, %s, %s, %s)
+ON CONFLICT (thread_id) DO UPDATE SET thread_id = EXCLUDED.thread_id
+RETURNING {COLUMNS}
+"""
+
+LIST_SQL = f"""
+SELECT {COLUMNS} FROM threads
+WHERE user_id = %s
+ORDER BY updated_at DESC, thread_id DESC
+LIMIT %s
+"""
+
+LIST_AFTER_SQL = f"""
+SELECT {COLUMNS} FROM threads
+WHERE user_id = %s AND (updated_at, thread_id) < (%s, %s)
+ORDER BY updated_at DESC, thread_id DESC
+LIMIT %s
+"""
+
+DELETE_SQL = "DELETE FROM threads WHERE thread_id = %s"
+
+UPDATE_STATUS_SQL = """
+UPDATE threads AS t
+SET status = v.status, updated_at = greatest(t.updated_at, v.updated_at)
+FROM unnest(%s::text[], %s::text[], %s::timestamptz[])
+    AS v(thread_id, status, updated_at)
+WHERE t.thread_id = v.thread_id
+"""
+
+
+def _to_thread(row: dict[str, Any]) -> Thread:
+    return Thread(
+        id=row["thread_id"],
+        user_id=row["user_id"],
+        status=ThreadStatus(row["status"]),
+        metadata=row["metadata"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
+class PostgresThreadRepository(ThreadRepository):
+    """Threads stored in Postgres, listed through ``(user_id, updated_at)``.
+
+    ``save_status`` only records the latest status of each thread; a
+    background task writes whatever changed every *flush_interval* seconds
+    with one ``UPDATE`` for all of them. A run that emits hundreds of events
+    thus costs one row update per flush rather than one per event. Reads
+    overlay the statuses that have not been written yet.
+    """
+
+    def __init__(
+        self, database_connection: DatabaseConnection, flush_interval: float = 0.5
+    ):
+        self.database_connection = database_connection
+        self._flush_interval = flush_interval
+        self._pending: dict[str, tuple[ThreadStatus, datetime]] = {}
+        self._flusher: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        async with self.database_connection.connection() as conn:
+            await conn.execute(SETUP_SQL)
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def cleanup(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush thread statuses: {e}")
+
+    async def get(self, thread_id: str) -> Thread | None:
+        async with self.database_connection.connection() as conn:
+            cursor = await conn.execute(SELECT_SQL, (thread_id,))
+            row = await cursor.fetchone()
+        return self._overlay(_to_thread(row)) if row is not None else None
+
+    async def create(self, thread: Thread) -> Thread:
+        status = thread.status or ThreadStatus.idle
+        async with self.database_connection.connection() as conn:
+            cursor = await conn.execute(
+                INSERT_SQL,
+                (
+                    thread.id,
+                    thread.user_id,
+                    status.value,
+                    Jsonb(thread.metadata),
+                    thread.created_at,
+                    thread.updated_at,
+                ),
+            )
+            row = await cursor.fetchone()
+        return self._overlay(_to_thread(row))
+
+    async def list(
+        self, user_id: str, limit: int = 20, cursor: str | None = None
+    ) -> ThreadPage:
+        params: tuple[Any, ...]
+        if cursor is None:
+            query, params = LIST_SQL, (user_id, limit + 1)
+        else:
+            updated_at, thread_id = decode_cursor(cursor)
+            query, params = LIST_AFTER_SQL, (user_id, updated_at, thread_id, limit + 1)
+
+        async with self.database_connection.connection() as conn:
+            result = await conn.execute(query, params)
+            rows = await result.fetchall()
+
+        # The cursor comes from the stored row, so pages stay consistent with
+        # the index even when a newer status is still pending.
+        page = rows[:limit]
+        return ThreadPage(
+            threads=[self._overlay(_to_thread(row)) for row in page],
+            next_cursor=(
+                encode_cursor(_to_thread(page[-1])) if len(rows) > limit else None
+            ),
+        )
+
+    async def delete(self, thread_id: str) -> None:
+        self._pending.pop(thread_id, None)
+        async with self.database_connection.connection() as conn:
+            await conn.execute(DELETE_SQL, (thread_id,))
+
+    def save_status(self, thread: Thread) -> None:
+        self._pending[thread.id] = (
+            thread.status or ThreadStatus.idle,
+            thread.updated_at,
+        )
+
+    async def flush(self) -> None:
+        """Write every status recorded since the last flush."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        try:
+            async with self.database_connection.connection() as conn:
+                await conn.execute(
+                    UPDATE_STATUS_SQL,
+                    (
+                        list(pending),
+                        [status.value for status, _ in pending.values()],
+                        [updated_at for _, updated_at in pending.values()],
+                    ),
+                )
+        except BaseException:
+            # Statuses recorded meanwhile are newer and win.
+            self._pending = {**pending, **self._pending}
+            raise
+        THREAD_STATUS_FLUSH_SIZE.observe(len(pending))
+
+    def _overlay(self, thread: Thread) -> Thread:
+        if (pending := self._pending.get(thread.id)) is not None:
+            thread.status = pending[0]
+            thread.updated_at = max(thread.updated_at, pending[1])
+        return thread
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush thread statuses: {e}")
@@ -0,0 +1,13 @@
+from .base import UserRepository
+from .cached import CachedUserRepository
+from .factory import UserRepositoryFactory
+from .memory import InMemoryUserRepository
+from .postgres import PostgresUserRepository
+
+__all__ = [
+    "UserRepository",
+    "CachedUserRepository",
+    "UserRepositoryFactory",
+    "InMemoryUserRepository",
+    "PostgresUserRepository",
+]
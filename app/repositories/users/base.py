@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+from app.models import User
+
+
+class UserRepository(ABC):
+    """Looks users up by id for authentication."""
+
+    async def start(self) -> None:  # noqa: B027
+        """Create storage and start background work."""
+        pass
+
+    async def cleanup(self) -> None:  # noqa: B027
+        """Release backend resources."""
+        pass
+
+    @abstractmethod
+    async def get(self, user_id: str) -> User | None:
+        pass
+
+    @abstractmethod
+    async def save(self, user: User) -> None:
+        """Insert *user* or update the stored one."""
+        pass
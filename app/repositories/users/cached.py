@@ -0,0 +1,59 @@
+from prometheus_client import Counter
+
+from app.models import User
+from app.repositories.users.base import UserRepository
+from app.utils.cache import SingleFlight, TTLCache
+
+USER_CACHE_LOOKUPS_TOTAL = Counter(
+    "user_cache_lookups_total",
+    "User lookups answered by the process-wide user cache, or not.",
+    ["result"],
+)
+
+
+class CachedUserRepository(UserRepository):
+    """Process-wide LRU cache in front of another repository.
+
+    Found users are kept for *ttl* seconds. Ids that were not found are
+    kept for *negative_ttl* seconds, so repeated requests with an unknown
+    id do not reach the store each time. Concurrent misses for the same id
+    share one lookup.
+    """
+
+    def __init__(
+        self,
+        repository: UserRepository,
+        maxsize: int = 10000,
+        ttl: float = 60.0,
+        negative_ttl: float = 10.0,
+    ):
+        self.repository = repository
+        self._negative_ttl = negative_ttl
+        # None marks an id known not to exist.
+        self._users: TTLCache[str, User | None] = TTLCache(maxsize, ttl)
+        self._lookups: SingleFlight[str, User | None] = SingleFlight()
+
+    async def start(self) -> None:
+        await self.repository.start()
+
+    async def cleanup(self) -> None:
+        await self.repository.cleanup()
+
+    async def get(self, user_id: str) -> User | None:
+        if user_id in self._users:
+            USER_CACHE_LOOKUPS_TOTAL.labels("hit").inc()
+            return self._users.get(user_id)
+        USER_CACHE_LOOKUPS_TOTAL.labels("miss").inc()
+        return await self._lookups.do(user_id, lambda: self._load(user_id))
+
+    async def save(self, user: User) -> None:
+        await self.repository.save(user)
+        self._users.pop(user.id)
+
+    def invalidate(self, user_id: str) -> None:
+        self._users.pop(user_id)
+
+    async def _load(self, user_id: str) -> User | None:
+        user = await self.repository.get(user_id)
+        self._users.set(user_id, user, None if user else self._negative_ttl)
+        return user
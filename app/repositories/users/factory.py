@@ -0,0 +1,30 @@
+import logging
+
+from app.bootstrap.config import AppConfig
+from app.infrastructure.database.connection import DatabaseConnection
+from app.repositories.users.base import UserRepository
+from app.repositories.users.cached import CachedUserRepository
+from app.repositories.users.memory import InMemoryUserRepository
+from app.repositories.users.postgres import PostgresUserRepository
+
+logger = logging.getLogger(__name__)
+
+
+class UserRepositoryFactory:
+    @classmethod
+    def create(
+        cls, config: AppConfig, database_connection: DatabaseConnection | None
+    ) -> UserRepository:
+        repository: UserRepository
+        if database_connection is not None:
+            logger.debug("Loading users from Postgres")
+            repository = PostgresUserRepository(database_connection)
+        else:
+            repository = InMemoryUserRepository(provision=True)
+
+        return CachedUserRepository(
+            repository,
+            maxsize=config.user_cache_size,
+            ttl=config.user_cache_ttl,
+            negative_ttl=config.user_negative_cache_ttl,
+        )
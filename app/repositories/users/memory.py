@@ -0,0 +1,26 @@
+from app.models import User
+from app.repositories.users.base import UserRepository
+
+
+class InMemoryUserRepository(UserRepository):
+    """Users kept in a dict.
+
+    With *provision* set, unknown ids resolve to a new user, the way the
+    application behaved before there was a user store. Meant for local
+    development only.
+    """
+
+    def __init__(self, provision: bool = False) -> None:
+        self._provision = provision
+        self._users: dict[str, User] = {}
+
+    async def get(self, user_id: str) -> User | None:
+        user = self._users.get(user_id)
+        if user is None and self._provision:
+            user = self._users.setdefault(
+                user_id, User(id=user_id, email=f"user{user_id}@example.com")
+            )
+        return user.model_copy() if user is not None else None
+
+    async def save(self, user: User) -> None:
+        self._users[user.id] = user.model_copy()
@@ -0,0 +1,38 @@
+from app.infrastructure.database.connection import DatabaseConnection
+from app.models import User
+from app.repositories.users.base import UserRepository
+
+SETUP_SQL = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id text PRIMARY KEY,
+    email text NOT NULL,
+    created_at timestamptz NOT NULL DEFAULT now(),
+    updated_at timestamptz NOT NULL DEFAULT now()
+)
+"""
+
+SELECT_SQL = "SELECT user_id, email FROM users WHERE user_id = %s"
+
+UPSERT_SQL = """
+INSERT INTO users (user_id, email) VALUES (%s, %s)
+ON CONFLICT (user_id) DO UPDATE SET email = EXCLUDED.email, updated_at = now()
+"""
+
+
+class PostgresUserRepository(UserRepository):
+    def __init__(self, database_connection: DatabaseConnection):
+        self.database_connection = database_connection
+
+    async def start(self) -> None:
+        async with self.database_connection.connection() as conn:
+            await conn.execute(SETUP_SQL)
+
+    async def get(self, user_id: str) -> User | None:
+        async with self.database_connection.connection() as conn:
+            cursor = await conn.execute(SELECT_SQL, (user_id,))
+            row = await cursor.fetchone()
+        return User(id=row["user_id"], email=row["email"]) if row else None
+
+    async def save(self, user: User) -> None:
+        async with self.database_connection.connection() as conn:
+            await conn.execute(UPSERT_SQL, (user.id, user.email))
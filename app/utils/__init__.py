@@ -1,3 +1,4 @@
+from .cache import SingleFlight, TTLCache
 from .logger import setup_logger
 
-__all__ = ["setup_logger"]
+__all__ = ["setup_logger", "SingleFlight", "TTLCache"]
@@ -1,6 +1,7 @@
 import React, { useState, useCallback } from 'react';
 import { FiCopy, FiThumbsUp, FiThumbsDown } from 'react-icons/fi';
 import { useSSE } from '../hooks/index.js';
+import { clearAuthToken, getAuthToken } from '../utils/auth.js';
 
 export const MessageActions = ({ content, messageId, traceId, isUser = false }) => {
     const [copied, setCopied] = useState(false);
@@ -24,7 +25,7 @@ export const MessageActions = ({ content, messageId, traceId, isUser = false })
         setIsSubmittingFeedback(true);
         
         try {
-            const authToken = localStorage.getItem('authToken') || 'eyJ1c2VyX2lkIjogIjE0MzdhZGUzNzM1OTQ4OGU5NWMwNzI3YTFjZGYxNzg2ZDI0ZWRjZTMiLCAiZW1haWwiOiAidGVzdEBnbWFpbC5jb20ifQ==';
+            const authToken = await getAuthToken();
             const userId = getUserId();
             const threadId = getThreadId();
             
@@ -45,6 +46,7 @@ export const MessageActions = ({ content, messageId, traceId, isUser = false })
             if (response.ok) {
                 console.log(`Feedback submitted successfully: ${feedbackValue} for trace ${traceId}`);
             } else {
+                if (response.status === 401) clearAuthToken();
                 console.error('Failed to submit feedback:', response.statusText);
             }
         } catch (error) {
@@ -1,4 +1,5 @@
 import React, { useState, useRef } from 'react';
+import { clearAuthToken, getAuthToken } from '../../utils/auth.js';
 
 const FileUpload = ({ id, label, accept = [], placeholder = "Choose a file...", multiple = false }) => {
     const [dragOver, setDragOver] = useState(false);
@@ -62,7 +63,7 @@ const FileUpload = ({ id, label, accept = [], placeholder = "Choose a file...",
                 method: 'POST',
                 body: formData,
                 headers: {
-                    'Authorization': 'Bearer ' + (localStorage.getItem('authToken') || 'eyJ1c2VyX2lkIjogIjE0MzdhZGUzNzM1OTQ4OGU5NWMwNzI3YTFjZGYxNzg2ZDI0ZWRjZTMiLCAiZW1haWwiOiAidGVzdEBnbWFpbC5jb20ifQ==')
+                    'Authorization': 'Bearer ' + await getAuthToken()
                 }
             });
 
@@ -74,6 +75,7 @@ const FileUpload = ({ id, label, accept = [], placeholder = "Choose a file...",
                     fileInputRef.current.value = '';
                 }
             } else {
+                if (response.status === 401) clearAuthToken();
                 console.error('Upload failed:', response.statusText);
             }
         } catch (error) {
@@ -47,4 +47,7 @@ export const MESSAGE_SUBTYPES = {
     ERROR: 'error',
     LOADING: 'loading',
     UI: 'ui'
-}; 
\ No newline at end of file
+}; 
+
+// TODO: Replace with the signed-in user
+export const DEV_USER_ID = '1437ade37359488e95c0727a1cdf1786d24edce3';
@@ -3,15 +3,17 @@ import {SSE} from 'sse.js';
 import {useChatStore} from '../store/index.js';
 import {
     CSS_CLASSES,
+    DEV_USER_ID,
     MESSAGE_SUBTYPES,
     MESSAGES,
     SENDER_TYPES,
     STATUSES,
     THINKING_STATES
 } from '../constants/constants.js';
+import {clearAuthToken, getAuthToken} from '../utils/auth.js';
 
 // TODO: Replace with actual thread_id
-const USER_ID = '1437ade37359488e95c0727a1cdf1786d24edce3';
+const USER_ID = DEV_USER_ID;
 const THREAD_ID = 'edd5a53c-da04-4db4-84e0-a9f3592eef45';
 
 export const useSSE = () => {
@@ -41,7 +43,7 @@ export const useSSE = () => {
                 sseRef.current.close();
             }
 
-            const authToken = localStorage.getItem('authToken') || 'eyJ1c2VyX2lkIjogIjE0MzdhZGUzNzM1OTQ4OGU5NWMwNzI3YTFjZGYxNzg2ZDI0ZWRjZTMiLCAiZW1haWwiOiAidGVzdEBnbWFpbC5jb20ifQ==';
+            const authToken = await getAuthToken();
 
             const historicalMessages = [];
             sseRef.current = new SSE(`/api/v1/threads/${THREAD_ID}/history`, {
@@ -64,6 +66,7 @@ export const useSSE = () => {
 
             const handleHistoryError = (e) => {
                 console.error('History SSE Error:', e);
+                if (e.responseCode === 401) clearAuthToken();
                 const errorMessage = extractErrorMessage(e);
                 addMessage(errorMessage, SENDER_TYPES.SYSTEM, MESSAGE_SUBTYPES.ERROR, CSS_CLASSES.ERROR);
                 setLoading(false);
@@ -180,6 +183,7 @@ export const useSSE = () => {
 
     const handleSSEError = useCallback((e) => {
         console.error('SSE Error:', e);
+        if (e.responseCode === 401) clearAuthToken();
         setConnectionStatus(STATUSES.DISCONNECTED, MESSAGES.CONNECTION_ERROR);
 
         const errorMessage = extractErrorMessage(e);
@@ -272,7 +276,7 @@ export const useSSE = () => {
 
         try {
             // TODO: Mocked data, replace with actual API call
-            const authToken = localStorage.getItem('authToken') || 'eyJ1c2VyX2lkIjogIjE0MzdhZGUzNzM1OTQ4OGU5NWMwNzI3YTFjZGYxNzg2ZDI0ZWRjZTMiLCAiZW1haWwiOiAidGVzdEBnbWFpbC5jb20ifQ==';
+            const authToken = await getAuthToken();
             sseRef.current = new SSE(`/api/v1/runs/stream`, {
                 headers: {
                     'Content-Type': 'application/json',
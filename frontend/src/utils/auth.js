@@ -0,0 +1,40 @@
+import {DEV_USER_ID} from '../constants/constants.js';
+
+const STORAGE_KEY = 'authToken';
+
+let pendingToken = null;
+
+/**
+ * Bearer token for API requests.
+ *
+ * A token stored under `authToken` in localStorage wins, e.g. one printed by
+ * `python -m app.infrastructure.auth USER_ID`. Otherwise a development token
+ * is requested from the API, which only works with AUTH_DEV_TOKENS=true.
+ */
+export const getAuthToken = async () => {
+    const stored = localStorage.getItem(STORAGE_KEY);
+    if (stored) return stored;
+
+    if (!pendingToken) {
+        pendingToken = fetch('/api/v1/auth/dev-token', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({user_id: DEV_USER_ID})
+        }).then(async (response) => {
+            if (!response.ok) {
+                throw new Error('No auth token: set localStorage.authToken or enable AUTH_DEV_TOKENS');
+            }
+            const {access_token: token} = await response.json();
+            localStorage.setItem(STORAGE_KEY, token);
+            return token;
+        }).finally(() => {
+            pendingToken = null;
+        });
+    }
+    return pendingToken;
+};
+
+/** Forget the stored token after the API rejected it, e.g. once it expired. */
+export const clearAuthToken = () => {
+    localStorage.removeItem(STORAGE_KEY);
+};
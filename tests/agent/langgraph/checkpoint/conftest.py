@@ -0,0 +1,57 @@
+import os
+from typing import Annotated, Any, TypedDict
+
+import pytest
+import pytest_asyncio
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from langgraph.graph import END, START, StateGraph
+from psycopg import AsyncConnection
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+requires_postgres = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"),
+]
+
+
+class CountingConnection(AsyncConnection[Any]):
+    """Counts client/server exchanges, which is what a round trip costs us."""
+
+    round_trips = 0
+
+    async def wait(self, gen: Any, *args: Any, **kwargs: Any) -> Any:
+        CountingConnection.round_trips += 1
+        return await super().wait(gen, *args, **kwargs)
+
+
+class State(TypedDict):
+    steps: Annotated[list[str], lambda a, b: a + b]
+
+
+def build_graph(checkpointer: Any, steps: int = 6) -> Any:
+    builder = StateGraph(State)
+    names = [f"step_{i}" for i in range(steps)]
+    for name in names:
+        builder.add_node(name, lambda state, name=name: {"steps": [name]})
+    builder.add_edge(START, names[0])
+    for current, following in zip(names, names[1:], strict=False):
+        builder.add_edge(current, following)
+    builder.add_edge(names[-1], END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+@pytest_asyncio.fixture
+async def pool():
+    pool = AsyncConnectionPool(
+        TEST_DATABASE_URL,
+        connection_class=CountingConnection,
+        kwargs={"autocommit": True, "row_factory": dict_row},
+        open=False,
+    )
+    await pool.open()
+    await AsyncPostgresSaver(pool).setup()
+    yield pool
+    await pool.close()
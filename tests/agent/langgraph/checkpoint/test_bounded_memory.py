@@ -0,0 +1,118 @@
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from app.agent.langgraph.checkpoint import BoundedInMemorySaver, MemoryCheckpointer
+
+from .conftest import build_graph
+
+
+def thread_config(thread_id=None):
+    return {"configurable": {"thread_id": thread_id or str(uuid4())}}
+
+
+async def run(saver, config, steps=3):
+    await build_graph(saver, steps=steps).ainvoke({"steps": []}, config)
+
+
+class TestBoundedInMemorySaver:
+    @pytest.mark.asyncio
+    async def test_keeps_newest_checkpoints_per_thread(self):
+        saver = BoundedInMemorySaver(max_checkpoints_per_thread=3)
+        config = thread_config()
+        await run(saver, config, steps=6)
+
+        history = [c async for c in saver.alist(config)]
+        assert len(history) == 3
+
+        state = await build_graph(saver, steps=6).aget_state(config)
+        assert state.values["steps"] == [f"step_{i}" for i in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_trimming_frees_blobs_and_bytes(self):
+        bounded = BoundedInMemorySaver(max_checkpoints_per_thread=2)
+        unbounded = BoundedInMemorySaver()
+        config = thread_config()
+        await run(bounded, config, steps=6)
+        await run(unbounded, config, steps=6)
+
+        assert len(bounded.blobs) < len(unbounded.blobs)
+        assert 0 < bounded.size_bytes < unbounded.size_bytes
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_thread(self):
+        saver = BoundedInMemorySaver(max_threads=2)
+        first, second, third = thread_config(), thread_config(), thread_config()
+        await run(saver, first)
+        await run(saver, second)
+        await saver.aget_tuple(first)
+        await run(saver, third)
+
+        assert saver.thread_count == 2
+        assert await saver.aget_tuple(second) is None
+        assert await saver.aget_tuple(first) is not None
+        assert not any(
+            key[0] == second["configurable"]["thread_id"] for key in saver.blobs
+        )
+
+    @pytest.mark.asyncio
+    async def test_byte_budget_keeps_current_thread(self):
+        saver = BoundedInMemorySaver(max_bytes=1)
+        first, second = thread_config(), thread_config()
+        await run(saver, first)
+        await run(saver, second)
+
+        assert saver.thread_count == 1
+        assert await saver.aget_tuple(second) is not None
+
+    @pytest.mark.asyncio
+    async def test_idle_threads_expire(self, monkeypatch):
+        saver = BoundedInMemorySaver(idle_ttl=60)
+        config = thread_config()
+        await run(saver, config)
+
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 120)
+        saver.prune()
+
+        assert saver.thread_count == 0
+        assert saver.size_bytes == 0
+        assert not saver.storage and not saver.blobs
+
+    @pytest.mark.asyncio
+    async def test_idle_threads_expire_without_writes(self):
+        checkpointer = MemoryCheckpointer(idle_ttl=0.05, prune_interval=0.01)
+        await checkpointer.initialize()
+        try:
+            saver = await checkpointer.get_checkpointer()
+            await run(saver, thread_config())
+            assert saver.thread_count == 1
+
+            await asyncio.sleep(0.2)
+
+            assert saver.thread_count == 0
+            assert saver.size_bytes == 0
+        finally:
+            await checkpointer.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_delete_thread_releases_accounting(self):
+        saver = BoundedInMemorySaver()
+        config = thread_config()
+        await run(saver, config)
+
+        await saver.adelete_thread(config["configurable"]["thread_id"])
+
+        assert saver.thread_count == 0
+        assert saver.size_bytes == 0
+        assert not saver.writes
+
+    @pytest.mark.asyncio
+    async def test_reading_unknown_thread_leaves_no_trace(self):
+        saver = BoundedInMemorySaver()
+
+        assert await saver.aget_tuple(thread_config()) is None
+        assert [c async for c in saver.alist(thread_config())] == []
+        assert not saver.storage
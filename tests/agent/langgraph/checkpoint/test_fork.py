@@ -0,0 +1,141 @@
+from uuid import uuid4
+
+import pytest
+from langchain_core.messages import HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.agent.langgraph.checkpoint import (
+    BoundedInMemorySaver,
+    CompressedSerializer,
+    ProjectingPostgresSaver,
+    WriteBehindSaver,
+    afork,
+)
+
+from .conftest import requires_postgres
+from .test_projection import build_chat_graph, chat, contents
+
+
+async def fork_and_diverge(saver):
+    graph, config = await chat(saver, turns=3)
+    fork_config = {"configurable": {"thread_id": str(uuid4())}}
+
+    forked = await afork(saver, config, fork_config["configurable"]["thread_id"])
+    assert forked is not None
+    before = contents((await graph.aget_state(fork_config)).values["messages"])
+    await graph.ainvoke({"messages": [HumanMessage(content="edited")]}, fork_config)
+    return graph, config, fork_config, before
+
+
+@pytest.mark.parametrize(
+    "make_saver",
+    [
+        BoundedInMemorySaver,
+        lambda: BoundedInMemorySaver(serde=CompressedSerializer(threshold=0)),
+        InMemorySaver,
+    ],
+    ids=["bounded", "compressed", "fallback"],
+)
+class TestFork:
+    @pytest.mark.asyncio
+    async def test_branch_diverges_from_the_source(self, make_saver):
+        saver = make_saver()
+
+        graph, config, fork_config, before = await fork_and_diverge(saver)
+
+        source = contents((await graph.aget_state(config)).values["messages"])
+        branch = contents((await graph.aget_state(fork_config)).values["messages"])
+        assert before == source
+        assert branch == [*source, "edited", "reply 7"]
+
+    @pytest.mark.asyncio
+    async def test_forks_an_earlier_checkpoint(self, make_saver):
+        saver = make_saver()
+        graph, config = await chat(saver, turns=2)
+        history = [s async for s in graph.aget_state_history(config)]
+        earlier = next(s for s in history if len(s.values["messages"]) == 2)
+
+        fork_id = str(uuid4())
+        forked = await afork(saver, earlier.config, fork_id)
+
+        assert forked is not None
+        assert (
+            forked["configurable"]["checkpoint_id"]
+            == (earlier.config["configurable"]["checkpoint_id"])
+        )
+        state = await graph.aget_state({"configurable": {"thread_id": fork_id}})
+        assert contents(state.values["messages"]) == ["q0", "reply 1"]
+        assert state.metadata["source"] == "fork"
+        assert (
+            state.metadata["forked_from"]["thread_id"]
+            == (config["configurable"]["thread_id"])
+        )
+
+    @pytest.mark.asyncio
+    async def test_unknown_checkpoint(self, make_saver):
+        saver = make_saver()
+        _, config = await chat(saver, turns=1)
+        missing = {"configurable": {**config["configurable"], "checkpoint_id": "x"}}
+
+        assert await afork(saver, missing, str(uuid4())) is None
+        assert await afork(saver, {"configurable": {"thread_id": "x"}}, "y") is None
+
+
+class TestBoundedFork:
+    @pytest.mark.asyncio
+    async def test_blobs_are_shared_with_the_source(self):
+        saver = BoundedInMemorySaver()
+        _, config = await chat(saver, turns=3)
+        thread_id = config["configurable"]["thread_id"]
+
+        await afork(saver, config, "branch")
+
+        shared = [
+            key
+            for key in saver.blobs
+            if key[0] == "branch"
+            and saver.blobs[key] is saver.blobs.get((thread_id, *key[1:]))
+        ]
+        assert shared
+        assert len(saver.storage["branch"][""]) == 1
+
+    @pytest.mark.asyncio
+    async def test_branch_outlives_its_source(self):
+        saver = BoundedInMemorySaver()
+        graph, config = await chat(saver, turns=2)
+        expected = contents((await graph.aget_state(config)).values["messages"])
+
+        await afork(saver, config, "branch")
+        saver.delete_thread(config["configurable"]["thread_id"])
+
+        state = await graph.aget_state({"configurable": {"thread_id": "branch"}})
+        assert contents(state.values["messages"]) == expected
+        assert saver.size_bytes > 0
+
+
+class TestPostgresFork:
+    pytestmark = requires_postgres
+
+    @pytest.mark.asyncio
+    async def test_branch_diverges_from_the_source(self, pool):
+        saver = ProjectingPostgresSaver(pool)
+
+        graph, config, fork_config, before = await fork_and_diverge(saver)
+
+        source = contents((await graph.aget_state(config)).values["messages"])
+        branch = contents((await graph.aget_state(fork_config)).values["messages"])
+        assert before == source
+        assert branch == [*source, "edited", "reply 7"]
+
+    @pytest.mark.asyncio
+    async def test_write_behind_flushes_the_source_first(self, pool):
+        saver = WriteBehindSaver(ProjectingPostgresSaver(pool), flush_interval=60)
+        graph = build_chat_graph(saver)
+        config = {"configurable": {"thread_id": str(uuid4())}}
+        await graph.ainvoke({"messages": [HumanMessage(content="q0")]}, config)
+
+        fork_id = str(uuid4())
+        assert await afork(saver, config, fork_id) is not None
+
+        state = await graph.aget_state({"configurable": {"thread_id": fork_id}})
+        assert contents(state.values["messages"]) == ["q0", "reply 1"]
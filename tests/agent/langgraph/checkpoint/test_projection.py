@@ -0,0 +1,145 @@
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+from app.agent.langgraph.checkpoint import (
+    BoundedInMemorySaver,
+    CompressedSerializer,
+    ProjectingPostgresSaver,
+    aget_projection,
+)
+from app.agent.langgraph.checkpoint.projection import load_messages_page
+
+from .conftest import requires_postgres
+
+
+def build_chat_graph(checkpointer: Any) -> Any:
+    def reply(state: MessagesState) -> dict[str, Any]:
+        return {"messages": [AIMessage(content=f"reply {len(state['messages'])}")]}
+
+    builder = StateGraph(MessagesState)
+    builder.add_node("reply", reply)
+    builder.add_edge(START, "reply")
+    builder.add_edge("reply", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+async def chat(checkpointer: Any, turns: int = 10) -> tuple[Any, Any]:
+    graph = build_chat_graph(checkpointer)
+    config = {"configurable": {"thread_id": str(uuid4())}}
+    for i in range(turns):
+        await graph.ainvoke({"messages": [HumanMessage(content=f"q{i}")]}, config)
+    return graph, config
+
+
+def contents(messages: list[Any]) -> list[str]:
+    return [m.content for m in messages]
+
+
+@pytest.mark.parametrize(
+    "make_saver",
+    [
+        BoundedInMemorySaver,
+        lambda: BoundedInMemorySaver(serde=CompressedSerializer(threshold=0)),
+        InMemorySaver,
+    ],
+    ids=["bounded", "compressed", "fallback"],
+)
+class TestProjection:
+    @pytest.mark.asyncio
+    async def test_pages_match_full_state(self, make_saver):
+        saver = make_saver()
+        graph, config = await chat(saver)
+        full = contents((await graph.aget_state(config)).values["messages"])
+
+        first = await aget_projection(saver, config, ["messages"], limit=3)
+        second = await aget_projection(saver, config, ["messages"], limit=3, skip=3)
+
+        assert first is not None and second is not None
+        assert first.message_count == len(full) == 20
+        assert contents(first.values["messages"]) == full[-3:]
+        assert contents(second.values["messages"]) == full[-6:-3]
+
+    @pytest.mark.asyncio
+    async def test_only_requested_channels(self, make_saver):
+        saver = make_saver()
+        _, config = await chat(saver, turns=2)
+
+        projection = await aget_projection(saver, config, ["missing"])
+
+        assert projection is not None
+        assert projection.values == {}
+        assert projection.config["configurable"]["checkpoint_id"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_thread(self, make_saver):
+        config = {"configurable": {"thread_id": str(uuid4())}}
+        assert await aget_projection(make_saver(), config, ["messages"]) is None
+
+
+class RecordingSerializer(JsonPlusSerializer):
+    def __init__(self) -> None:
+        super().__init__()
+        self.loaded: list[int] = []
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        value = super().loads_typed(data)
+        self.loaded.append(len(value))
+        return value
+
+
+class TestLoadMessagesPage:
+    def test_page_is_decoded_by_the_serializer(self):
+        serde = RecordingSerializer()
+        messages = [HumanMessage(content=f"q{i}") for i in range(10)]
+        typed = serde.dumps_typed(messages)
+
+        page, total = load_messages_page(serde, typed, limit=3, skip=2)
+
+        assert total == 10
+        assert page == messages[5:8]
+        assert serde.loaded == [3]
+
+    @pytest.mark.parametrize(
+        "value", [[], ["plain", "strings"], {"not": "a list"}], ids=repr
+    )
+    def test_other_shapes_are_decoded_in_full(self, value):
+        serde = RecordingSerializer()
+
+        _, total = load_messages_page(serde, serde.dumps_typed(value), None, 0)
+
+        assert serde.loaded == [len(value)]
+        assert total == len(value)
+
+
+class TestPostgresProjection:
+    pytestmark = requires_postgres
+
+    @pytest.mark.asyncio
+    async def test_pages_match_full_state(self, pool):
+        saver = ProjectingPostgresSaver(pool, serde=CompressedSerializer())
+        graph, config = await chat(saver)
+        full = contents((await graph.aget_state(config)).values["messages"])
+
+        projection = await saver.aget_projection(config, ["messages"], 4, 2)
+
+        assert projection is not None
+        assert projection.message_count == len(full)
+        assert contents(projection.values["messages"]) == full[-6:-2]
+
+    @pytest.mark.asyncio
+    async def test_reads_checkpoints_of_the_plain_saver(self, pool):
+        _, config = await chat(AsyncPostgresSaver(pool), turns=2)
+
+        projection = await ProjectingPostgresSaver(pool).aget_projection(
+            config, ["messages"], limit=1
+        )
+
+        assert projection is not None
+        assert contents(projection.values["messages"]) == ["reply 3"]
@@ -0,0 +1,85 @@
+from uuid import uuid4
+
+import pytest
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+
+from app.agent.langgraph.checkpoint import PostgresCheckpointCompactor, RetentionPolicy
+
+from .conftest import build_graph, requires_postgres
+
+
+class TestRetentionPolicy:
+    def test_latest_checkpoint_is_always_kept(self):
+        assert RetentionPolicy(keep_last=0).keep_last is None
+        assert RetentionPolicy(keep_last=0).enabled is False
+        assert RetentionPolicy(max_age=60).enabled is True
+
+    def test_rejects_negative_keep_last(self):
+        with pytest.raises(ValueError):
+            RetentionPolicy(keep_last=-1)
+
+
+async def count_rows(pool, table: str, thread_id: str) -> int:
+    async with pool.connection() as conn:
+        cursor = await conn.execute(
+            f"SELECT count(*) AS n FROM {table} WHERE thread_id = %s", (thread_id,)
+        )
+        row = await cursor.fetchone()
+    return row["n"]
+
+
+@pytest.mark.integration
+class TestPostgresCheckpointCompactor:
+    pytestmark = requires_postgres
+
+    @pytest.mark.asyncio
+    async def test_keeps_newest_checkpoints(self, pool):
+        graph = build_graph(AsyncPostgresSaver(pool))
+        config = {"configurable": {"thread_id": str(uuid4())}}
+        await graph.ainvoke({"steps": []}, config)
+
+        compactor = PostgresCheckpointCompactor(
+            pool, RetentionPolicy(keep_last=3), batch_size=2
+        )
+        removed = await compactor.run_once()
+
+        assert removed["checkpoints"] >= 5
+        history = [s async for s in graph.aget_state_history(config)]
+        assert len(history) == 3
+        state = await graph.aget_state(config)
+        assert state.values["steps"] == [f"step_{i}" for i in range(6)]
+
+        # Only the blob versions the surviving checkpoints point at remain.
+        assert (
+            await count_rows(
+                pool, "checkpoint_blobs", config["configurable"]["thread_id"]
+            )
+            <= 3
+        )
+
+    @pytest.mark.asyncio
+    async def test_max_age_keeps_latest_checkpoint(self, pool):
+        graph = build_graph(AsyncPostgresSaver(pool))
+        config = {"configurable": {"thread_id": str(uuid4())}}
+        await graph.ainvoke({"steps": []}, config)
+
+        compactor = PostgresCheckpointCompactor(pool, RetentionPolicy(max_age=1e-6))
+        await compactor.run_once()
+
+        history = [s async for s in graph.aget_state_history(config)]
+        assert len(history) == 1
+        state = await graph.aget_state(config)
+        assert len(state.values["steps"]) == 6
+
+    @pytest.mark.asyncio
+    async def test_delete_thread_removes_everything(self, pool):
+        saver = AsyncPostgresSaver(pool)
+        thread_id = str(uuid4())
+        await build_graph(saver).ainvoke(
+            {"steps": []}, {"configurable": {"thread_id": thread_id}}
+        )
+
+        await saver.adelete_thread(thread_id)
+
+        for table in ("checkpoints", "checkpoint_writes", "checkpoint_blobs"):
+            assert await count_rows(pool, table, thread_id) == 0
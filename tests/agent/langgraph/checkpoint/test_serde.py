@@ -0,0 +1,132 @@
+import logging
+import sys
+import time
+from importlib.util import find_spec
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from app.agent.langgraph.checkpoint import BoundedInMemorySaver, CompressedSerializer
+
+from .conftest import build_graph
+
+logger = logging.getLogger(__name__)
+
+HAS_ZSTD = find_spec("zstandard") is not None
+requires_zstd = pytest.mark.skipif(not HAS_ZSTD, reason="zstandard is not installed")
+
+
+def conversation(turns: int) -> list[Any]:
+    """Messages shaped like a real thread: questions, tool calls, long outputs."""
+    messages: list[Any] = []
+    for i in range(turns):
+        call_id = f"call_{i}"
+        messages += [
+            HumanMessage(content=f"What changed in report {i} since last week?"),
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {"id": call_id, "name": "search_reports", "args": {"id": i}}
+                ],
+            ),
+            ToolMessage(
+                content="\n".join(
+                    f"| {i} | row {r} | status=ok | latency={r * 7 % 113}ms |"
+                    for r in range(200)
+                ),
+                tool_call_id=call_id,
+            ),
+            AIMessage(content=f"Report {i} looks stable; latency stayed flat."),
+        ]
+    return messages
+
+
+class TestCompressedSerializer:
+    def test_small_values_are_left_alone(self):
+        serde = CompressedSerializer(threshold=1024)
+        type_, data = serde.dumps_typed({"steps": ["a"]})
+        assert serde.codec == "zlib"
+        assert type_ == "msgpack"
+        assert serde.loads_typed((type_, data)) == {"steps": ["a"]}
+
+    @pytest.mark.parametrize(
+        "codec", [pytest.param("zstd", marks=requires_zstd), "zlib"]
+    )
+    def test_large_values_are_compressed(self, codec):
+        serde = CompressedSerializer(codec=codec, threshold=1024)
+        messages = conversation(3)
+
+        type_, data = serde.dumps_typed(messages)
+
+        assert type_ == f"msgpack+{codec}"
+        assert len(data) < len(JsonPlusSerializer().dumps_typed(messages)[1])
+        assert serde.loads_typed((type_, data)) == messages
+
+    @requires_zstd
+    def test_reads_any_codec_and_uncompressed_values(self):
+        messages = conversation(2)
+        written = [
+            JsonPlusSerializer().dumps_typed(messages),
+            CompressedSerializer(codec="zlib").dumps_typed(messages),
+            CompressedSerializer(codec="zstd").dumps_typed(messages),
+        ]
+
+        reader = CompressedSerializer(codec="none")
+        for typed in written:
+            assert reader.loads_typed(typed) == messages
+
+    def test_rejects_unknown_codec(self):
+        with pytest.raises(ValueError):
+            CompressedSerializer(codec="brotli")
+
+    def test_missing_codec_package_names_it(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "lz4", None)
+        monkeypatch.setitem(sys.modules, "lz4.frame", None)
+
+        with pytest.raises(ImportError, match="requires the lz4 package"):
+            CompressedSerializer(codec="lz4")
+
+    @pytest.mark.asyncio
+    async def test_graph_round_trip(self):
+        saver = BoundedInMemorySaver(serde=CompressedSerializer(threshold=0))
+        graph = build_graph(saver)
+        config = {"configurable": {"thread_id": str(uuid4())}}
+
+        await graph.ainvoke({"steps": []}, config)
+
+        state = await graph.aget_state(config)
+        assert state.values["steps"] == [f"step_{i}" for i in range(6)]
+
+    @pytest.mark.slow
+    def test_benchmark_per_step(self):
+        # One step rewrites the whole messages channel, so a step costs what
+        # the serialized list costs.
+        steps = [conversation(turns) for turns in range(1, 21)]
+        serializers = {
+            "plain": JsonPlusSerializer(),
+            "zlib": CompressedSerializer(codec="zlib"),
+        }
+        if HAS_ZSTD:
+            serializers["zstd"] = CompressedSerializer(codec="zstd")
+
+        for name, serde in serializers.items():
+            written = 0
+            dump_time = load_time = 0.0
+            for messages in steps:
+                started = time.perf_counter()
+                typed = serde.dumps_typed(messages)
+                dump_time += time.perf_counter() - started
+                written += len(typed[1])
+
+                started = time.perf_counter()
+                serde.loads_typed(typed)
+                load_time += time.perf_counter() - started
+
+            logger.info(
+                f"{name}: {written / len(steps) / 1024:.1f} KiB/step, "
+                f"dumps {dump_time / len(steps) * 1000:.2f} ms/step, "
+                f"loads {load_time / len(steps) * 1000:.2f} ms/step"
+            )
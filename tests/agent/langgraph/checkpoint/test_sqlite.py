@@ -0,0 +1,164 @@
+import logging
+import sqlite3
+import time
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.agent.langgraph.checkpoint import SQLiteSaver
+
+from .conftest import TEST_DATABASE_URL, build_graph
+
+logger = logging.getLogger(__name__)
+
+
+def thread_config() -> Any:
+    return {"configurable": {"thread_id": str(uuid4())}}
+
+
+class TestSQLiteSaver:
+    @pytest.mark.asyncio
+    async def test_checkpoints_survive_reopen(self, tmp_path):
+        path = tmp_path / "checkpoints.sqlite"
+        config = thread_config()
+
+        saver = SQLiteSaver(path, flush_interval=60)
+        await saver.setup()
+        await build_graph(saver).ainvoke({"steps": []}, config)
+        await saver.close()
+
+        reopened = SQLiteSaver(path, flush_interval=60)
+        await reopened.setup()
+        try:
+            graph = build_graph(reopened)
+            state = await graph.aget_state(config)
+            assert state.values["steps"] == [f"step_{i}" for i in range(6)]
+            history = [s async for s in graph.aget_state_history(config)]
+            assert len(history) == 8
+        finally:
+            await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_writes_are_batched_until_flush(self, tmp_path):
+        saver = SQLiteSaver(tmp_path / "checkpoints.sqlite", flush_interval=60)
+        await saver.setup()
+        try:
+            config = thread_config()
+            await build_graph(saver).ainvoke({"steps": []}, config)
+            assert saver.pending > 0
+
+            state = await build_graph(saver).aget_state(config)
+            assert saver.pending == 0
+            assert len(state.values["steps"]) == 6
+        finally:
+            await saver.close()
+
+    @pytest.mark.asyncio
+    async def test_compaction_keeps_newest_checkpoints(self, tmp_path):
+        saver = SQLiteSaver(
+            tmp_path / "checkpoints.sqlite", flush_interval=60, keep_checkpoints=3
+        )
+        await saver.setup()
+        try:
+            config = thread_config()
+            graph = build_graph(saver)
+            await graph.ainvoke({"steps": []}, config)
+
+            assert await saver.acompact() == 5
+            history = [s async for s in graph.aget_state_history(config)]
+            assert len(history) == 3
+            state = await graph.aget_state(config)
+            assert len(state.values["steps"]) == 6
+        finally:
+            await saver.close()
+
+    @pytest.mark.asyncio
+    async def test_delete_thread(self, tmp_path):
+        saver = SQLiteSaver(tmp_path / "checkpoints.sqlite", flush_interval=60)
+        await saver.setup()
+        try:
+            config = thread_config()
+            await build_graph(saver).ainvoke({"steps": []}, config)
+            await saver.adelete_thread(config["configurable"]["thread_id"])
+            assert await saver.aget_tuple(config) is None
+        finally:
+            await saver.close()
+
+    @pytest.mark.asyncio
+    async def test_corrupt_database_is_moved_aside(self, tmp_path):
+        path = tmp_path / "checkpoints.sqlite"
+        path.write_bytes(b"SQLite format 3\x00" + b"\xff" * 4096)
+
+        saver = SQLiteSaver(path, flush_interval=60)
+        await saver.setup()
+        try:
+            config = thread_config()
+            await build_graph(saver).ainvoke({"steps": []}, config)
+            assert await saver.aget_tuple(config) is not None
+        finally:
+            await saver.close()
+
+        assert list(tmp_path.glob("checkpoints.sqlite.corrupt-*"))
+
+    @pytest.mark.asyncio
+    async def test_locked_database_is_left_alone(self, tmp_path):
+        path = tmp_path / "checkpoints.sqlite"
+        holder = sqlite3.connect(path, isolation_level=None)
+        holder.execute("CREATE TABLE t (x)")
+        holder.execute("BEGIN EXCLUSIVE")
+
+        saver = SQLiteSaver(path, flush_interval=60, busy_timeout=0.05)
+        try:
+            with pytest.raises(sqlite3.OperationalError, match="locked"):
+                await saver.setup()
+        finally:
+            await saver.close()
+            holder.rollback()
+            holder.close()
+
+        assert not list(tmp_path.glob("checkpoints.sqlite.corrupt-*"))
+        assert path.exists()
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_benchmark_against_other_backends(self, tmp_path):
+        runs = 50
+        savers: dict[str, Any] = {
+            "memory": InMemorySaver(),
+            "sqlite": SQLiteSaver(tmp_path / "checkpoints.sqlite", flush_interval=60),
+        }
+        await savers["sqlite"].setup()
+
+        pool = None
+        if TEST_DATABASE_URL:
+            from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+            from psycopg.rows import dict_row
+            from psycopg_pool import AsyncConnectionPool
+
+            pool = AsyncConnectionPool(
+                TEST_DATABASE_URL,
+                kwargs={"autocommit": True, "row_factory": dict_row},
+                open=False,
+            )
+            await pool.open()
+            savers["postgres"] = AsyncPostgresSaver(pool)
+            await savers["postgres"].setup()
+
+        try:
+            for name, saver in savers.items():
+                graph = build_graph(saver)
+                started = time.perf_counter()
+                for _ in range(runs):
+                    config = thread_config()
+                    await graph.ainvoke({"steps": []}, config)
+                    if isinstance(saver, SQLiteSaver):
+                        await saver.aflush()
+                    await graph.aget_state(config)
+                elapsed = time.perf_counter() - started
+                logger.info(f"{name}: {elapsed / runs * 1000:.2f} ms per run")
+        finally:
+            await savers["sqlite"].close()
+            if pool is not None:
+                await pool.close()
@@ -0,0 +1,60 @@
+from uuid import uuid4
+
+import pytest
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+
+from app.agent.langgraph.checkpoint import TieredSaver
+from app.agent.langgraph.checkpoint.tiered import CHECKPOINT_CACHE_LOOKUPS_TOTAL
+
+from .conftest import build_graph, requires_postgres
+
+pytestmark = requires_postgres
+
+
+def lookups(result):
+    return CHECKPOINT_CACHE_LOOKUPS_TOTAL.labels(result)._value.get()
+
+
+class TestTieredSaver:
+    @pytest.mark.asyncio
+    async def test_latest_checkpoint_is_served_from_cache(self, pool):
+        saver = TieredSaver(AsyncPostgresSaver(pool))
+        graph = build_graph(saver)
+        config = {"configurable": {"thread_id": str(uuid4())}}
+        await graph.ainvoke({"steps": []}, config)
+
+        hits = lookups("hit")
+        cached = await saver.aget_tuple(config)
+        stored = await AsyncPostgresSaver(pool).aget_tuple(config)
+
+        assert lookups("hit") == hits + 1
+        assert cached.checkpoint["id"] == stored.checkpoint["id"]
+        assert (
+            cached.checkpoint["channel_values"] == stored.checkpoint["channel_values"]
+        )
+        assert cached.parent_config == stored.parent_config
+
+    @pytest.mark.asyncio
+    async def test_write_from_another_worker_invalidates(self, pool):
+        saver = TieredSaver(AsyncPostgresSaver(pool))
+        config = {"configurable": {"thread_id": str(uuid4())}}
+        await build_graph(saver).ainvoke({"steps": []}, config)
+
+        other_worker = build_graph(AsyncPostgresSaver(pool))
+        await other_worker.ainvoke({"steps": []}, config)
+
+        stale = lookups("stale")
+        state = await build_graph(saver).aget_state(config)
+
+        assert lookups("stale") == stale + 1
+        assert len(state.values["steps"]) == 12
+
+    @pytest.mark.asyncio
+    async def test_lru_bound(self, pool):
+        saver = TieredSaver(AsyncPostgresSaver(pool), max_threads=2)
+        graph = build_graph(saver, steps=1)
+        for _ in range(3):
+            config = {"configurable": {"thread_id": str(uuid4())}}
+            await graph.ainvoke({"steps": []}, config)
+
+        assert len(saver._cache) == 2
@@ -0,0 +1,68 @@
+import logging
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+
+from app.agent.langgraph.checkpoint import WriteBehindSaver
+
+from .conftest import CountingConnection, build_graph, requires_postgres
+
+logger = logging.getLogger(__name__)
+
+pytestmark = requires_postgres
+
+
+async def run_once(graph: Any, saver: Any) -> int:
+    config = {"configurable": {"thread_id": str(uuid4())}}
+    CountingConnection.round_trips = 0
+    await graph.ainvoke({"steps": []}, config)
+    if isinstance(saver, WriteBehindSaver):
+        await saver.aflush()
+    return CountingConnection.round_trips
+
+
+class TestWriteBehindSaver:
+    @pytest.mark.asyncio
+    async def test_final_checkpoint_is_durable(self, pool):
+        saver = WriteBehindSaver(AsyncPostgresSaver(pool), flush_interval=60)
+        graph = build_graph(saver)
+        config = {"configurable": {"thread_id": str(uuid4())}}
+
+        await graph.ainvoke({"steps": []}, config)
+        assert saver.pending > 0
+        await saver.aflush()
+        assert saver.pending == 0
+
+        direct = build_graph(AsyncPostgresSaver(pool))
+        state = await direct.aget_state(config)
+        assert state.values["steps"] == [f"step_{i}" for i in range(6)]
+        history = [s async for s in direct.aget_state_history(config)]
+        assert len(history) == 8
+
+    @pytest.mark.asyncio
+    async def test_reads_see_buffered_checkpoints(self, pool):
+        saver = WriteBehindSaver(AsyncPostgresSaver(pool), flush_interval=60)
+        graph = build_graph(saver)
+        config = {"configurable": {"thread_id": str(uuid4())}}
+
+        await graph.ainvoke({"steps": []}, config)
+        state = await graph.aget_state(config)
+
+        assert len(state.values["steps"]) == 6
+        assert saver.pending == 0
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_round_trips_per_run(self, pool):
+        direct = AsyncPostgresSaver(pool)
+        write_behind = WriteBehindSaver(AsyncPostgresSaver(pool), flush_interval=60)
+
+        direct_trips = await run_once(build_graph(direct), direct)
+        buffered_trips = await run_once(build_graph(write_behind), write_behind)
+
+        logger.info(
+            f"Round trips per run: direct={direct_trips} write_behind={buffered_trips}"
+        )
+        assert buffered_trips < direct_trips / 2, (direct_trips, buffered_trips)
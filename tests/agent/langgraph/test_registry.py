@@ -0,0 +1,67 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from app.agent.langgraph.graph import Graph
+from app.agent.langgraph.registry import GraphRegistry, UnknownAgentError
+
+
+class FakeGraph(Graph):
+    builds = 0
+
+    @property
+    def graph_name(self) -> str:
+        return "fake_graph"
+
+    def build_graph(self):
+        type(self).builds += 1
+        return Mock(name=f"compiled_{type(self).__name__}")
+
+
+class OtherGraph(FakeGraph):
+    builds = 0
+
+
+@pytest.fixture
+def registry():
+    FakeGraph.builds = 0
+    OtherGraph.builds = 0
+    return GraphRegistry(
+        Mock(), Mock(), {"fake": FakeGraph, "other": OtherGraph}, "fake"
+    )
+
+
+class TestGraphRegistry:
+    @pytest.mark.asyncio
+    async def test_get_defaults_to_default_agent(self, registry):
+        assert await registry.get(None) is await registry.get("fake")
+        assert FakeGraph.builds == 1
+        assert OtherGraph.builds == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_compiles_once(self, registry):
+        results = await asyncio.gather(*(registry.get("other") for _ in range(10)))
+        assert all(r is results[0] for r in results)
+        assert OtherGraph.builds == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_agent(self, registry):
+        with pytest.raises(UnknownAgentError):
+            await registry.get("missing")
+
+    def test_unknown_default_agent(self):
+        with pytest.raises(UnknownAgentError):
+            GraphRegistry(Mock(), Mock(), {"fake": FakeGraph}, "missing")
+
+    @pytest.mark.asyncio
+    async def test_warmup_compiles_all(self, registry):
+        await registry.warmup()
+        assert FakeGraph.builds == 1
+        assert OtherGraph.builds == 1
+
+    @pytest.mark.asyncio
+    async def test_register_replaces_compiled(self, registry):
+        first = await registry.get("fake")
+        registry.register("fake", OtherGraph)
+        assert await registry.get("fake") is not first
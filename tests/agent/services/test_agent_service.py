@@ -1,3 +1,4 @@
+import asyncio
 import json
 import tracemalloc
 from datetime import UTC, datetime
@@ -5,13 +6,18 @@ from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
 import pytest
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import AIMessage, HumanMessage
 from langfuse import Langfuse
 from langgraph.graph.state import CompiledStateGraph
 
-from app.agent.services.agent_service import AgentService
+from app.agent.services import FEEDBACK_QUEUE, feedback_handler
+from app.agent.services.agent_service import AgentService, RunFailedError
 from app.agent.services.events.base_event import BaseEvent
+from app.infrastructure.jobs import InMemoryJobQueue
 from app.models import Thread, User
 from app.models.thread import ThreadStatus
+from app.repositories.search import InMemoryMessageSearchIndex
 
 tracemalloc.start()
 
@@ -145,3 +151,115 @@ class TestAgentService:
         assert mock_thread.updated_at > t0
         agent_service.langfuse.create_score.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_add_feedback_is_queued(self, mock_graph, mock_langfuse, mock_thread, mock_user):
+        jobs = InMemoryJobQueue()
+        jobs.register(FEEDBACK_QUEUE, feedback_handler(mock_langfuse))
+        service = AgentService(mock_graph, mock_langfuse, jobs=jobs)
+
+        r = await service.add_feedback("tr", 1.0, mock_thread, mock_user)
+
+        assert r["status"] == "success"
+        assert jobs.pending == 1
+        mock_langfuse.create_score.assert_not_called()
+
+        assert await jobs.run_once()
+        mock_langfuse.create_score.assert_called_once()
+        assert mock_langfuse.create_score.call_args.kwargs["trace_id"] == "tr"
+
+
+    @pytest.mark.asyncio
+    async def test_stream_response_indexes_messages(self, mock_graph, mock_langfuse, mock_thread, mock_user):
+        index = InMemoryMessageSearchIndex()
+        service = AgentService(mock_graph, mock_langfuse, search_index=index)
+        mock_thread.user_id = mock_user.id
+
+        async def stream():
+            yield ("updates", {"agent": {"messages": [
+                AIMessage(content="", id="call", tool_calls=[{"name": "weather", "args": {}, "id": "t1"}]),
+                AIMessage(content="It is sunny in Kyiv", id="answer"),
+            ]}})
+
+        mock_graph.astream = Mock(return_value=stream())
+        _ = [r async for r in service.stream_response("Weather in Kyiv?", mock_thread, mock_user)]
+
+        page = await index.search(mock_user.id, "kyiv")
+        assert [h.thread_id for h in page.hits] == [mock_thread.id]
+        assert len(index._messages) == 2
+
+    @pytest.mark.asyncio
+    async def test_run_returns_the_messages_it_produced(self, mock_graph, mock_langfuse, mock_thread, mock_user):
+        index = InMemoryMessageSearchIndex()
+        service = AgentService(mock_graph, mock_langfuse, search_index=index)
+
+        async def ainvoke(inputs, config):
+            earlier = [HumanMessage(content="Earlier", id="h0"), AIMessage(content="Before", id="a0")]
+            return {"messages": [*earlier, *inputs["messages"], AIMessage(content="Hi there", id="answer")]}
+
+        mock_graph.ainvoke = AsyncMock(side_effect=ainvoke)
+        messages = await service.run("Hello", mock_thread, mock_user)
+
+        assert [(m["type"], m["content"]) for m in messages] == [("ai_message", "Hi there")]
+        assert messages[0]["trace_id"] == "test_trace_id"
+        mock_graph.astream.assert_not_called()
+        assert mock_thread.status == ThreadStatus.idle
+        assert {m.message_id for m in index._messages.values()} >= {"answer"}
+
+    @pytest.mark.asyncio
+    async def test_run_raises_when_the_graph_fails(self, mock_graph, mock_langfuse, mock_thread, mock_user):
+        service = AgentService(mock_graph, mock_langfuse)
+        mock_graph.ainvoke = AsyncMock(side_effect=RuntimeError("model unavailable"))
+
+        with pytest.raises(RunFailedError, match="model unavailable"):
+            await service.run("Hello", mock_thread, mock_user)
+
+        assert mock_thread.status == ThreadStatus.error
+
+
+def build_tool_graph(tool_started):
+    from langgraph.checkpoint.memory import InMemorySaver
+    from langgraph.graph import START, MessagesState, StateGraph
+
+    async def call_model(state):
+        if isinstance(state["messages"][-1], HumanMessage) and state["messages"][-1].content == "use tool":
+            return {"messages": [AIMessage(content="", id="call", tool_calls=[{"id": "t1", "name": "slow", "args": {}}])]}
+        return {"messages": [AIMessage(content=f"seen {len(state['messages'])}")]}
+
+    async def tools(state):
+        tool_started.set()
+        await asyncio.sleep(10)
+
+    def route(state):
+        return "tools" if state["messages"][-1].tool_calls else "__end__"
+
+    builder = StateGraph(MessagesState)
+    builder.add_node("call_model", call_model)
+    builder.add_node("tools", tools)
+    builder.add_edge(START, "call_model")
+    builder.add_conditional_edges("call_model", route, ["tools", "__end__"])
+    builder.add_edge("tools", "call_model")
+    return builder.compile(checkpointer=InMemorySaver())
+
+
+class TestCancelledRuns:
+    @pytest.mark.asyncio
+    async def test_cancelled_tool_calls_are_answered(self, mock_langfuse, mock_thread, mock_user):
+        tool_started = asyncio.Event()
+        service = AgentService(build_tool_graph(tool_started), mock_langfuse)
+
+        with patch("app.agent.services.agent_service.CallbackHandler", BaseCallbackHandler):
+            run = asyncio.create_task(service.run("use tool", mock_thread, mock_user))
+            await tool_started.wait()
+            run.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await run
+
+            assert mock_thread.status == ThreadStatus.interrupted
+            config = {"configurable": {"thread_id": mock_thread.id}}
+            messages = (await service.graph.aget_state(config)).values["messages"]
+            assert messages[-1].type == "tool"
+            assert messages[-1].tool_call_id == "t1"
+
+            answer = await service.run("hello", mock_thread, mock_user)
+
+        assert [m["content"] for m in answer] == ["seen 4"]
@@ -0,0 +1,74 @@
+import logging
+import time
+from itertools import cycle
+from unittest.mock import Mock, patch
+
+import pytest
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+from app.agent.services import AgentService
+from app.models import Thread, User
+
+logger = logging.getLogger(__name__)
+
+RUNS = 10
+
+# About 200 tokens, a short answer.
+ANSWER = " ".join(f"word{i}" for i in range(200))
+
+
+def build_service() -> AgentService:
+    model = GenericFakeChatModel(messages=cycle([AIMessage(content=ANSWER)]))
+
+    async def call_model(state: MessagesState) -> dict[str, list[AIMessage]]:
+        return {"messages": [await model.ainvoke(state["messages"])]}
+
+    builder = StateGraph(MessagesState)
+    builder.add_node("agent", call_model)
+    builder.add_edge(START, "agent")
+    builder.add_edge("agent", END)
+
+    langfuse = Mock()
+    span = Mock(trace_id="trace")
+    span.__enter__ = Mock(return_value=span)
+    span.__exit__ = Mock(return_value=None)
+    langfuse.start_as_current_span.return_value = span
+
+    return AgentService(builder.compile(checkpointer=InMemorySaver()), langfuse)
+
+
+class TestRunBenchmark:
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_benchmark_cpu_per_run(self):
+        service = build_service()
+        user = User(id="bench", email="bench@example.com")
+
+        async def stream(i: int) -> None:
+            thread = Thread(id=f"stream-{i}", metadata={})
+            _ = [e async for e in service.stream_response("Hi", thread, user)]
+
+        async def invoke(i: int) -> None:
+            await service.run("Hi", Thread(id=f"run-{i}", metadata={}), user)
+
+        cpu = {}
+        with patch(
+            "app.agent.services.agent_service.CallbackHandler", BaseCallbackHandler
+        ):
+            for name, execute in (("stream", stream), ("run", invoke)):
+                await execute(-1)
+                started = time.process_time()
+                for i in range(RUNS):
+                    await execute(i)
+                cpu[name] = (time.process_time() - started) / RUNS
+
+        logger.info(
+            f"stream {cpu['stream'] * 1000:.2f} ms/run, "
+            f"run {cpu['run'] * 1000:.2f} ms/run, "
+            f"saved {(1 - cpu['run'] / cpu['stream']) * 100:.0f}%"
+        )
+        assert cpu["run"] < cpu["stream"]
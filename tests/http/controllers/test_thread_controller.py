@@ -0,0 +1,376 @@
+import asyncio
+import json
+from unittest.mock import Mock
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+from app.agent.langgraph.checkpoint import BoundedInMemorySaver
+from app.agent.services import RunFailedError
+from app.http.controllers import ThreadController
+from app.http.requests import BatchRunItem, ForkThread
+from app.infrastructure.admission import AdmissionController
+from app.infrastructure.cancellation import InMemoryRunCanceller
+from app.infrastructure.idempotency import IdempotencyRecord, InMemoryIdempotencyStore
+from app.infrastructure.jobs import InMemoryJobQueue
+from app.infrastructure.locks import InMemoryRunLock
+from app.infrastructure.streams import InMemoryRunEventBroker
+from app.models import Thread, User
+from app.repositories.search import InMemoryMessageSearchIndex
+from app.repositories.threads import InMemoryThreadRepository
+
+
+class FakeAgentService:
+    """Answers each input after the delay it names, failing on ``"fail"``."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+        self.streamed = 0
+
+    async def stream_response(self, message, thread, user, run_id=None):
+        self.streamed += 1
+        yield {"event": "ai_message", "data": json.dumps({"content": message})}
+        if message == "block":
+            await asyncio.Event().wait()
+        yield {"event": "stream_end", "data": json.dumps({"status": "completed"})}
+
+    async def run(self, message, thread, user, run_id=None):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            if message == "fail":
+                raise RunFailedError("model unavailable")
+            await asyncio.sleep(float(message))
+            return [{"type": "ai", "content": f"done {message}"}]
+        finally:
+            self.running -= 1
+
+
+@pytest.fixture
+def agent_service():
+    return FakeAgentService()
+
+
+@pytest.fixture
+def threads():
+    return InMemoryThreadRepository()
+
+
+@pytest.fixture
+def idempotency():
+    return InMemoryIdempotencyStore(ttl=60)
+
+
+@pytest.fixture
+def controller(agent_service, threads, idempotency):
+    registry = Mock()
+    registry.resolve.return_value = "demo"
+    registry.checkpointer = BoundedInMemorySaver()
+    controller = ThreadController(
+        registry,
+        Mock(),
+        InMemoryRunLock(),
+        AdmissionController(max_concurrency=8, max_queue=8, queue_timeout=1.0),
+        InMemoryRunEventBroker(),
+        threads,
+        InMemoryMessageSearchIndex(),
+        Mock(),
+        idempotency,
+        InMemoryRunCanceller(),
+        InMemoryJobQueue(),
+        batch_concurrency=2,
+        batch_max_runs=5,
+        wait_timeout=1.0,
+    )
+    controller._agent_services["demo"] = agent_service
+    return controller
+
+
+@pytest.fixture
+def user():
+    return User(id="alice", email="alice@example.com")
+
+
+async def read_lines(response):
+    return [json.loads(line) async for line in response.body_iterator]
+
+
+async def read_events(response):
+    return [event async for event in response.body_iterator]
+
+
+class TestIdempotentStreams:
+    @pytest.mark.asyncio
+    async def test_retry_replays_the_run_instead_of_executing_again(
+        self, controller, agent_service, user
+    ):
+        first = await controller.stream("hi", None, {}, user, idempotency_key="k1")
+        events = await read_events(first)
+
+        retry = await controller.stream("hi", None, {}, user, idempotency_key="k1")
+
+        assert retry.headers["X-Run-Id"] == first.headers["X-Run-Id"]
+        assert retry.headers["X-Thread-Id"] == first.headers["X-Thread-Id"]
+        assert await read_events(retry) == events
+        assert agent_service.streamed == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_resumes_after_last_event_id(self, controller, user):
+        first = await controller.stream("hi", None, {}, user, idempotency_key="k1")
+        events = await read_events(first)
+
+        retry = await controller.stream(
+            "hi", None, {}, user, idempotency_key="k1", last_event_id=events[0]["id"]
+        )
+
+        assert await read_events(retry) == events[1:]
+
+    @pytest.mark.asyncio
+    async def test_keys_are_scoped_per_user(self, controller, agent_service, user):
+        other = User(id="bob", email="bob@example.com")
+        await read_events(
+            await controller.stream("hi", None, {}, user, idempotency_key="k1")
+        )
+        await read_events(
+            await controller.stream("hi", None, {}, other, idempotency_key="k1")
+        )
+
+        assert agent_service.streamed == 2
+
+    @pytest.mark.asyncio
+    async def test_reusing_a_key_for_another_request_is_refused(self, controller, user):
+        await read_events(
+            await controller.stream("hi", None, {}, user, idempotency_key="k1")
+        )
+
+        with pytest.raises(HTTPException) as exc:
+            await controller.stream("bye", None, {}, user, idempotency_key="k1")
+
+        assert exc.value.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_key_is_released_when_the_run_does_not_start(
+        self, controller, threads, idempotency, user
+    ):
+        thread_id = uuid4()
+        await threads.create(Thread(id=str(thread_id), user_id="bob", metadata={}))
+
+        with pytest.raises(HTTPException) as exc:
+            await controller.stream("hi", thread_id, {}, user, idempotency_key="k1")
+
+        assert exc.value.status_code == 404
+        record = IdempotencyRecord(str(thread_id), "run", "fingerprint")
+        assert await idempotency.claim(user.id, "k1", record) == record
+
+
+class TestCancelRuns:
+    @pytest.mark.asyncio
+    async def test_cancels_a_streaming_run(self, controller, threads, user):
+        response = await controller.stream("block", None, {}, user)
+        thread = await threads.get(response.headers["X-Thread-Id"])
+        run_id = UUID(response.headers["X-Run-Id"])
+        events = response.body_iterator
+        await anext(events)
+
+        result = await controller.cancel_run(thread, run_id)
+        rest = [event async for event in events]
+
+        assert result["status"] == "cancelling"
+        assert rest[-1]["event"] == "error"
+        assert json.loads(rest[-1]["data"])["content"] == "Run cancelled"
+        with pytest.raises(HTTPException) as exc:
+            await controller.cancel_run(thread, run_id)
+        assert exc.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiting_run_answers_409(self, controller, threads, user):
+        waiter = asyncio.create_task(controller.wait("10", None, {}, user))
+        while not controller._canceller._leases:
+            await asyncio.sleep(0)
+        run_id, lease = next(iter(controller._canceller._leases.items()))
+
+        await controller.cancel_run(await threads.get(lease.thread_id), UUID(run_id))
+
+        with pytest.raises(HTTPException) as exc:
+            await waiter
+        assert exc.value.status_code == 409
+        assert exc.value.detail == "Run cancelled"
+        assert not controller._canceller._leases
+
+    @pytest.mark.asyncio
+    async def test_unknown_runs_are_not_found(self, controller, threads, user):
+        thread = await threads.create(Thread(id="t", user_id=user.id, metadata={}))
+
+        with pytest.raises(HTTPException) as exc:
+            await controller.cancel_run(thread, uuid4())
+
+        assert exc.value.status_code == 404
+
+
+def build_echo_graph(checkpointer):
+    def echo(state: MessagesState):
+        return {
+            "messages": [AIMessage(content=f"echo {state['messages'][-1].content}")]
+        }
+
+    builder = StateGraph(MessagesState)
+    builder.add_node("echo", echo)
+    builder.add_edge(START, "echo")
+    builder.add_edge("echo", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+class TestForkThreads:
+    @pytest.mark.asyncio
+    async def test_fork_starts_from_the_checkpoint(self, controller, threads, user):
+        thread = await threads.create(
+            Thread(id="t1", user_id=user.id, metadata={"title": "chat"})
+        )
+        graph = build_echo_graph(controller._registry.checkpointer)
+        config = {"configurable": {"thread_id": thread.id}}
+        await graph.ainvoke({"messages": [HumanMessage(content="one")]}, config)
+        first = (await graph.aget_state(config)).config["configurable"]
+        await graph.ainvoke({"messages": [HumanMessage(content="two")]}, config)
+
+        fork = await controller.fork_thread(
+            thread,
+            user,
+            ForkThread(checkpoint_id=first["checkpoint_id"], metadata={"edit": 1}),
+        )
+
+        assert await threads.get(fork.id) == fork
+        assert fork.user_id == user.id
+        assert fork.metadata == {
+            "title": "chat",
+            "edit": 1,
+            "forked_from": {"thread_id": "t1", "checkpoint_id": first["checkpoint_id"]},
+        }
+        state = await graph.aget_state({"configurable": {"thread_id": fork.id}})
+        assert [m.content for m in state.values["messages"]] == ["one", "echo one"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_checkpoints_are_not_found(self, controller, threads, user):
+        thread = await threads.create(Thread(id="t1", user_id=user.id, metadata={}))
+
+        with pytest.raises(HTTPException) as error:
+            await controller.fork_thread(thread, user, ForkThread())
+
+        assert error.value.status_code == 404
+
+
+class TestWaitRuns:
+    @pytest.mark.asyncio
+    async def test_returns_the_produced_messages(self, controller, user):
+        response = await controller.wait("0", None, {}, user)
+
+        body = json.loads(response.body)
+        assert response.status_code == 200
+        assert body["status"] == "success"
+        assert body["messages"] == [{"type": "ai", "content": "done 0"}]
+
+    @pytest.mark.asyncio
+    async def test_answers_202_and_keeps_running_after_the_timeout(
+        self, controller, agent_service, user
+    ):
+        response = await controller.wait("0.1", None, {}, user, timeout=0.01)
+
+        body = json.loads(response.body)
+        assert response.status_code == 202
+        assert body["status"] == "pending"
+        assert agent_service.running == 1
+
+        await asyncio.gather(*controller._background_runs)
+        assert agent_service.running == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_capped_by_the_service_limit(self, controller, user):
+        response = await controller.wait("2", None, {}, user, timeout=60)
+
+        assert response.status_code == 202
+        for task in controller._background_runs:
+            task.cancel()
+        await asyncio.gather(*controller._background_runs, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_failed_runs_answer_500(self, controller, user):
+        with pytest.raises(HTTPException) as exc:
+            await controller.wait("fail", None, {}, user)
+
+        assert exc.value.status_code == 500
+        assert exc.value.detail == "model unavailable"
+
+
+class TestBatchRuns:
+    @pytest.mark.asyncio
+    async def test_streams_results_in_completion_order(
+        self, controller, agent_service, user
+    ):
+        runs = [BatchRunItem(input=delay) for delay in ("0.05", "0.01", "0.02")]
+
+        response = await controller.batch(runs, user)
+        results = await read_lines(response)
+
+        assert response.media_type == "application/x-ndjson"
+        assert [r["index"] for r in results] == [1, 2, 0]
+        assert all(r["status"] == "success" for r in results)
+        assert results[0]["messages"] == [{"type": "ai", "content": "done 0.01"}]
+        assert agent_service.max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_request_cannot_exceed_service_concurrency(
+        self, controller, agent_service, user
+    ):
+        runs = [BatchRunItem(input="0.01") for _ in range(5)]
+
+        await read_lines(await controller.batch(runs, user, concurrency=10))
+
+        assert agent_service.max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_runs_do_not_stop_the_batch(self, controller, user):
+        runs = [BatchRunItem(input="fail"), BatchRunItem(input="0")]
+
+        results = await read_lines(await controller.batch(runs, user))
+
+        by_index = {r["index"]: r for r in results}
+        assert by_index[0]["status"] == "error"
+        assert by_index[0]["error"] == "model unavailable"
+        assert by_index[1]["status"] == "success"
+
+    @pytest.mark.asyncio
+    async def test_threads_of_other_users_are_refused(self, controller, threads, user):
+        thread_id = uuid4()
+        await threads.create(Thread(id=str(thread_id), user_id="bob", metadata={}))
+
+        results = await read_lines(
+            await controller.batch([BatchRunItem(input="0", thread_id=thread_id)], user)
+        )
+
+        assert results[0]["status"] == "error"
+        assert results[0]["thread_id"] == str(thread_id)
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_batches(self, controller, user):
+        runs = [BatchRunItem(input="0") for _ in range(6)]
+
+        with pytest.raises(HTTPException) as exc:
+            await controller.batch(runs, user)
+
+        assert exc.value.status_code == 413
+
+    @pytest.mark.asyncio
+    async def test_closing_the_stream_cancels_running_runs(
+        self, controller, agent_service, user
+    ):
+        runs = [BatchRunItem(input=delay) for delay in ("0", "10", "10")]
+        response = await controller.batch(runs, user)
+
+        lines = response.body_iterator
+        assert json.loads(await anext(lines))["index"] == 0
+        await lines.aclose()
+
+        assert agent_service.running == 0
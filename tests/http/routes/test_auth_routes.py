@@ -0,0 +1,55 @@
+import asyncio
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.bootstrap.app_factory import create_app
+from app.bootstrap.config import AppConfig
+from app.http.routes import auth_router
+from app.infrastructure.auth import decode_token
+from app.repositories.users import InMemoryUserRepository
+
+SECRET = "test-secret"
+
+
+def make_client(
+    secret_key: str | None = SECRET,
+) -> tuple[TestClient, InMemoryUserRepository]:
+    users = InMemoryUserRepository()
+    app = FastAPI()
+    app.include_router(auth_router, prefix="/api/v1")
+    app.state.container = SimpleNamespace(
+        config=AppConfig(secret_key=secret_key, auth_dev_token_ttl=60),
+        user_repository=users,
+    )
+    return TestClient(app), users
+
+
+class TestDevToken:
+    def test_signs_a_token_and_creates_the_user(self):
+        client, users = make_client()
+
+        response = client.post("/api/v1/auth/dev-token", json={"user_id": "u1"})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["token_type"] == "bearer"
+        assert body["expires_in"] == 60
+        assert decode_token(body["access_token"], SECRET)["sub"] == "u1"
+        user = asyncio.run(users.get("u1"))
+        assert user is not None and user.email == "useru1@example.com"
+
+    def test_requires_a_secret_key(self):
+        client, _ = make_client(secret_key=None)
+
+        response = client.post("/api/v1/auth/dev-token", json={"user_id": "u1"})
+
+        assert response.status_code == 503
+
+    def test_only_mounted_when_enabled(self):
+        def paths(config: AppConfig) -> set[str]:
+            return set(create_app(config).openapi()["paths"])
+
+        assert "/api/v1/auth/dev-token" not in paths(AppConfig())
+        assert "/api/v1/auth/dev-token" in paths(AppConfig(auth_dev_tokens=True))
@@ -0,0 +1,173 @@
+import asyncio
+
+import pytest
+
+from app.bootstrap.config import parse_weights
+from app.infrastructure.admission import AdmissionController, AdmissionRejectedError
+
+
+def make_controller(**kwargs):
+    params = {"max_concurrency": 2, "max_queue": 1, "queue_timeout": 1.0}
+    params.update(kwargs)
+    return AdmissionController(**params)
+
+
+class TestAdmissionController:
+    @pytest.mark.asyncio
+    async def test_admits_up_to_limit_then_queues(self):
+        controller = make_controller()
+        first = await controller.admit()
+        await controller.admit()
+        assert controller.active == 2
+
+        waiter = asyncio.create_task(controller.admit())
+        await asyncio.sleep(0)
+        assert controller.queued == 1
+        assert not waiter.done()
+
+        await first.release()
+        await asyncio.wait_for(waiter, 1)
+        assert controller.active == 2
+        assert controller.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_sheds_when_queue_is_full(self):
+        controller = make_controller(max_concurrency=1, shed_status_code=429)
+        await controller.admit()
+        waiter = asyncio.create_task(controller.admit())
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejectedError) as exc:
+            await controller.admit()
+
+        assert exc.value.status_code == 429
+        assert exc.value.retry_after >= 1
+        waiter.cancel()
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout(self):
+        controller = make_controller(max_concurrency=1, queue_timeout=0.01)
+        await controller.admit()
+
+        with pytest.raises(AdmissionRejectedError):
+            await controller.admit()
+        assert controller.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        controller = make_controller(max_concurrency=1)
+        ticket = await controller.admit()
+        waiter = asyncio.create_task(controller.admit())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert controller.queued == 0
+
+        await ticket.release()
+        assert controller.active == 0
+
+    @pytest.mark.asyncio
+    async def test_release_is_idempotent(self):
+        controller = make_controller()
+        ticket = await controller.admit()
+        await ticket.release()
+        await ticket.release()
+        assert controller.active == 0
+
+    def test_limit_adapts_to_lag_and_saturation(self):
+        controller = make_controller(max_concurrency=10, min_concurrency=2)
+
+        controller._adjust(lag=1.0, saturation=0.0)
+        assert controller.limit == 8
+        controller._adjust(lag=0.0, saturation=0.95)
+        assert controller.limit == 6
+        for _ in range(10):
+            controller._adjust(lag=1.0, saturation=0.0)
+        assert controller.limit == 2
+
+        controller._active = 2
+        controller._adjust(lag=0.0, saturation=0.0)
+        assert controller.limit == 3
+
+
+async def admission_order(controller, tenants):
+    """Queue one run per entry of *tenants* and return the order they start."""
+    blocker = await controller.admit()
+    started = []
+
+    async def run(tenant):
+        ticket = await controller.admit(tenant)
+        started.append(tenant)
+        await ticket.release()
+
+    tasks = []
+    for tenant in tenants:
+        tasks.append(asyncio.create_task(run(tenant)))
+        await asyncio.sleep(0)
+
+    await blocker.release()
+    await asyncio.wait_for(asyncio.gather(*tasks), 1)
+    return started
+
+
+class TestFairQueueing:
+    @pytest.mark.asyncio
+    async def test_flooding_tenant_does_not_starve_others(self):
+        controller = make_controller(max_concurrency=1, max_queue=100)
+
+        order = await admission_order(controller, ["batch"] * 10 + ["alice"])
+
+        assert order.index("alice") <= 1
+
+    @pytest.mark.asyncio
+    async def test_slots_follow_weights(self):
+        controller = make_controller(
+            max_concurrency=1, max_queue=100, tenant_weights={"a": 2, "b": 1}
+        )
+
+        order = await admission_order(controller, ["a"] * 6 + ["b"] * 3)
+
+        assert order == ["a", "a", "b", "a", "a", "b", "a", "a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_fractional_weights_accumulate(self):
+        controller = make_controller(
+            max_concurrency=1, max_queue=100, tenant_weights={"slow": 0.5}
+        )
+
+        order = await admission_order(controller, ["slow"] * 2 + ["fast"] * 4)
+
+        assert order == ["fast", "slow", "fast", "fast", "slow", "fast"]
+
+    @pytest.mark.asyncio
+    async def test_sheds_tenant_over_its_queue_share(self):
+        controller = make_controller(
+            max_concurrency=1, max_queue=10, max_queue_per_tenant=1
+        )
+        await controller.admit()
+        waiter = asyncio.create_task(controller.admit("batch"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejectedError):
+            await controller.admit("batch")
+        other = asyncio.create_task(controller.admit("alice"))
+        await asyncio.sleep(0)
+        assert controller.queued == 2
+
+        for task in (waiter, other):
+            task.cancel()
+        await asyncio.gather(waiter, other, return_exceptions=True)
+        assert controller.queued == 0
+
+    @pytest.mark.parametrize("weight", [0, -1, float("inf"), float("nan")])
+    def test_rejects_weights_that_never_admit(self, weight):
+        with pytest.raises(ValueError):
+            make_controller(tenant_weights={"batch": weight})
+
+    @pytest.mark.parametrize("value", ["batch=0", "batch=-2", "batch=inf", "a=1,b=nan"])
+    def test_config_rejects_non_positive_weights(self, value):
+        with pytest.raises(ValueError):
+            parse_weights(value)
+
+        assert parse_weights("alice=4, batch=0.25") == {"alice": 4.0, "batch": 0.25}
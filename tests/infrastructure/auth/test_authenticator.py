@@ -0,0 +1,100 @@
+import asyncio
+import base64
+import json
+import time
+
+import pytest
+
+from app.infrastructure.auth import (
+    AuthenticationError,
+    Authenticator,
+    InvalidTokenError,
+    decode_token,
+    encode_token,
+    issue_token,
+)
+from app.models import User
+
+SECRET = "test-secret"
+
+
+class TestTokens:
+    def test_round_trip(self):
+        token = encode_token({"sub": "u1", "exp": time.time() + 60}, SECRET)
+        assert decode_token(token, SECRET)["sub"] == "u1"
+
+    def test_issued_tokens_expire(self):
+        token = issue_token("u1", SECRET, ttl=60, now=1000)
+
+        assert decode_token(token, SECRET, now=1059) == {
+            "sub": "u1",
+            "iat": 1000,
+            "exp": 1060,
+        }
+        with pytest.raises(InvalidTokenError):
+            decode_token(token, SECRET, now=1061)
+
+    def test_rejects_wrong_secret(self):
+        token = encode_token({"sub": "u1"}, SECRET)
+        with pytest.raises(InvalidTokenError):
+            decode_token(token, "other-secret")
+
+    def test_rejects_unsigned_tokens(self):
+        header = base64.urlsafe_b64encode(b'{"alg":"none"}').decode().rstrip("=")
+        payload = base64.urlsafe_b64encode(b'{"sub":"u1"}').decode().rstrip("=")
+        with pytest.raises(InvalidTokenError):
+            decode_token(f"{header}.{payload}.", SECRET)
+
+        legacy = base64.b64encode(json.dumps({"user_id": "u1"}).encode()).decode()
+        with pytest.raises(InvalidTokenError):
+            decode_token(legacy, SECRET)
+
+    def test_expiry_honours_leeway(self):
+        token = encode_token({"sub": "u1", "exp": 1000}, SECRET)
+        assert decode_token(token, SECRET, leeway=30, now=1020)
+        with pytest.raises(InvalidTokenError):
+            decode_token(token, SECRET, leeway=30, now=1031)
+
+
+class TestAuthenticator:
+    @pytest.mark.asyncio
+    async def test_verified_tokens_are_cached(self):
+        lookups = []
+
+        async def load_user(user_id: str) -> User:
+            lookups.append(user_id)
+            await asyncio.sleep(0)
+            return User(id=user_id)
+
+        authenticator = Authenticator(SECRET, load_user)
+        token = encode_token({"sub": "u1", "exp": time.time() + 60}, SECRET)
+
+        users = await asyncio.gather(
+            *(authenticator.authenticate(token) for _ in range(20))
+        )
+        await authenticator.authenticate(token)
+
+        assert {user.id for user in users} == {"u1"}
+        assert lookups == ["u1"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_users_and_forged_tokens(self):
+        async def load_user(user_id: str) -> User | None:
+            return None
+
+        authenticator = Authenticator(SECRET, load_user)
+        with pytest.raises(AuthenticationError):
+            await authenticator.authenticate(encode_token({"sub": "u1"}, SECRET))
+        with pytest.raises(AuthenticationError):
+            await authenticator.authenticate(encode_token({"sub": "u1"}, "forged"))
+
+    @pytest.mark.asyncio
+    async def test_expired_tokens_are_not_cached(self):
+        async def load_user(user_id: str) -> User:
+            return User(id=user_id)
+
+        authenticator = Authenticator(SECRET, load_user, leeway=0)
+        token = encode_token({"sub": "u1", "exp": time.time() - 1}, SECRET)
+
+        with pytest.raises(AuthenticationError):
+            await authenticator.authenticate(token)
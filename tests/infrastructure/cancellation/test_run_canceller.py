@@ -0,0 +1,82 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.infrastructure.cancellation import InMemoryRunCanceller, PostgresRunCanceller
+from app.infrastructure.cancellation.postgres import CHANNEL
+from app.infrastructure.database.notifications import NotificationListener
+from app.infrastructure.locks import RunLease
+from app.infrastructure.streams import InMemoryRunEventBroker
+
+
+async def running_lease(thread_id: str) -> tuple[RunLease, asyncio.Task[None]]:
+    lease = RunLease(thread_id)
+    task = asyncio.create_task(asyncio.sleep(10))
+    lease.attach(task)
+    return lease, task
+
+
+class TestInMemoryRunCanceller:
+    @pytest.mark.asyncio
+    async def test_cancels_tracked_runs_of_the_thread(self):
+        canceller = InMemoryRunCanceller()
+        lease, task = await running_lease("t1")
+        canceller.track("r1", lease)
+
+        assert not await canceller.cancel("t2", "r1")
+        assert await canceller.cancel("t1", "r1")
+
+        await asyncio.gather(task, return_exceptions=True)
+        assert task.cancelled()
+        assert lease.interrupt_reason == "Run cancelled"
+
+    @pytest.mark.asyncio
+    async def test_untracked_runs_are_not_running(self):
+        canceller = InMemoryRunCanceller()
+        lease, task = await running_lease("t1")
+        canceller.track("r1", lease)
+        canceller.untrack("r1")
+
+        assert not await canceller.cancel("t1", "r1")
+        task.cancel()
+
+
+class TestPostgresRunCanceller:
+    @pytest.mark.asyncio
+    async def test_cancels_runs_notified_by_other_workers(self):
+        listener = NotificationListener(MagicMock())
+        canceller = PostgresRunCanceller(
+            MagicMock(), listener, InMemoryRunEventBroker()
+        )
+        lease, task = await running_lease("t1")
+        canceller.track("r1", lease)
+
+        listener._dispatch(CHANNEL, "t2:r1")
+        assert not lease.interrupted
+
+        listener._dispatch(CHANNEL, "t1:r1")
+        await asyncio.gather(task, return_exceptions=True)
+        assert task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_notifies_only_for_runs_still_running(self):
+        conn = MagicMock(execute=AsyncMock())
+        database_connection = MagicMock()
+        database_connection.connection.return_value.__aenter__.return_value = conn
+        broker = InMemoryRunEventBroker()
+        canceller = PostgresRunCanceller(
+            database_connection, NotificationListener(MagicMock()), broker
+        )
+        await broker.open("t1", "r1")
+
+        assert not await canceller.cancel("t1", "unknown")
+        assert not await canceller.cancel("t2", "r1")
+        conn.execute.assert_not_called()
+
+        assert await canceller.cancel("t1", "r1")
+        conn.execute.assert_awaited_once()
+
+        await broker.finish("r1")
+        assert not await canceller.cancel("t1", "r1")
+        conn.execute.assert_awaited_once()
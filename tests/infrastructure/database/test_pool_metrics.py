@@ -0,0 +1,93 @@
+import os
+from typing import Any
+
+import pytest
+from prometheus_client import CollectorRegistry, generate_latest
+
+from app.bootstrap.config import AppConfig
+from app.infrastructure.database import PostgreSQLConnection
+from app.infrastructure.database.metrics import PoolStatsCollector
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+class StaticStats(PostgreSQLConnection):
+    def __init__(self, stats: dict[str, int]):
+        super().__init__(AppConfig(), name="static")
+        self.stats = stats
+
+    def get_pool_stats(self) -> dict[str, int]:
+        return self.stats
+
+
+def scrape(collector: PoolStatsCollector) -> dict[str, Any]:
+    registry = CollectorRegistry()
+    registry.register(collector)
+    samples = {}
+    for family in registry.collect():
+        for sample in family.samples:
+            samples[sample.name] = sample.value
+    return samples
+
+
+class TestPoolStatsCollector:
+    def test_exports_pool_stats(self):
+        connection = StaticStats(
+            {
+                "pool_max": 20,
+                "pool_size": 8,
+                "pool_available": 3,
+                "requests_waiting": 2,
+                "requests_num": 100,
+                "requests_queued": 7,
+                "requests_wait_ms": 1500,
+                "requests_errors": 1,
+                "connections_lost": 1,
+                "returns_bad": 1,
+            }
+        )
+        collector = PoolStatsCollector()
+        collector.track("main", connection)
+
+        samples = scrape(collector)
+
+        assert samples["db_pool_connections"] == 8
+        assert samples["db_pool_connections_in_use"] == 5
+        assert samples["db_pool_connections_idle"] == 3
+        assert samples["db_pool_requests_waiting"] == 2
+        assert samples["db_pool_requests_total"] == 100
+        assert samples["db_pool_wait_seconds_total"] == 1.5
+        assert samples["db_pool_connections_lost_total"] == 2
+
+    def test_skips_closed_pools(self):
+        collector = PoolStatsCollector()
+        connection = StaticStats({})
+        collector.track("main", connection)
+
+        registry = CollectorRegistry()
+        registry.register(collector)
+        assert b'pool="main"' not in generate_latest(registry)
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+class TestPostgreSQLConnection:
+    @pytest.mark.asyncio
+    async def test_connection_is_returned_after_errors(self):
+        connection = PostgreSQLConnection(
+            AppConfig(database_url=TEST_DATABASE_URL, database_pool_max_size=1)
+        )
+        try:
+            with pytest.raises(RuntimeError):
+                async with connection.connection() as conn:
+                    await conn.execute("SELECT 1")
+                    raise RuntimeError("boom")
+
+            async with connection.connection(timeout=1) as conn:
+                cursor = await conn.execute("SELECT 1 AS one")
+                assert (await cursor.fetchone())["one"] == 1
+
+            stats = connection.get_pool_stats()
+            assert stats["pool_size"] - stats["pool_available"] == 0
+        finally:
+            await connection.close()
@@ -0,0 +1,75 @@
+import asyncio
+import os
+from uuid import uuid4
+
+import pytest
+
+from app.bootstrap.config import AppConfig
+from app.infrastructure.database import PostgreSQLConnection
+from app.infrastructure.idempotency import (
+    IdempotencyRecord,
+    InMemoryIdempotencyStore,
+    PostgresIdempotencyStore,
+    fingerprint,
+)
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+FIRST = IdempotencyRecord("thread-1", "run-1", "a")
+SECOND = IdempotencyRecord("thread-2", "run-2", "a")
+
+
+class TestFingerprint:
+    def test_ignores_key_order(self):
+        assert fingerprint({"a": 1, "b": 2}) == fingerprint({"b": 2, "a": 1})
+        assert fingerprint("hi", None) != fingerprint("hi", "thread")
+
+
+class TestInMemoryIdempotencyStore:
+    @pytest.mark.asyncio
+    async def test_first_claim_wins(self):
+        store = InMemoryIdempotencyStore(ttl=60)
+
+        assert await store.claim("alice", "k", FIRST) == FIRST
+        assert await store.claim("alice", "k", SECOND) == FIRST
+        assert await store.claim("bob", "k", SECOND) == SECOND
+
+    @pytest.mark.asyncio
+    async def test_release_only_forgets_the_owning_run(self):
+        store = InMemoryIdempotencyStore(ttl=60)
+        await store.claim("alice", "k", FIRST)
+
+        await store.release("alice", "k", SECOND.run_id)
+        assert await store.claim("alice", "k", SECOND) == FIRST
+
+        await store.release("alice", "k", FIRST.run_id)
+        assert await store.claim("alice", "k", SECOND) == SECOND
+
+    @pytest.mark.asyncio
+    async def test_keys_expire(self):
+        store = InMemoryIdempotencyStore(ttl=0.01)
+        await store.claim("alice", "k", FIRST)
+        await asyncio.sleep(0.02)
+
+        assert await store.claim("alice", "k", SECOND) == SECOND
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+class TestPostgresIdempotencyStore:
+    @pytest.mark.asyncio
+    async def test_first_claim_wins_until_released(self):
+        connection = PostgreSQLConnection(AppConfig(database_url=TEST_DATABASE_URL))
+        store = PostgresIdempotencyStore(connection, ttl=60)
+        try:
+            await store.start()
+            scope = uuid4().hex
+
+            assert await store.claim(scope, "k", FIRST) == FIRST
+            assert await store.claim(scope, "k", SECOND) == FIRST
+
+            await store.release(scope, "k", FIRST.run_id)
+            assert await store.claim(scope, "k", SECOND) == SECOND
+        finally:
+            await store.cleanup()
+            await connection.close()
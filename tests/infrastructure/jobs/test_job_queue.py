@@ -0,0 +1,149 @@
+import asyncio
+import os
+from uuid import uuid4
+
+import pytest
+
+from app.bootstrap.config import AppConfig
+from app.infrastructure.database import PostgreSQLConnection
+from app.infrastructure.jobs import (
+    InMemoryJobQueue,
+    PostgresJobQueue,
+    UnknownQueueError,
+)
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+class Handler:
+    """Records payloads and fails the first *failures* calls."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.payloads: list[dict] = []
+        self.done = asyncio.Event()
+
+    async def __call__(self, payload: dict) -> None:
+        self.payloads.append(payload)
+        if len(self.payloads) <= self.failures:
+            raise RuntimeError(f"attempt {len(self.payloads)} failed")
+        self.done.set()
+
+
+class TestInMemoryJobQueue:
+    @pytest.mark.asyncio
+    async def test_workers_run_enqueued_jobs(self):
+        queue = InMemoryJobQueue(workers=2, poll_interval=10)
+        handler = Handler()
+        queue.register("feedback", handler)
+        await queue.start()
+        try:
+            await queue.enqueue("feedback", {"score": 1})
+            await asyncio.wait_for(handler.done.wait(), 1)
+        finally:
+            await queue.cleanup()
+
+        assert handler.payloads == [{"score": 1}]
+        assert queue.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_jobs_are_retried(self):
+        queue = InMemoryJobQueue(retry_backoff=0)
+        handler = Handler(failures=2)
+        queue.register("feedback", handler)
+        await queue.enqueue("feedback", {"score": 1})
+
+        while await queue.run_once():
+            pass
+
+        assert len(handler.payloads) == 3
+        assert queue.pending == 0
+        assert queue.dead == []
+
+    @pytest.mark.asyncio
+    async def test_jobs_are_dead_lettered_after_max_attempts(self):
+        queue = InMemoryJobQueue(max_attempts=3, retry_backoff=0)
+        handler = Handler(failures=10)
+        queue.register("feedback", handler)
+        await queue.enqueue("feedback", {"score": 1})
+
+        while await queue.run_once():
+            pass
+
+        assert len(handler.payloads) == 3
+        assert [dead.job.attempts for dead in queue.dead] == [3]
+        assert queue.dead[0].error == "RuntimeError: attempt 3 failed"
+        assert queue.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_retries_wait_for_the_backoff(self):
+        queue = InMemoryJobQueue(retry_backoff=60)
+        queue.register("feedback", Handler(failures=1))
+        await queue.enqueue("feedback", {})
+
+        assert await queue.run_once()
+        assert not await queue.run_once()
+        assert queue.pending == 1
+
+    def test_backoff_doubles_up_to_the_cap(self):
+        queue = InMemoryJobQueue(retry_backoff=1, max_backoff=5)
+
+        assert [queue.backoff(n) for n in range(1, 5)] == [1, 2, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_unknown_queues_are_refused(self):
+        with pytest.raises(UnknownQueueError):
+            await InMemoryJobQueue().enqueue("missing", {})
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+class TestPostgresJobQueue:
+    @pytest.mark.asyncio
+    async def test_each_job_is_claimed_once(self):
+        connection = PostgreSQLConnection(AppConfig(database_url=TEST_DATABASE_URL))
+        name = uuid4().hex
+        first, second = PostgresJobQueue(connection), PostgresJobQueue(connection)
+        handler = Handler()
+        for queue in (first, second):
+            queue.register(name, handler)
+        try:
+            await first.start()
+            await first.enqueue(name, {"n": 1})
+
+            claimed = await asyncio.gather(first.run_once(), second.run_once())
+
+            assert sorted(claimed) == [False, True]
+            assert handler.payloads == [{"n": 1}]
+            assert await first.sample_depth() == {name: 0}
+        finally:
+            await first.cleanup()
+            await connection.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_jobs_are_dead_lettered(self):
+        connection = PostgreSQLConnection(AppConfig(database_url=TEST_DATABASE_URL))
+        name = uuid4().hex
+        queue = PostgresJobQueue(connection, max_attempts=2, retry_backoff=0)
+        handler = Handler(failures=10)
+        queue.register(name, handler)
+        try:
+            await queue.start()
+            await queue.enqueue(name, {"n": 1})
+
+            while await queue.run_once():
+                pass
+
+            assert len(handler.payloads) == 2
+            async with connection.connection() as conn:
+                cursor = await conn.execute(
+                    "SELECT attempts, last_error FROM dead_jobs WHERE queue = %s",
+                    (name,),
+                )
+                rows = await cursor.fetchall()
+            assert rows == [
+                {"attempts": 2, "last_error": "RuntimeError: attempt 2 failed"}
+            ]
+        finally:
+            await queue.cleanup()
+            await connection.close()
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.locks import InMemoryRunLock, RunConflictError, RunLockPolicy
+
+
+@pytest.fixture
+def run_lock():
+    return InMemoryRunLock()
+
+
+class TestInMemoryRunLock:
+    @pytest.mark.asyncio
+    async def test_reject_when_busy(self, run_lock):
+        lease = await run_lock.acquire("t1", RunLockPolicy.reject)
+
+        with pytest.raises(RunConflictError):
+            await run_lock.acquire("t1", RunLockPolicy.reject)
+
+        other = await run_lock.acquire("t2", RunLockPolicy.reject)
+        await other.release()
+        await lease.release()
+        assert not run_lock.is_locked("t1")
+
+    @pytest.mark.asyncio
+    async def test_enqueue_waits_for_release(self, run_lock):
+        lease = await run_lock.acquire("t1", RunLockPolicy.reject)
+        waiter = asyncio.create_task(run_lock.acquire("t1", RunLockPolicy.enqueue))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await lease.release()
+        second = await asyncio.wait_for(waiter, 1)
+        assert run_lock.is_locked("t1")
+        await second.release()
+        assert not run_lock.is_locked("t1")
+
+    @pytest.mark.asyncio
+    async def test_enqueue_timeout(self, run_lock):
+        lease = await run_lock.acquire("t1", RunLockPolicy.reject)
+        with pytest.raises(RunConflictError):
+            await run_lock.acquire("t1", RunLockPolicy.enqueue, timeout=0.01)
+        await lease.release()
+        assert not run_lock.is_locked("t1")
+
+    @pytest.mark.asyncio
+    async def test_interrupt_cancels_active_run(self, run_lock):
+        lease = await run_lock.acquire("t1", RunLockPolicy.reject)
+
+        async def run():
+            try:
+                await asyncio.sleep(10)
+            finally:
+                await lease.release()
+
+        task = asyncio.create_task(run())
+        lease.attach(task)
+        await asyncio.sleep(0)
+
+        second = await asyncio.wait_for(
+            run_lock.acquire("t1", RunLockPolicy.interrupt), 1
+        )
+        assert task.cancelled()
+        assert lease.interrupted
+        await second.release()
+
+    @pytest.mark.asyncio
+    async def test_release_is_idempotent(self, run_lock):
+        lease = await run_lock.acquire("t1", RunLockPolicy.reject)
+        await lease.release()
+        second = await run_lock.acquire("t1", RunLockPolicy.reject)
+        await lease.release()
+        assert run_lock.is_locked("t1")
+        await second.release()
@@ -0,0 +1,58 @@
+import os
+from uuid import uuid4
+
+import pytest
+
+from app.bootstrap.config import AppConfig
+from app.infrastructure.database import PostgreSQLConnection
+from app.infrastructure.locks import PostgresRunLock, RunConflictError, RunLockPolicy
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+class TestPostgresRunLock:
+    @pytest.mark.asyncio
+    async def test_runs_do_not_hold_pool_connections(self):
+        connection = PostgreSQLConnection(
+            AppConfig(database_url=TEST_DATABASE_URL, database_pool_max_size=1)
+        )
+        worker, other = PostgresRunLock(connection), PostgresRunLock(connection)
+        thread_ids = [uuid4().hex for _ in range(3)]
+        try:
+            leases = [
+                await worker.acquire(thread_id, RunLockPolicy.reject)
+                for thread_id in thread_ids
+            ]
+            await connection.get_pool()
+            assert connection.get_pool_saturation() == 0.0
+
+            with pytest.raises(RunConflictError):
+                await other.acquire(thread_ids[0], RunLockPolicy.reject)
+            with pytest.raises(RunConflictError):
+                await other.acquire(thread_ids[1], RunLockPolicy.enqueue, timeout=0.2)
+
+            for lease in leases:
+                await lease.release()
+            lease = await other.acquire(thread_ids[0], RunLockPolicy.enqueue, 1)
+            await lease.release()
+        finally:
+            await worker.cleanup()
+            await other.cleanup()
+            await connection.close()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_releases_the_locks(self):
+        connection = PostgreSQLConnection(AppConfig(database_url=TEST_DATABASE_URL))
+        worker, other = PostgresRunLock(connection), PostgresRunLock(connection)
+        thread_id = uuid4().hex
+        try:
+            await worker.acquire(thread_id, RunLockPolicy.reject)
+            await worker.cleanup()
+
+            lease = await other.acquire(thread_id, RunLockPolicy.reject)
+            await lease.release()
+        finally:
+            await other.cleanup()
+            await connection.close()
@@ -0,0 +1,185 @@
+import os
+import time
+from datetime import UTC, date, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.bootstrap.config import AppConfig
+from app.http.middleware import RateLimitMiddleware
+from app.infrastructure.auth import AuthenticationError
+from app.infrastructure.database import PostgreSQLConnection
+from app.infrastructure.ratelimit import (
+    InMemoryRateLimitStore,
+    PostgresRateLimitStore,
+    RateLimiter,
+    RateLimitPolicy,
+    RouteLimit,
+)
+from app.models import User
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestInMemoryRateLimitStore:
+    @pytest.mark.asyncio
+    async def test_allows_burst_then_refills(self):
+        clock = FakeClock()
+        store = InMemoryRateLimitStore(clock=clock)
+        policy = RateLimitPolicy("user", rate=1, burst=3)
+
+        states = [await store.take("u1", policy) for _ in range(4)]
+
+        assert [s.allowed for s in states] == [True, True, True, False]
+        assert [s.remaining for s in states[:3]] == [2, 1, 0]
+        assert states[3].retry_after == pytest.approx(1)
+
+        clock.now += 1
+        assert (await store.take("u1", policy)).allowed
+        assert (await store.take("u2", policy)).remaining == 2
+
+    @pytest.mark.asyncio
+    async def test_sweeps_full_buckets(self):
+        clock = FakeClock()
+        store = InMemoryRateLimitStore(shards=1, sweep_interval=0, clock=clock)
+        await store.take("u1", RateLimitPolicy("user", rate=1, burst=3))
+
+        clock.now += 10
+        await store.take("u2", RateLimitPolicy("user", rate=1, burst=3))
+
+        assert len(store) == 1
+
+    @pytest.mark.asyncio
+    async def test_sweep_keeps_todays_usage_in_any_time_zone(self, monkeypatch):
+        # 23:00 UTC is already tomorrow on a UTC+14 host.
+        clock = FakeClock()
+        clock.now = datetime(2026, 1, 1, 23, tzinfo=UTC).timestamp()
+        store = InMemoryRateLimitStore(sweep_interval=0, clock=clock)
+        await store.add_usage("u1", date(2026, 1, 1), 100)
+        await store.add_usage("u1", date(2025, 12, 31), 100)
+
+        monkeypatch.setenv("TZ", "Etc/GMT-14")
+        time.tzset()
+        try:
+            await store.take("u1", RateLimitPolicy("user", rate=1, burst=3))
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert await store.get_usage("u1", date(2026, 1, 1)) == 100
+        assert await store.get_usage("u1", date(2025, 12, 31)) == 0
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_route_limits_apply_to_matching_requests(self):
+        runs = RateLimitPolicy("runs", rate=0.01, burst=1)
+        limiter = RateLimiter(
+            InMemoryRateLimitStore(),
+            RateLimitPolicy("user", rate=100, burst=100),
+            [RouteLimit("POST", "/api/v1/runs", runs)],
+        )
+
+        assert all(
+            s.allowed for s in await limiter.check("u", "POST", "/api/v1/runs/stream")
+        )
+        assert all(
+            s.allowed for s in await limiter.check("u", "GET", "/api/v1/threads")
+        )
+        denied = await limiter.check("u", "POST", "/api/v1/runs/stream")
+        assert denied[-1].policy == "runs"
+        assert not denied[-1].allowed
+
+    @pytest.mark.asyncio
+    async def test_daily_token_quota(self):
+        limiter = RateLimiter(
+            InMemoryRateLimitStore(),
+            None,
+            daily_tokens=100,
+            quota_routes=[("POST", "/api/v1/runs")],
+        )
+
+        await limiter.record_usage("u", 60)
+        (state,) = await limiter.check("u", "POST", "/api/v1/runs/stream")
+        assert state.allowed and state.remaining == 40
+
+        await limiter.record_usage("u", 60)
+        (state,) = await limiter.check("u", "POST", "/api/v1/runs/stream")
+        assert not state.allowed
+        assert state.retry_after > 0
+        assert await limiter.check("u", "GET", "/api/v1/threads") == []
+
+
+class StaticAuthenticator:
+    async def authenticate(self, token: str) -> User:
+        if token != "good":
+            raise AuthenticationError("bad token")
+        return User(id="u1")
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.state.container = SimpleNamespace(
+        ready=True,
+        authenticator=StaticAuthenticator(),
+        rate_limiter=RateLimiter(
+            InMemoryRateLimitStore(), RateLimitPolicy("user", rate=0.01, burst=2)
+        ),
+    )
+    app.add_middleware(RateLimitMiddleware)
+
+    @app.get("/api/v1/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return TestClient(app)
+
+
+class TestRateLimitMiddleware:
+    def test_sets_headers_and_rejects_over_limit(self):
+        client = make_client()
+        auth = {"Authorization": "Bearer good"}
+
+        first = client.get("/api/v1/ping", headers=auth)
+        assert first.status_code == 200
+        assert first.headers["RateLimit-Limit"] == "2"
+        assert first.headers["RateLimit-Remaining"] == "1"
+
+        client.get("/api/v1/ping", headers=auth)
+        limited = client.get("/api/v1/ping", headers=auth)
+        assert limited.status_code == 429
+        assert int(limited.headers["Retry-After"]) >= 1
+
+        # Other principals have their own buckets.
+        assert client.get("/api/v1/ping").status_code == 200
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+class TestPostgresRateLimitStore:
+    @pytest.mark.asyncio
+    async def test_allows_burst_then_denies(self):
+        connection = PostgreSQLConnection(AppConfig(database_url=TEST_DATABASE_URL))
+        store = PostgresRateLimitStore(connection)
+        try:
+            await store.start()
+            policy = RateLimitPolicy("user", rate=0.01, burst=2)
+            key = uuid4().hex
+
+            states = [await store.take(key, policy) for _ in range(3)]
+
+            assert [s.allowed for s in states] == [True, True, False]
+            assert states[2].retry_after > 0
+        finally:
+            await connection.close()
@@ -0,0 +1,122 @@
+import asyncio
+import os
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from app.bootstrap.config import AppConfig
+from app.infrastructure.database import NotificationListener, PostgreSQLConnection
+from app.infrastructure.streams import (
+    InMemoryRunEventBroker,
+    PostgresRunEventBroker,
+    UnknownRunError,
+)
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest_asyncio.fixture(
+    params=[
+        "memory",
+        pytest.param(
+            "postgres",
+            marks=[
+                pytest.mark.integration,
+                pytest.mark.skipif(
+                    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"
+                ),
+            ],
+        ),
+    ]
+)
+async def broker(request):
+    if request.param == "memory":
+        broker = InMemoryRunEventBroker()
+        yield broker
+        await broker.cleanup()
+        return
+
+    connection = PostgreSQLConnection(AppConfig(database_url=TEST_DATABASE_URL))
+    listener = NotificationListener(connection)
+    broker = PostgresRunEventBroker(connection, listener, flush_interval=0.01)
+    await broker.start()
+    await listener.start()
+    yield broker
+    await broker.cleanup()
+    await listener.stop()
+    await connection.close()
+
+
+def event(n):
+    return {"event": "token", "data": str(n)}
+
+
+async def collect(broker, thread_id, run_id, after=0):
+    return [
+        (seq, e["data"]) async for seq, e in broker.subscribe(thread_id, run_id, after)
+    ]
+
+
+class TestRunEventBroker:
+    @pytest.mark.asyncio
+    async def test_replays_finished_run(self, broker):
+        run_id = str(uuid4())
+        await broker.open("thread", run_id)
+        assert [await broker.publish(run_id, event(n)) for n in range(3)] == [1, 2, 3]
+        await broker.finish(run_id)
+
+        assert await collect(broker, "thread", run_id) == [(1, "0"), (2, "1"), (3, "2")]
+        assert await collect(broker, "thread", run_id, after=2) == [(3, "2")]
+
+    @pytest.mark.asyncio
+    async def test_follows_live_run(self, broker):
+        run_id = str(uuid4())
+        await broker.open("thread", run_id)
+        await broker.publish(run_id, event(0))
+
+        subscriber = asyncio.create_task(collect(broker, "thread", run_id))
+        await asyncio.sleep(0.05)
+        await broker.publish(run_id, event(1))
+        await asyncio.sleep(0.05)
+        assert not subscriber.done()
+
+        await broker.finish(run_id)
+        assert await asyncio.wait_for(subscriber, 5) == [(1, "0"), (2, "1")]
+
+    @pytest.mark.asyncio
+    async def test_run_is_scoped_to_its_thread(self, broker):
+        run_id = str(uuid4())
+        await broker.open("thread", run_id)
+
+        assert await broker.exists("thread", run_id)
+        assert not await broker.exists("other", run_id)
+        with pytest.raises(UnknownRunError):
+            await collect(broker, "other", run_id)
+        with pytest.raises(UnknownRunError):
+            await collect(broker, "thread", str(uuid4()))
+
+    @pytest.mark.asyncio
+    async def test_is_running_until_finished(self, broker):
+        run_id = str(uuid4())
+        await broker.open("thread", run_id)
+
+        assert await broker.is_running("thread", run_id)
+        assert not await broker.is_running("other", run_id)
+        assert not await broker.is_running("thread", str(uuid4()))
+
+        await broker.finish(run_id)
+        assert not await broker.is_running("thread", run_id)
+        assert await broker.exists("thread", run_id)
+
+
+class TestInMemoryRunEventBroker:
+    @pytest.mark.asyncio
+    async def test_prunes_finished_runs_after_retention(self):
+        broker = InMemoryRunEventBroker(retention=0)
+        await broker.open("thread", "old")
+        await broker.finish("old")
+        await broker.open("thread", "new")
+
+        assert not await broker.exists("thread", "old")
+        assert await broker.exists("thread", "new")
@@ -0,0 +1,101 @@
+import os
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from app.bootstrap.config import AppConfig
+from app.infrastructure.database import PostgreSQLConnection
+from app.repositories.search import (
+    IndexedMessage,
+    InMemoryMessageSearchIndex,
+    PostgresMessageSearchIndex,
+)
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest_asyncio.fixture(
+    params=[
+        "memory",
+        pytest.param(
+            "postgres",
+            marks=[
+                pytest.mark.integration,
+                pytest.mark.skipif(
+                    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"
+                ),
+            ],
+        ),
+    ]
+)
+async def index(request):
+    if request.param == "memory":
+        yield InMemoryMessageSearchIndex()
+        return
+
+    connection = PostgreSQLConnection(AppConfig(database_url=TEST_DATABASE_URL))
+    index = PostgresMessageSearchIndex(connection, flush_interval=3600)
+    await index.start()
+    yield index
+    await index.cleanup()
+    await connection.close()
+
+
+async def add(index, user_id: str, thread_id: str, *contents: str) -> None:
+    start = datetime.now(UTC)
+    for i, content in enumerate(contents):
+        index.add(
+            IndexedMessage(
+                thread_id=thread_id,
+                message_id=str(uuid4()),
+                user_id=user_id,
+                role="human" if i % 2 == 0 else "ai",
+                content=content,
+                created_at=start + timedelta(seconds=i),
+            )
+        )
+    if isinstance(index, PostgresMessageSearchIndex):
+        await index.flush()
+
+
+class TestMessageSearchIndex:
+    @pytest.mark.asyncio
+    async def test_finds_threads_of_the_user(self, index):
+        user, other = uuid4().hex, uuid4().hex
+        weather, recipes = str(uuid4()), str(uuid4())
+        await add(index, user, weather, "Weather in Kyiv?", "Kyiv is sunny today.")
+        await add(index, user, recipes, "How do I bake bread?", "Use strong flour.")
+        await add(index, other, str(uuid4()), "Kyiv is rainy.")
+
+        page = await index.search(user, "kyiv")
+
+        assert [hit.thread_id for hit in page.hits] == [weather]
+        assert "Kyiv" in page.hits[0].snippet
+        assert page.next_skip is None
+
+    @pytest.mark.asyncio
+    async def test_pages_ranked_hits(self, index):
+        user = uuid4().hex
+        for _ in range(5):
+            await add(index, user, str(uuid4()), "deploy the service")
+
+        first = await index.search(user, "deploy", limit=3)
+        second = await index.search(user, "deploy", limit=3, skip=first.next_skip)
+
+        assert len(first.hits) == 3
+        assert len(second.hits) == 2
+        assert second.next_skip is None
+        assert not {h.thread_id for h in first.hits} & {
+            h.thread_id for h in second.hits
+        }
+
+    @pytest.mark.asyncio
+    async def test_deleted_threads_are_not_found(self, index):
+        user, thread_id = uuid4().hex, str(uuid4())
+        await add(index, user, thread_id, "invoice for march")
+
+        await index.delete_thread(thread_id)
+
+        assert (await index.search(user, "invoice")).hits == []
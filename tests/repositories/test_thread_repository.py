@@ -0,0 +1,152 @@
+import os
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from app.bootstrap.config import AppConfig
+from app.infrastructure.database import PostgreSQLConnection
+from app.models import Thread, User
+from app.models.thread import ThreadStatus
+from app.repositories.threads import (
+    InMemoryThreadRepository,
+    InvalidCursorError,
+    PostgresThreadRepository,
+)
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest_asyncio.fixture(
+    params=[
+        "memory",
+        pytest.param(
+            "postgres",
+            marks=[
+                pytest.mark.integration,
+                pytest.mark.skipif(
+                    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"
+                ),
+            ],
+        ),
+    ]
+)
+async def repository(request):
+    if request.param == "memory":
+        yield InMemoryThreadRepository()
+        return
+
+    connection = PostgreSQLConnection(AppConfig(database_url=TEST_DATABASE_URL))
+    repository = PostgresThreadRepository(connection, flush_interval=3600)
+    await repository.start()
+    yield repository
+    await repository.cleanup()
+    await connection.close()
+
+
+def make_user() -> User:
+    return User(id=uuid4().hex, email="user@example.com")
+
+
+async def create_threads(repository, user: User, count: int) -> list[Thread]:
+    start = datetime.now(UTC)
+    return [
+        await repository.create(
+            Thread(
+                id=str(uuid4()),
+                user_id=user.id,
+                metadata={"n": i},
+                updated_at=start + timedelta(seconds=i),
+            )
+        )
+        for i in range(count)
+    ]
+
+
+class TestThreadRepository:
+    @pytest.mark.asyncio
+    async def test_create_is_idempotent(self, repository):
+        user = make_user()
+        thread = Thread(id=str(uuid4()), user_id=user.id, metadata={"title": "a"})
+
+        await repository.create(thread)
+        stored = await repository.create(thread.model_copy(update={"metadata": {}}))
+
+        assert stored.metadata == {"title": "a"}
+        assert (await repository.get(thread.id)).user_id == user.id
+
+    @pytest.mark.asyncio
+    async def test_lists_pages_newest_first(self, repository):
+        user = make_user()
+        threads = await create_threads(repository, user, 5)
+        await create_threads(repository, make_user(), 2)
+
+        first = await repository.list(user.id, limit=2)
+        second = await repository.list(user.id, limit=2, cursor=first.next_cursor)
+        last = await repository.list(user.id, limit=2, cursor=second.next_cursor)
+
+        listed = [t.id for page in (first, second, last) for t in page.threads]
+        assert listed == [t.id for t in reversed(threads)]
+        assert last.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_rejects_malformed_cursor(self, repository):
+        with pytest.raises(InvalidCursorError):
+            await repository.list(make_user().id, cursor="not-a-cursor")
+
+    @pytest.mark.asyncio
+    async def test_threads_of_other_users_are_hidden(self, repository):
+        owner, other = make_user(), make_user()
+        thread = await repository.get_or_create(str(uuid4()), owner)
+
+        assert await repository.get_for_user(thread.id, owner) is not None
+        assert await repository.get_for_user(thread.id, other) is None
+        assert await repository.get_or_create(thread.id, other) is None
+
+    @pytest.mark.asyncio
+    async def test_latest_status_wins(self, repository):
+        user = make_user()
+        thread = await repository.get_or_create(str(uuid4()), user)
+
+        for status in (ThreadStatus.busy, ThreadStatus.error, ThreadStatus.idle):
+            thread.status = status
+            thread.updated_at = datetime.now(UTC)
+            repository.save_status(thread)
+
+        stored = await repository.get(thread.id)
+        assert stored.status == ThreadStatus.idle
+        assert stored.updated_at == thread.updated_at
+
+    @pytest.mark.asyncio
+    async def test_delete(self, repository):
+        thread = await repository.get_or_create(str(uuid4()), make_user())
+
+        await repository.delete(thread.id)
+
+        assert await repository.get(thread.id) is None
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+class TestPostgresThreadRepository:
+    @pytest.mark.asyncio
+    async def test_statuses_are_written_in_one_flush(self):
+        connection = PostgreSQLConnection(AppConfig(database_url=TEST_DATABASE_URL))
+        repository = PostgresThreadRepository(connection, flush_interval=3600)
+        await repository.start()
+        try:
+            user = make_user()
+            threads = await create_threads(repository, user, 3)
+            for thread in threads:
+                thread.status = ThreadStatus.busy
+                repository.save_status(thread)
+
+            await repository.flush()
+
+            assert repository._pending == {}
+            page = await repository.list(user.id)
+            assert {t.status for t in page.threads} == {ThreadStatus.busy}
+        finally:
+            await repository.cleanup()
+            await connection.close()
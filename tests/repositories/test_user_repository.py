@@ -0,0 +1,86 @@
+import asyncio
+import os
+from uuid import uuid4
+
+import pytest
+
+from app.bootstrap.config import AppConfig
+from app.infrastructure.database import PostgreSQLConnection
+from app.models import User
+from app.repositories.users import (
+    CachedUserRepository,
+    InMemoryUserRepository,
+    PostgresUserRepository,
+)
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+class CountingRepository(InMemoryUserRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups = 0
+
+    async def get(self, user_id: str) -> User | None:
+        self.lookups += 1
+        await asyncio.sleep(0)
+        return await super().get(user_id)
+
+
+class TestCachedUserRepository:
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_are_coalesced_and_cached(self):
+        store = CountingRepository()
+        await store.save(User(id="u1"))
+        users = CachedUserRepository(store)
+
+        found = await asyncio.gather(*(users.get("u1") for _ in range(10)))
+        await users.get("u1")
+
+        assert {user.id for user in found} == {"u1"}
+        assert store.lookups == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_ids_are_cached_negatively(self):
+        store = CountingRepository()
+        users = CachedUserRepository(store, negative_ttl=60)
+
+        assert await users.get("missing") is None
+        assert await users.get("missing") is None
+        assert store.lookups == 1
+
+    @pytest.mark.asyncio
+    async def test_save_invalidates(self):
+        store = CountingRepository()
+        users = CachedUserRepository(store, negative_ttl=60)
+        assert await users.get("u1") is None
+
+        await users.save(User(id="u1", email="u1@example.com"))
+
+        assert (await users.get("u1")).email == "u1@example.com"
+
+    @pytest.mark.asyncio
+    async def test_provisioning_store_creates_users(self):
+        users = InMemoryUserRepository(provision=True)
+        assert (await users.get("u1")).id == "u1"
+        assert await InMemoryUserRepository().get("u1") is None
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+class TestPostgresUserRepository:
+    @pytest.mark.asyncio
+    async def test_save_and_get(self):
+        connection = PostgreSQLConnection(AppConfig(database_url=TEST_DATABASE_URL))
+        users = PostgresUserRepository(connection)
+        try:
+            await users.start()
+            user = User(id=uuid4().hex, email="a@example.com")
+
+            assert await users.get(user.id) is None
+            await users.save(user)
+            await users.save(user.model_copy(update={"email": "b@example.com"}))
+
+            assert await users.get(user.id) == User(id=user.id, email="b@example.com")
+        finally:
+            await connection.close()
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from app.utils import SingleFlight, TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache: TTLCache[str, int] = TTLCache(10, ttl=5, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=1)
+
+        clock.now = 2
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+        clock.now = 5
+        assert cache.get("a") is None
+
+    def test_evicts_least_recently_used(self):
+        cache: TTLCache[str, int] = TTLCache(2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flight: SingleFlight[str, int] = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def load() -> int:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 42
+
+        waiters = [asyncio.create_task(flight.do("k", load)) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == [42] * 10
+        assert calls == 1
+        assert len(flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        flight: SingleFlight[str, int] = SingleFlight()
+        release = asyncio.Event()
+
+        async def load() -> int:
+            await release.wait()
+            return 7
+
+        first = asyncio.create_task(flight.do("k", load))
+        second = asyncio.create_task(flight.do("k", load))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == 7
+        with pytest.raises(asyncio.CancelledError):
+            await first